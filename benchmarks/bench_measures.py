@@ -0,0 +1,103 @@
+"""Benchmark: measure catalog materialization, SPARQL join vs. direct traversal.
+
+Builds synthetic catalogs of N measures (each mapped to 1-3 of 12 dimensions)
+and times the pre-rewrite two-SELECT implementation against
+`ACFGraph._build_measures`, which walks `triples()` directly.
+
+Usage:
+    python benchmarks/bench_measures.py [--sizes 100,1000,5000] [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+from typing import cast
+
+from rdflib import Literal
+from rdflib.namespace import RDF
+from rdflib.query import ResultRow
+
+from acf.graph import ACF, ACFGraph
+
+N_DIMENSIONS = 12
+
+
+def build_graph(n_measures: int) -> ACFGraph:
+    """Return an ACFGraph holding only a synthetic measure catalog."""
+    g = ACFGraph(knowledge_dir=Path("/nonexistent"), use_cache=False)
+    dims = []
+    for d in range(N_DIMENSIONS):
+        node = ACF[f"dimension/d{d}"]
+        g.graph.add((node, RDF.type, ACF.Dimension))
+        g.graph.add((node, ACF.id, Literal(f"dim-{d}")))
+        dims.append(node)
+    for i in range(n_measures):
+        node = ACF[f"measure/M-{i:05d}"]
+        g.graph.add((node, RDF.type, ACF.Measure))
+        g.graph.add((node, ACF.id, Literal(f"M-{i:05d}")))
+        g.graph.add((node, ACF.name, Literal(f"measure {i}")))
+        g.graph.add((node, ACF.unit, Literal("percent")))
+        g.graph.add((node, ACF.description, Literal(f"synthetic measure {i}")))
+        for k in range(1 + i % 3):
+            g.graph.add((node, ACF.mapsTo, dims[(i + k) % N_DIMENSIONS]))
+    return g
+
+
+def sparql_baseline(g: ACFGraph) -> int:
+    """The pre-rewrite implementation: measure SELECT + unfiltered mapping SELECT."""
+    rows = [cast(ResultRow, r) for r in g.graph.query("""
+        SELECT ?id ?name ?unit ?collection ?desc WHERE {
+            ?s a acf:Measure .
+            ?s acf:id ?id .
+            OPTIONAL { ?s acf:name ?name }
+            OPTIONAL { ?s acf:unit ?unit }
+            OPTIONAL { ?s acf:collection ?collection }
+            OPTIONAL { ?s acf:description ?desc }
+            OPTIONAL { ?s acf:mapsTo ?dim . ?dim acf:id ?dimId . }
+        }
+        ORDER BY ?id
+    """)]
+    measures: dict[str, list[str]] = {str(r.id): [] for r in rows}
+    for r in g.graph.query("""
+        SELECT ?measId ?dimId WHERE {
+            ?s a acf:Measure ; acf:id ?measId ; acf:mapsTo ?dim .
+            ?dim acf:id ?dimId .
+        }
+    """):
+        row = cast(ResultRow, r)
+        measures[str(row.measId)].append(str(row.dimId))
+    return len(measures)
+
+
+def traversal(g: ACFGraph) -> int:
+    return len(g._build_measures().by_id)
+
+
+def best_of(fn, g: ACFGraph, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(g)
+        times.append(time.perf_counter() - t0)
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="100,1000,5000")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'measures':>9} {'sparql (s)':>11} {'traversal (s)':>14} {'speedup':>8}")
+    for n in (int(x) for x in args.sizes.split(",")):
+        g = build_graph(n)
+        assert sparql_baseline(g) == traversal(g) == n
+        t_sparql = best_of(sparql_baseline, g, args.repeat)
+        t_walk = best_of(traversal, g, args.repeat)
+        print(f"{n:>9} {t_sparql:>11.4f} {t_walk:>14.4f} {t_sparql / t_walk:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
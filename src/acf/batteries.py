@@ -4,8 +4,16 @@ ACF battery loaders and the BatteryRunner protocol.
 This module provides:
 
   - `load_battery(name)` — load a battery's JSONL items as Python dicts
+    (parsed once per process, re-read when the file changes)
+  - `battery_view(name, field)` / `battery_counts(name, field)` — items and
+    item counts grouped by level, domain, subtype, acf_dimension, ...
+  - `iter_battery(name)` — stream items one line at a time
+  - `get_item(name, id)` / `select_items(name, level=...)` — random access
+    through a byte-offset index of the JSONL
   - `list_batteries()` — discover available batteries in the package
   - `BatteryRunner` — a Protocol for systems-under-test to implement
+  - `AsyncBatteryRunner` — its `async def run_item` counterpart, for
+    systems that wait on remote model servers
 
 It does NOT include the system-under-test scoring procedure. The reference
 scoring procedures are battery-specific and platform-specific:
@@ -30,12 +38,16 @@ their own LLM provider, evaluation harness, or compute environment.
 
 from __future__ import annotations
 
+import hashlib
 import json
-from collections.abc import Iterable
+from collections.abc import Iterator
+from dataclasses import dataclass, field
 from importlib import resources
 from pathlib import Path
 from typing import Protocol, TypedDict, runtime_checkable
 
+from acf.utils.cache import atomic_write_bytes, cache_root
+
 # These are the canonical battery names. The actual JSONL files live at
 # repo-root/batteries/<name>/<name>.jsonl in the source tree, and at the
 # package's `batteries/` subtree once installed.
@@ -108,10 +120,99 @@ def load_battery(name: str) -> list[BatteryItem]:
         the reference graph-structural scorers pass the top-N items in
         this order.
 
+        The parsed battery is cached for the life of the process and
+        re-read only when the JSONL's mtime or size changes. Each call
+        returns a new list, but the item dicts in it are shared between
+        calls — treat them as read-only.
+
     Raises:
         ValueError: if `name` is not a known battery.
         FileNotFoundError: if the JSONL is missing on disk.
     """
+    return list(_parsed(name).items)
+
+
+def battery_view(name: str, field_name: str) -> dict[str, list[BatteryItem]]:
+    """Return the named battery's items grouped by one field, each group in file order.
+
+    `field_name` is one of `INDEX_FIELDS` (``level``, ``domain``,
+    ``subtype``, ``category``, ``acf_dimension``); items without the field
+    are left out. The groupings are computed once per parse of the JSONL.
+    Item dicts are shared with `load_battery` — treat them as read-only.
+
+    Raises:
+        ValueError: if `field_name` is not an indexed field.
+    """
+    if field_name not in INDEX_FIELDS:
+        raise ValueError(f"Cannot group by {field_name!r}; indexed fields: {', '.join(INDEX_FIELDS)}")
+    views = _parsed(name).views.get(field_name, {})
+    return {value: list(items) for value, items in views.items()}
+
+
+def battery_size(name: str) -> int:
+    """Return how many items the named battery has, without parsing its items.
+
+    Served from the byte-offset index (see `battery_index`), which is
+    persisted as a sidecar, so only the first process to ask pays a parse.
+    """
+    return len(battery_index(name))
+
+
+def battery_counts(name: str, field_name: str) -> dict[str, int]:
+    """Return item counts per value of `field_name`, without parsing items.
+
+    Raises:
+        ValueError: if `field_name` is not an indexed field.
+    """
+    if field_name not in INDEX_FIELDS:
+        raise ValueError(f"Cannot count by {field_name!r}; indexed fields: {', '.join(INDEX_FIELDS)}")
+    groups = battery_index(name).fields.get(field_name, {})
+    return {value: len(positions) for value, positions in groups.items()}
+
+
+@dataclass
+class _ParsedBattery:
+    mtime_ns: int
+    size: int
+    items: list[BatteryItem]
+    views: dict[str, dict[str, list[BatteryItem]]]
+
+
+_PARSED: dict[Path, _ParsedBattery] = {}
+
+
+def _parsed(name: str) -> _ParsedBattery:
+    """Return the memoized parse of a battery, re-reading it if the file changed."""
+    path = _battery_path(name)
+    st = path.stat()
+    cached = _PARSED.get(path)
+    if cached is not None and (cached.mtime_ns, cached.size) == (st.st_mtime_ns, st.st_size):
+        return cached
+    items: list[BatteryItem] = []
+    with path.open("r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                items.append(json.loads(line))
+    views: dict[str, dict[str, list[BatteryItem]]] = {}
+    for item in items:
+        for field_name in INDEX_FIELDS:
+            if field_name in item:
+                value = str(item[field_name])  # type: ignore[literal-required]
+                views.setdefault(field_name, {}).setdefault(value, []).append(item)
+    parsed = _ParsedBattery(st.st_mtime_ns, st.st_size, items, views)
+    _PARSED[path] = parsed
+    return parsed
+
+
+def clear_battery_cache() -> None:
+    """Drop every memoized battery parse and index (e.g. between tests)."""
+    _PARSED.clear()
+    _INDEXES.clear()
+
+
+def _battery_path(name: str) -> Path:
+    """Return the JSONL path for a known battery, checking that it exists."""
     if name not in BATTERY_NAMES:
         raise ValueError(
             f"Unknown battery {name!r}. Available: {', '.join(BATTERY_NAMES)}."
@@ -119,13 +220,7 @@ def load_battery(name: str) -> list[BatteryItem]:
     path = _battery_root() / name / f"{name}.jsonl"
     if not path.is_file():
         raise FileNotFoundError(f"Battery JSONL not found: {path}")
-    items: list[BatteryItem] = []
-    with path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                items.append(json.loads(line))
-    return items
+    return path
 
 
 def battery_methodology_path(name: str) -> Path:
@@ -161,6 +256,188 @@ class BatteryRunner(Protocol):
     def run_item(self, item: BatteryItem) -> dict: ...
 
 
-def iter_battery(name: str) -> Iterable[BatteryItem]:
-    """Generator-style alternative to `load_battery` for streaming."""
-    yield from load_battery(name)
+@runtime_checkable
+class AsyncBatteryRunner(Protocol):
+    """Async counterpart of `BatteryRunner` for I/O-bound systems-under-test.
+
+    Same contract and return shape as `BatteryRunner.run_item`, but a
+    coroutine, so many items can wait on a remote model server at once:
+
+        async def run_item(self, item: BatteryItem) -> dict: ...
+
+    `acf.execution.async_engine.AsyncBatteryEngine` drives these with a
+    concurrency limit and an optional request-rate limit. (Being a Protocol,
+    `isinstance` cannot tell the two runner kinds apart; use
+    `inspect.iscoroutinefunction(runner.run_item)`.)
+    """
+
+    async def run_item(self, item: BatteryItem) -> dict: ...
+
+
+def iter_battery(name: str) -> Iterator[BatteryItem]:
+    """Stream the named battery's items in file order, parsing one line at a time.
+
+    Unlike `load_battery`, nothing past the items actually consumed is read
+    or parsed, so ``islice(iter_battery(name), 3)`` touches three lines.
+    Validation errors (unknown name, missing file) are raised on the first
+    ``next()``, not at call time.
+    """
+    with _battery_path(name).open("r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+# ── Random access ────────────────────────────────────────────────
+#
+# The byte-offset index maps every item to its (offset, length) in the JSONL
+# and groups item positions by the fields batteries are sliced on. Building it
+# costs one full parse; it is then kept in memory for the process and as a
+# JSON sidecar under the ACF cache directory (see `acf.utils.cache`), keyed by
+# the JSONL's path and invalidated when its mtime or size changes.
+
+_INDEX_FORMAT = "acf-battery-index-1"
+
+# Item fields `select_items` can slice on. Not every battery has every field:
+# fr36 has level/subtype, cg100 level/domain, zorblaxia category.
+INDEX_FIELDS: tuple[str, ...] = ("level", "domain", "subtype", "category", "acf_dimension")
+
+
+@dataclass
+class BatteryIndex:
+    """Byte offsets and field groupings for one battery JSONL."""
+
+    path: Path
+    mtime_ns: int
+    size: int
+    spans: list[tuple[int, int]]                 # (offset, length) per item, file order
+    ids: list[str]
+    fields: dict[str, dict[str, list[int]]]      # field -> value -> item positions
+    _positions: dict[str, int] = field(default_factory=dict, repr=False)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def position(self, item_id: str) -> int | None:
+        """Return an item's position in file order, or None if absent."""
+        if not self._positions:
+            self._positions = {item_id: i for i, item_id in enumerate(self.ids)}
+        return self._positions.get(item_id)
+
+    def read(self, positions: list[int]) -> Iterator[BatteryItem]:
+        """Seek to and parse only the items at `positions`, in the order given."""
+        with self.path.open("rb") as f:
+            for pos in positions:
+                offset, length = self.spans[pos]
+                f.seek(offset)
+                yield json.loads(f.read(length))
+
+    def to_json(self) -> dict:
+        return {
+            "format": _INDEX_FORMAT,
+            "mtime_ns": self.mtime_ns,
+            "size": self.size,
+            "spans": self.spans,
+            "ids": self.ids,
+            "fields": self.fields,
+        }
+
+
+_INDEXES: dict[Path, BatteryIndex] = {}
+
+
+def _build_index(path: Path, mtime_ns: int, size: int) -> BatteryIndex:
+    spans: list[tuple[int, int]] = []
+    ids: list[str] = []
+    fields: dict[str, dict[str, list[int]]] = {}
+    offset = 0
+    with path.open("rb") as f:
+        for raw in f:
+            stripped = raw.strip()
+            if stripped:
+                item = json.loads(stripped)
+                pos = len(ids)
+                spans.append((offset + raw.index(stripped[:1]), len(stripped)))
+                ids.append(str(item.get("id", f"#{pos}")))
+                for name in INDEX_FIELDS:
+                    if name in item:
+                        fields.setdefault(name, {}).setdefault(str(item[name]), []).append(pos)
+            offset += len(raw)
+    return BatteryIndex(path, mtime_ns, size, spans, ids, fields)
+
+
+def _sidecar_path(path: Path) -> Path | None:
+    root = cache_root()
+    if root is None:
+        return None
+    digest = hashlib.sha256(str(path).encode("utf-8")).hexdigest()[:16]
+    return root / "batteries" / f"{path.stem}-{digest}.idx.json"
+
+
+def battery_index(name: str) -> BatteryIndex:
+    """Return the byte-offset index for the named battery, building it if stale."""
+    path = _battery_path(name).resolve()
+    st = path.stat()
+    cached = _INDEXES.get(path)
+    if cached is not None and (cached.mtime_ns, cached.size) == (st.st_mtime_ns, st.st_size):
+        return cached
+
+    sidecar = _sidecar_path(path)
+    index = None
+    if sidecar is not None:
+        try:
+            data = json.loads(sidecar.read_text(encoding="utf-8"))
+            if (data.get("format"), data.get("mtime_ns"), data.get("size")) == (
+                _INDEX_FORMAT, st.st_mtime_ns, st.st_size,
+            ):
+                index = BatteryIndex(
+                    path, st.st_mtime_ns, st.st_size,
+                    [tuple(span) for span in data["spans"]], data["ids"], data["fields"],
+                )
+        except (OSError, ValueError, KeyError, TypeError):
+            index = None
+    if index is None:
+        index = _build_index(path, st.st_mtime_ns, st.st_size)
+        if sidecar is not None:
+            try:
+                atomic_write_bytes(sidecar, json.dumps(index.to_json()).encode("utf-8"))
+            except OSError:
+                pass  # a read-only cache only costs the next process a rebuild
+    _INDEXES[path] = index
+    return index
+
+
+def get_item(name: str, item_id: str) -> BatteryItem:
+    """Return one item by id, reading only that item's bytes from the JSONL.
+
+    Raises:
+        KeyError: if the battery has no item with that id.
+    """
+    index = battery_index(name)
+    pos = index.position(item_id)
+    if pos is None:
+        raise KeyError(f"No item {item_id!r} in battery {name!r}")
+    return next(index.read([pos]))
+
+
+def select_items(name: str, **filters: str) -> Iterator[BatteryItem]:
+    """Yield the items whose fields equal every given filter, in file order.
+
+    Filters are keyword arguments over `INDEX_FIELDS`, e.g.
+    ``select_items("cg100", level="CG2", domain="logic")``. Only the matching
+    items are read and parsed.
+
+    Raises:
+        ValueError: for a filter on a field that is not indexed.
+    """
+    unknown = sorted(set(filters) - set(INDEX_FIELDS))
+    if unknown:
+        raise ValueError(f"Cannot filter on {unknown}; indexed fields: {', '.join(INDEX_FIELDS)}")
+    index = battery_index(name)
+    selected: set[int] | None = None
+    for field_name, value in filters.items():
+        matches = set(index.fields.get(field_name, {}).get(str(value), ()))
+        selected = matches if selected is None else selected & matches
+    positions = range(len(index)) if selected is None else sorted(selected)
+    return index.read(list(positions))
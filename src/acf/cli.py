@@ -8,28 +8,39 @@ Usage:
     acf score <data-dir>     Score a system from collected data
     acf validate <path>      Validate data files against schemas
     acf query "<sparql>"     Run SPARQL over the knowledge graph
+    acf ingest <data-dir>    Ingest data and report throughput
+    acf pack <data-dir> <out> Pack per-query records into a columnar store
     acf compare <p1> <p2>    Compare two ACF profiles
 """
 
 from __future__ import annotations
 
+import csv
 import json
+import os
 import sys
+from contextlib import nullcontext
+from datetime import datetime
 from pathlib import Path
+from typing import cast
 
 import click
 from rich.console import Console
 from rich.table import Table
 
-from acf.graph import KNOWLEDGE_DIR, ACFGraph
+from acf.graph import KNOWLEDGE_DIR, ACFGraph, QueryStream
 
 console = Console()
 
 
 def _get_graph(data_dir: str | None = None) -> ACFGraph:
-    """Create an ACFGraph, optionally with data."""
+    """Create an ACFGraph, optionally with data.
+
+    Data is ingested incrementally: re-running against a growing results
+    directory only parses the files added or changed since the last run.
+    """
     d = Path(data_dir) if data_dir else None
-    return ACFGraph(knowledge_dir=KNOWLEDGE_DIR, data_dir=d)
+    return ACFGraph(knowledge_dir=KNOWLEDGE_DIR, data_dir=d, incremental=True)
 
 
 @click.group()
@@ -164,18 +175,39 @@ def levels(as_json: bool):
 @main.command("query")
 @click.argument("sparql")
 @click.option("--data", "-d", "data_dir", help="Data directory to include")
-@click.option("--json-output", "as_json", is_flag=True, help="Output as JSON")
-def run_query(sparql: str, data_dir: str | None, as_json: bool):
+@click.option("--bind", "-b", "binds", multiple=True, metavar="NAME=VALUE",
+              help="Bind ?NAME to a literal VALUE (repeatable)")
+@click.option("--format", "-f", "fmt", default="table",
+              type=click.Choice(["table", "json", "ndjson", "csv"]),
+              help="Output format; ndjson and csv stream rows as they are produced")
+@click.option("--json-output", "as_json", is_flag=True, help="Output as JSON (same as -f json)")
+def run_query(
+    sparql: str, data_dir: str | None, binds: tuple[str, ...], fmt: str, as_json: bool,
+):
     """Run a SPARQL query over the ACF knowledge graph."""
+    if as_json:
+        fmt = "json"
+    bindings: dict[str, str] = {}
+    for bind in binds:
+        name, sep, value = bind.partition("=")
+        if not sep or not name:
+            console.print(f"[red]Invalid --bind {bind!r}: expected NAME=VALUE[/red]")
+            sys.exit(1)
+        bindings[name.lstrip("?")] = value
+
     graph = _get_graph(data_dir)
 
     try:
-        results = graph.query(sparql)
+        if fmt in ("ndjson", "csv"):
+            _stream_query(graph.iter_query(sparql, bindings=bindings), fmt)
+            return
+        results = graph.query(sparql, bindings=bindings)
     except Exception as e:  # noqa: BLE001 — CLI boundary: any query failure prints and exits
-        console.print(f"[red]SPARQL error: {e}[/red]")
+        # stderr: on the streaming formats stdout may already hold rows.
+        Console(stderr=True).print(f"[red]SPARQL error: {e}[/red]")
         sys.exit(1)
 
-    if as_json:
+    if fmt == "json":
         click.echo(json.dumps(results, indent=2))
         return
 
@@ -196,39 +228,124 @@ def run_query(sparql: str, data_dir: str | None, as_json: bool):
     console.print(f"\n[dim]{len(results)} results[/dim]")
 
 
+def _stream_query(stream: QueryStream, fmt: str) -> None:
+    """Write query rows to stdout one at a time, holding none of them."""
+    out = sys.stdout
+    try:
+        if fmt == "ndjson":
+            for row in stream:
+                out.write(json.dumps(row) + "\n")
+        else:
+            writer = csv.writer(out, lineterminator="\n")
+            writer.writerow(stream.variables)
+            for row in stream:
+                writer.writerow([row.get(var, "") for var in stream.variables])
+        out.flush()
+    except BrokenPipeError:
+        # Downstream closed early (`| head`). Point stdout at devnull so the
+        # interpreter's final flush does not raise again, then stop quietly:
+        # the consumer stopped by choice, so this is not a failure.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), out.fileno())
+        sys.exit(0)
+
+
+@main.command()
+@click.argument("data_dir", type=click.Path(exists=True, file_okay=False))
+@click.option("--workers", "-w", type=int, help="Parser processes (default: automatic)")
+@click.option("--json-output", "as_json", is_flag=True, help="Output as JSON")
+def ingest(data_dir: str, workers: int | None, as_json: bool):
+    """Ingest a data directory into the graph and report throughput."""
+    graph = ACFGraph(knowledge_dir=KNOWLEDGE_DIR)
+    stats = graph.ingest(Path(data_dir), workers=workers)
+
+    if as_json:
+        click.echo(json.dumps(stats.to_dict(), indent=2))
+        return
+
+    console.print(f"[bold]Ingested {data_dir}[/bold]")
+    console.print(f"  Files:     {stats.files}")
+    console.print(f"  Records:   {stats.records}")
+    console.print(f"  Triples:   {stats.triples}")
+    console.print(f"  Elapsed:   {stats.seconds:.3f}s")
+    console.print(f"  Records/s: {stats.records_per_second:,.0f}")
+    console.print(f"  Triples/s: {stats.triples_per_second:,.0f}")
+
+
+@main.command()
+@click.argument("data_dir", type=click.Path(exists=True, file_okay=False))
+@click.argument("output", type=click.Path(dir_okay=False))
+@click.option("--json-output", "as_json", is_flag=True, help="Output as JSON")
+def pack(data_dir: str, output: str, as_json: bool):
+    """Pack per-query records into a columnar .acfq store."""
+    from acf.data.loader import load_per_query_columns
+
+    store = load_per_query_columns(Path(data_dir))
+    out = Path(output)
+    store.save(out)
+    summary = {
+        "rows": len(store),
+        "measures": store.measure_ids,
+        "output": str(out),
+        "bytes": out.stat().st_size,
+    }
+
+    if as_json:
+        click.echo(json.dumps(summary, indent=2))
+        return
+
+    console.print(f"[bold]Packed {len(store)} per-query records[/bold] -> {out}")
+    console.print(f"  Measures: {', '.join(store.measure_ids) or '(none)'}")
+    console.print(f"  Size:     {summary['bytes']:,} bytes")
+
+
 @main.command()
 @click.argument("path", type=click.Path(exists=True))
-def validate(path: str):
-    """Validate data files against ACF schemas."""
+@click.option("--workers", "-w", type=int, help="Validator processes (default: automatic)")
+@click.option("--json-output", "as_json", is_flag=True,
+              help="Stream one JSON line per file, then a summary line")
+def validate(path: str, workers: int | None, as_json: bool):
+    """Validate data files against ACF schemas.
+
+    Each record is checked against the JSON Schema for its record_type
+    (envelope fields only if jsonschema is not installed). Files are spread
+    over a process pool for large directories, and results stream as they
+    arrive.
+    """
+    import time
+
+    from acf.data.loader import data_files
+    from acf.data.validator import ValidationSummary, validate_files
+
     p = Path(path)
-    files = list(p.glob("*.json")) if p.is_dir() else [p]
+    files = data_files(p) if p.is_dir() else [p]
 
     if not files:
-        console.print("[yellow]No JSON files found.[/yellow]")
+        console.print("[yellow]No JSON or JSONL files found.[/yellow]")
         return
 
-    valid = 0
-    invalid = 0
-    for f in files:
-        try:
-            data = json.loads(f.read_text())
-            # Basic envelope validation (per-query-record doesn't require measure_id)
-            required = ["record_type"]
-            if data.get("record_type") != "per-query-record":
-                required.append("measure_id")
-            missing = [k for k in required if k not in data]
-            if missing:
-                console.print(f"  [red]FAIL[/red] {f.name}: missing {missing}")
-                invalid += 1
-            else:
-                console.print(f"  [green]OK[/green]   {f.name} ({data['record_type']})")
-                valid += 1
-        except json.JSONDecodeError as e:
-            console.print(f"  [red]FAIL[/red] {f.name}: invalid JSON — {e}")
-            invalid += 1
-
-    console.print(f"\n{valid} valid, {invalid} invalid")
-    if invalid > 0:
+    summary = ValidationSummary()
+    start = time.perf_counter()
+    for report in validate_files(files, workers=workers):
+        summary.add(report)
+        name = Path(report.path).name
+        if as_json:
+            click.echo(json.dumps(report.to_dict()))
+        elif not report.valid:
+            more = f" (+{report.n_errors - 1} more)" if report.n_errors > 1 else ""
+            console.print(f"  [red]FAIL[/red] {name}: {report.errors[0]}{more}")
+        elif report.records == 1:
+            console.print(f"  [green]OK[/green]   {name} ({report.record_types[0]})")
+        else:
+            console.print(f"  [green]OK[/green]   {name} ({report.records} records)")
+    summary.seconds = time.perf_counter() - start
+
+    if as_json:
+        click.echo(json.dumps({"summary": summary.to_dict()}))
+    else:
+        if not summary.schema_enforced:
+            console.print("\n[dim]jsonschema not installed: envelope fields checked only[/dim]")
+        console.print(f"\n{summary.valid_files} valid, {summary.invalid_files} invalid")
+    if summary.invalid_files > 0:
         sys.exit(1)
 
 
@@ -282,149 +399,90 @@ def compare(profile1: str, profile2: str, as_json: bool):
     console.print(table)
 
 
+def _timestamp_option(ctx: click.Context, param: click.Parameter, value: str | None) -> datetime | None:
+    if value is None:
+        return None
+    from acf.utils.timestamps import parse_timestamp
+
+    moment = parse_timestamp(value)
+    if moment is None:
+        raise click.BadParameter(f"not an ISO 8601 date or time: {value!r}")
+    return moment
+
+
 @main.command()
 @click.argument("data_path", type=click.Path(exists=True))
 @click.option("--system", "-s", "system_id", help="Filter by system ID")
 @click.option("--json-output", "as_json", is_flag=True, help="Output as JSON")
 @click.option("--save", type=click.Path(), help="Save profile to JSON file")
-def score(data_path: str, system_id: str | None, as_json: bool, save: str | None):
-    """Score a system from collected data, producing an ACF profile."""
-    from acf.scoring.profile import ACFDimensionScore, ACFProfile
+@click.option("--all-systems", is_flag=True,
+              help="Score every system/version in the data, one profile each")
+@click.option("--jsonl", "jsonl_path", type=click.Path(dir_okay=False),
+              help="Write the profile(s) as JSONL, one per line")
+@click.option("--since", callback=_timestamp_option,
+              help="Only score records at or after this ISO 8601 time (UTC if no offset)")
+@click.option("--until", callback=_timestamp_option,
+              help="Only score records before this ISO 8601 time (UTC if no offset)")
+def score(
+    data_path: str, system_id: str | None, as_json: bool, save: str | None,
+    all_systems: bool, jsonl_path: str | None, since: datetime | None, until: datetime | None,
+):
+    """Score a system from collected data, producing an ACF profile.
+
+    The latest record per measure, by timestamp, is scored. With
+    --all-systems, every (system, version) in the data is scored in the
+    same single pass. --since/--until score a time slice only; dated JSONL
+    shards outside it are not read.
+    """
+    from acf.data.loader import data_files
+    from acf.scoring.engine import ScoringEngine
 
     data_dir = Path(data_path)
-    files = list(data_dir.glob("*.json")) if data_dir.is_dir() else [data_dir]
-
-    if not files:
-        console.print("[yellow]No JSON files found.[/yellow]")
+    if data_dir.is_dir() and not data_files(data_dir):
+        console.print("[yellow]No JSON or JSONL files found.[/yellow]")
         return
 
-    graph = _get_graph()
+    if all_systems and (system_id or save):
+        raise click.UsageError("--all-systems scores every system; use --jsonl instead of --save")
+    if since and until and since >= until:
+        raise click.UsageError("--since must be earlier than --until")
 
-    # Build measure -> dimensions lookup from the graph
-    all_measures = graph.measures()
-    measure_dims: dict[str, list[str]] = {}
-    for m in all_measures:
-        measure_dims[m.id] = m.dimensions
-
-    # Collect experiment-run values: {measure_id: {system_id: {value, target, pass}}}
-    records: list[dict] = []
-    for f in files:
-        try:
-            data = json.loads(f.read_text())
-        except (json.JSONDecodeError, OSError):
-            continue
-        if data.get("record_type") != "experiment-run":
-            continue
-        sid = data.get("system_id") or data.get("being", "unknown")
-        if system_id and sid != system_id:
-            continue
-        records.append({
-            "system_id": sid,
-            "measure_id": data.get("measure_id", ""),
-            "value": data.get("value", 0.0),
-            "target": data.get("target"),
-            "passed": data.get("pass", False),
-            "system_version": data.get("system_version", ""),
-        })
-
-    if not records:
+    # One streaming pass; only per-(system, measure) state is kept.
+    engine = ScoringEngine.from_graph(
+        _get_graph(), system_id=system_id, by_version=all_systems, since=since, until=until,
+    )
+    engine.consume_path(data_dir)
+    detected_systems = engine.record_counts
+
+    if not detected_systems:
         console.print("[yellow]No experiment-run records found.[/yellow]")
         if system_id:
             console.print(f"  Filtered by system: {system_id}")
+        if since or until:
+            console.print(f"  Window: {since or '-'} to {until or '-'}")
         return
 
-    # Auto-detect system_id from most common
-    detected_systems: dict[str, int] = {}
-    for r in records:
-        detected_systems[r["system_id"]] = detected_systems.get(r["system_id"], 0) + 1
+    if all_systems:
+        results = sorted(engine.score_all(), key=lambda r: (r.profile.system_id, r.profile.version))
+        _report_all_systems(results, as_json, jsonl_path)
+        return
 
-    if not system_id:
+    if not system_id and len(detected_systems) > 1:
         # If multiple systems, show them and pick the one with most records
-        if len(detected_systems) > 1:
-            console.print("[dim]Multiple systems found in data:[/dim]")
-            for sid, cnt in sorted(detected_systems.items(), key=lambda x: -x[1]):
-                console.print(f"  {sid}: {cnt} records")
-            system_id = max(detected_systems, key=lambda s: detected_systems[s])
-            console.print(f"[dim]Using: {system_id} (use --system to override)[/dim]\n")
-            records = [r for r in records if r["system_id"] == system_id]
-        else:
-            system_id = next(iter(detected_systems))
-
-    # Deduplicate: keep latest record per measure_id
-    latest: dict[str, dict] = {}
-    for r in records:
-        mid = r["measure_id"]
-        if mid not in latest:
-            latest[mid] = r
-
-    # Group measures by dimension
-    dim_measures: dict[str, list[dict]] = {}
-    unmapped: list[str] = []
-    for mid, rec in latest.items():
-        dims = measure_dims.get(mid, [])
-        if not dims:
-            unmapped.append(mid)
-            continue
-        for dim in dims:
-            dim_measures.setdefault(dim, []).append(rec)
-
-    # Score each dimension
-    dim_scores: dict[str, ACFDimensionScore] = {}
-    for dim_id, measure_recs in sorted(dim_measures.items()):
-        total = len(measure_recs)
-        passed = sum(1 for r in measure_recs if r["passed"])
-
-        # Compute score from measure values
-        # For percent-type measures, average the values directly
-        values = [r["value"] for r in measure_recs if r["value"] is not None]
-        if values:
-            # Normalize: values > 1 assumed to be 0-100 scale; values <= 1 assumed 0-1 scale
-            normalized = []
-            for v in values:
-                if v <= 1.0 and v >= 0.0:
-                    normalized.append(v * 100)
-                else:
-                    normalized.append(min(v, 100.0))
-            avg_value = sum(normalized) / len(normalized)
-        else:
-            avg_value = 0.0
-
-        # Average value IS the score; confidence is set by sample size below.
-        dimension_score = avg_value
-
-        # Determine sub-level from graph
-        sub_levels = graph.sub_levels(dim_id)
-        sub_level = "?"
-        for sl in reversed(sub_levels):
-            if sl.score_range:
-                parts = sl.score_range.replace("–", "-").split("-")
-                try:
-                    low = float(parts[0].strip())
-                    if dimension_score >= low:
-                        sub_level = sl.id
-                        break
-                except (ValueError, IndexError):
-                    continue
-        if sub_level == "?" and sub_levels:
-            sub_level = sub_levels[0].id
-
-        confidence = "measured" if total >= 3 else "estimated"
-        dim_scores[dim_id] = ACFDimensionScore(
-            dimension=dim_id,
-            score=round(dimension_score, 1),
-            sub_level=sub_level,
-            evidence=f"{passed}/{total} measures passed, avg={avg_value:.1f}",
-            confidence=confidence,
-        )
-
-    # Build profile
-    version = records[0].get("system_version", "") if records else ""
-    profile = ACFProfile(
-        system_id=system_id,
-        system_type="unknown",
-        version=version,
-        dimensions=dim_scores,
-    )
+        console.print("[dim]Multiple systems found in data:[/dim]")
+        for sid, cnt in sorted(detected_systems.items(), key=lambda x: -x[1]):
+            console.print(f"  {sid}: {cnt} records")
+        console.print(f"[dim]Using: {engine.primary_system()} (use --system to override)[/dim]\n")
+
+    result = engine.score()
+    if result is None:
+        # Unreachable while record_counts is non-empty; fail loudly rather than
+        # crash on None if that ever stops holding.
+        raise click.ClickException(f"no experiment-run records to score for {system_id or 'any system'}")
+    profile, unmapped = result.profile, result.unmapped
+    system_id, version, dim_scores = profile.system_id, profile.version, profile.dimensions
+    if jsonl_path:
+        _write_profiles_jsonl(Path(jsonl_path), [profile])
 
     if as_json or save:
         profile_json = json.dumps(profile.to_dict(), indent=2)
@@ -465,6 +523,38 @@ def score(data_path: str, system_id: str | None, as_json: bool, save: str | None
     console.print()
 
 
+def _write_profiles_jsonl(path: Path, profiles: list) -> None:
+    with path.open("w", encoding="utf-8") as f:
+        for profile in profiles:
+            f.write(json.dumps(profile.to_dict()) + "\n")
+
+
+def _report_all_systems(results: list, as_json: bool, jsonl_path: str | None) -> None:
+    """Print (and optionally save) one profile per scored system/version."""
+    if jsonl_path:
+        _write_profiles_jsonl(Path(jsonl_path), [r.profile for r in results])
+    if as_json:
+        click.echo(json.dumps([r.profile.to_dict() for r in results], indent=2))
+        return
+
+    table = Table(title=f"ACF Profiles ({len(results)} system versions)")
+    table.add_column("System", style="bold")
+    table.add_column("Version")
+    table.add_column("Records", justify="right", style="dim")
+    table.add_column("Dims", justify="right", style="dim")
+    table.add_column("Aggregate", justify="right", style="cyan")
+    table.add_column("Certification", style="green")
+    for r in results:
+        p = r.profile
+        table.add_row(
+            p.system_id, p.version, str(r.n_records), f"{len(p.dimensions)}/12",
+            f"{p.aggregate_score:.1f}", f"{p.certification_level} — {p.certification_label}",
+        )
+    console.print(table)
+    if jsonl_path:
+        console.print(f"Profiles saved to [bold]{jsonl_path}[/bold]")
+
+
 @main.command()
 @click.argument("record_type", type=click.Choice([
     "experiment-run", "longitudinal-series", "per-query-record",
@@ -514,9 +604,11 @@ def template(record_type: str):
             "system_id": "",
             "measure_id": "M-XXX",
             "collector": "automated",
+            "query_id": "",
             "query": "",
-            "response": "",
-            "signals": {},
+            "actual_answer": "",
+            "correct": False,
+            "signals": [],
             "notes": "",
         },
     }
@@ -567,13 +659,11 @@ def batteries():
 @click.option("--json-output", "as_json", is_flag=True, help="Output as JSON")
 def batteries_list(as_json: bool):
     """List the batteries shipped in this distribution."""
-    from acf.batteries import list_batteries, load_battery
+    from acf.batteries import battery_size, list_batteries
 
     found = list_batteries()
-    summary = []
-    for name in found:
-        items = load_battery(name)
-        summary.append({"name": name, "n_items": len(items)})
+    # Counts come from the battery index sidecar; no items are parsed.
+    summary = [{"name": name, "n_items": battery_size(name)} for name in found]
 
     if as_json:
         click.echo(json.dumps(summary, indent=2))
@@ -595,18 +685,35 @@ def batteries_list(as_json: bool):
 @batteries.command("inspect")
 @click.argument("name")
 @click.option("--limit", type=int, default=3, help="How many items to print")
+@click.option("--id", "item_id", help="Print only the item with this id")
+@click.option("--level", help="Only items at this level (e.g. FR2, CG1)")
+@click.option("--domain", help="Only items in this domain")
+@click.option("--subtype", help="Only items of this subtype")
 @click.option("--json-output", "as_json", is_flag=True, help="Output as JSON")
-def batteries_inspect(name: str, limit: int, as_json: bool):
-    """Print the first N items of a named battery."""
-    from acf.batteries import load_battery
+def batteries_inspect(
+    name: str, limit: int, item_id: str | None, level: str | None,
+    domain: str | None, subtype: str | None, as_json: bool,
+):
+    """Print the first N items of a named battery, optionally filtered."""
+    from itertools import islice
+
+    from acf.batteries import get_item, iter_battery, select_items
 
+    filters = {k: v for k, v in
+               {"level": level, "domain": domain, "subtype": subtype}.items() if v}
     try:
-        items = load_battery(name)
-    except (ValueError, FileNotFoundError) as e:
-        console.print(f"[red]{e}[/red]")
+        # Only the printed items are parsed: the first N lines of the JSONL, or
+        # an index lookup that seeks straight to the requested ones.
+        if item_id:
+            sample = [get_item(name, item_id)]
+        elif filters:
+            sample = list(islice(select_items(name, **filters), limit))
+        else:
+            sample = list(islice(iter_battery(name), limit))
+    except (ValueError, FileNotFoundError, KeyError) as e:
+        console.print(f"[red]{e.args[0] if isinstance(e, KeyError) else e}[/red]")
         sys.exit(1)
 
-    sample = items[:limit]
     if as_json:
         click.echo(json.dumps(sample, indent=2))
         return
@@ -620,6 +727,158 @@ def batteries_inspect(name: str, limit: int, as_json: bool):
         console.print()
 
 
+def _load_runner(spec: str) -> object:
+    """Resolve a ``module:attr`` runner spec; classes and factories are called with no args."""
+    import importlib
+
+    module_name, sep, attr = spec.partition(":")
+    if not sep or not module_name or not attr:
+        raise click.BadParameter(f"expected MODULE:ATTR, got {spec!r}", param_hint="--runner")
+    try:
+        target = getattr(importlib.import_module(module_name), attr)
+    except (ImportError, AttributeError) as e:
+        raise click.BadParameter(f"cannot load {spec!r}: {e}", param_hint="--runner") from e
+    if isinstance(target, type) or (not hasattr(target, "run_item") and callable(target)):
+        target = target()
+    if not hasattr(target, "run_item"):
+        raise click.BadParameter(f"{spec!r} has no run_item()", param_hint="--runner")
+    return target
+
+
+@batteries.command("run")
+@click.argument("name")
+@click.option("--runner", "runner_spec", required=True, metavar="MODULE:ATTR",
+              help="BatteryRunner or AsyncBatteryRunner instance, class, or factory to run")
+@click.option("--workers", "-w", type=int, default=4, show_default=True,
+              help="Concurrent items (pool size, or in-flight coroutines for async runners)")
+@click.option("--pool", type=click.Choice(["thread", "process"]), default="thread",
+              show_default=True, help="Worker pool kind (sync runners)")
+@click.option("--rate", type=float, help="Max item starts per second (async runners)")
+@click.option("--timeout", type=float, help="Seconds before an attempt is abandoned")
+@click.option("--retries", type=int, default=0, show_default=True, help="Retries per failed item")
+@click.option("--output", "-o", type=click.Path(dir_okay=False),
+              help="Write results as JSONL in battery order")
+@click.option("--checkpoint", "checkpoint_path", type=click.Path(dir_okay=False),
+              help="Resumable log: skip items it holds, append items as they finish")
+@click.option("--cache", "use_cache", is_flag=True,
+              help="Reuse cached responses for unchanged items; cache new ones")
+@click.option("--cache-max-mb", type=float, default=256, show_default=True,
+              help="Response cache size before least recently used entries are evicted")
+@click.option("--system", "system_id", help="System ID the checkpoint and cache are keyed by")
+@click.option("--system-version", help="System version the checkpoint and cache are keyed by")
+@click.option("--json-output", "as_json", is_flag=True, help="Print the run summary as JSON")
+def batteries_run(
+    name: str, runner_spec: str, workers: int, pool: str, rate: float | None,
+    timeout: float | None, retries: int, output: str | None,
+    checkpoint_path: str | None, use_cache: bool, cache_max_mb: float,
+    system_id: str | None, system_version: str | None, as_json: bool,
+):
+    """Run a battery runner over a named battery and report throughput and latency.
+
+    Runners whose run_item is a coroutine function run on one event loop
+    (acf.execution.async_engine); others run on a thread or process pool.
+
+    With --cache, responses are cached under the ACF cache directory, keyed by
+    item content, system, version and runner (the --runner spec plus the
+    runner's `config` attribute, if it has one).
+    """
+    import asyncio
+    import inspect
+
+    from acf.batteries import AsyncBatteryRunner, BatteryRunner, load_battery
+    from acf.execution.async_engine import AsyncBatteryEngine
+    from acf.execution.checkpoint import Checkpoint
+    from acf.execution.engine import BatteryEngine, ItemResult, PoolKind, RunStats
+    from acf.execution.response_cache import ResponseCache
+
+    if checkpoint_path and not (system_id and system_version):
+        raise click.UsageError("--checkpoint needs --system and --system-version")
+    if use_cache and not (system_id and system_version):
+        raise click.UsageError("--cache needs --system and --system-version")
+    runner = _load_runner(runner_spec)
+    try:
+        cache = (
+            ResponseCache(
+                cast(str, system_id), cast(str, system_version),
+                runner_config={"runner": runner_spec, "config": getattr(runner, "config", None)},
+                max_bytes=int(cache_max_mb * (1 << 20)),
+            )
+            if use_cache else None
+        )
+    except TypeError as e:
+        raise click.ClickException(f"--cache: runner config: {e}") from e
+    try:
+        items = load_battery(name)
+    except (ValueError, FileNotFoundError) as e:
+        console.print(f"[red]{e}[/red]")
+        sys.exit(1)
+
+    # Progress goes to stderr so stdout stays clean for --json-output.
+    err = Console(stderr=True)
+    status = err.status(f"Running {name}...")
+
+    def _progress(stats: RunStats) -> None:
+        status.update(
+            f"{name}: {stats.completed}/{stats.total} items  "
+            f"{stats.items_per_second:.1f} items/s  "
+            f"p50 {stats.latency_ms(50):.0f} ms  p95 {stats.latency_ms(95):.0f} ms  "
+            f"{stats.failed} failed"
+        )
+
+    checkpoint = (
+        Checkpoint(Path(checkpoint_path), cast(str, system_id), cast(str, system_version))
+        if checkpoint_path else None
+    )
+    with (
+        status,
+        checkpoint if checkpoint is not None else nullcontext(),
+        open(output, "w", encoding="utf-8") if output else nullcontext() as out,
+    ):
+
+        def _emit(result: ItemResult) -> None:
+            if out is not None:
+                out.write(json.dumps(result.to_dict()) + "\n")
+
+        engine: BatteryEngine | AsyncBatteryEngine
+        if inspect.iscoroutinefunction(getattr(runner, "run_item", None)):
+            engine = AsyncBatteryEngine(
+                cast(AsyncBatteryRunner, runner), concurrency=workers, rate=rate,
+                timeout=timeout, retries=retries, on_progress=_progress,
+                checkpoint=checkpoint, cache=cache,
+            )
+
+            async def _drain(engine: AsyncBatteryEngine) -> None:
+                async for result in engine.iter_run(items):
+                    _emit(result)
+
+            asyncio.run(_drain(engine))
+        else:
+            engine = BatteryEngine(
+                cast(BatteryRunner, runner), workers=workers, pool=cast(PoolKind, pool),
+                timeout=timeout, retries=retries, on_progress=_progress,
+                checkpoint=checkpoint, cache=cache,
+            )
+            for result in engine.iter_run(items):
+                _emit(result)
+
+    summary = {"battery": name, **engine.stats.to_dict()}
+    if as_json:
+        click.echo(json.dumps(summary, indent=2))
+        return
+
+    console.print(f"[bold]{name}[/bold]: {summary['completed']} items, {summary['failed']} failed, "
+                  f"{summary['retries']} retries in {summary['seconds']}s")
+    if checkpoint is not None:
+        console.print(f"  Resumed:    {summary['resumed']} items from {checkpoint_path}")
+    if cache is not None:
+        console.print(f"  Cached:     {summary['cached']} items from {cache.directory}")
+    console.print(f"  Throughput: {summary['items_per_second']} items/s")
+    console.print(f"  Latency:    mean {summary['latency_ms_mean']} ms, "
+                  f"p50 {summary['latency_ms_p50']} ms, p95 {summary['latency_ms_p95']} ms")
+    if output:
+        console.print(f"  Results:    {output}")
+
+
 @batteries.command("methodology")
 @click.argument("name")
 def batteries_methodology(name: str):
@@ -0,0 +1,364 @@
+"""Columnar storage for per-query records.
+
+Per-query records (`schemas/per-query-record.schema.json`) are emitted one
+JSON file per query — millions per evaluation — yet analysis only ever scans
+a handful of fields. `PerQueryColumns` keeps those fields as typed arrays:
+
+  - ``latency_ms``, ``timestamp`` (epoch seconds) — ``array('d')``, NaN = missing
+  - ``correct`` — ``array('b')``: 1, 0, or -1 = missing
+  - ``bloom_level`` — ``array('b')``: 1-6, or 0 = missing
+  - ``system_id``, ``system_version``, ``experiment_id``, ``query_id``,
+    ``domain`` — ``array('I')`` codes into one shared string dictionary
+  - one ``array('d')`` per measure in ``measures``, NaN where a row lacks it
+
+It is an analytic projection, not an archive: free text (``query``,
+``expected_answer``, ``actual_answer``, ``notes``) and ``signals`` are not
+stored. Keep the source JSON if you need them.
+
+On disk (``.acfq``) a store is a magic string, a JSON header, then each column
+zlib-compressed.
+
+Usage:
+    from acf.data.columnar import PerQueryColumns
+
+    store = PerQueryColumns.from_records(load_data_files(Path("runs/")))
+    store.save(Path("runs.acfq"))
+    PerQueryColumns.load(Path("runs.acfq")).bloom_accuracy()
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import sys
+import zlib
+from array import array
+from collections.abc import Iterable, Iterator, Mapping
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from acf.utils.cache import atomic_write_bytes
+from acf.utils.timestamps import parse_timestamp
+
+COLUMNAR_SUFFIX = ".acfq"
+
+_MAGIC = b"ACFQ\x01"
+_FORMAT_VERSION = 1
+_NAN = float("nan")
+
+STRING_COLUMNS: tuple[str, ...] = (
+    "system_id", "system_version", "experiment_id", "query_id", "domain",
+)
+_NUMERIC_COLUMNS: dict[str, str] = {
+    "timestamp": "d",
+    "latency_ms": "d",
+    "correct": "b",
+    "bloom_level": "b",
+}
+
+
+class PerQueryColumns:
+    """An append-only, column-oriented table of per-query records."""
+
+    def __init__(self) -> None:
+        # Code 0 is the empty string, which stands for "missing".
+        self._strings: list[str] = [""]
+        self._codes: dict[str, int] = {"": 0}
+        self._columns: dict[str, array] = {
+            name: array("I") for name in STRING_COLUMNS
+        }
+        for name, typecode in _NUMERIC_COLUMNS.items():
+            self._columns[name] = array(typecode)
+        self._measures: dict[str, array] = {}
+        self._rows = 0
+
+    def __len__(self) -> int:
+        return self._rows
+
+    # ── Building ─────────────────────────────────────────────────
+
+    def _code(self, value: Any) -> int:
+        text = "" if value is None else str(value)
+        code = self._codes.get(text)
+        if code is None:
+            code = len(self._strings)
+            self._codes[text] = code
+            self._strings.append(text)
+        return code
+
+    def append(self, record: Mapping[str, Any]) -> None:
+        """Add one per-query record.
+
+        The record is checked and converted in full before any column grows,
+        so a rejected record leaves the store as it was.
+
+        Raises:
+            ValueError: if `record` is not a ``per-query-record``, or its
+                ``measures`` is not an object.
+        """
+        if record.get("record_type") != "per-query-record":
+            raise ValueError(
+                f"Expected a per-query-record, got {record.get('record_type')!r}"
+            )
+        values = record.get("measures") or {}
+        if not isinstance(values, Mapping):
+            raise ValueError(  # noqa: TRY004 — loaders skip bad records on ValueError
+                f"measures must be an object, got {type(values).__name__}"
+            )
+        measures = {str(k): _number(v) for k, v in values.items()}
+        ts = parse_timestamp(record.get("timestamp"))
+        correct = record.get("correct")
+        bloom = record.get("bloom_level")
+        numeric = {
+            "timestamp": ts.timestamp() if ts else _NAN,
+            "latency_ms": _number(record.get("latency_ms")),
+            "correct": int(correct) if isinstance(correct, bool) else -1,
+            "bloom_level": (
+                bloom if type(bloom) is int and 1 <= bloom <= 6 else 0
+            ),
+        }
+        strings: dict[str, Any] = {}
+        for name in STRING_COLUMNS:
+            value = record.get(name)
+            if name == "system_id" and not value:
+                value = record.get("being")  # NuSy-era field name
+            strings[name] = value
+
+        cols = self._columns
+        for name, value in strings.items():
+            cols[name].append(self._code(value))
+        for name, number in numeric.items():
+            cols[name].append(number)
+        for measure_id in measures.keys() - self._measures.keys():
+            self._measures[measure_id] = array("d", [_NAN]) * self._rows
+        for measure_id, column in self._measures.items():
+            column.append(measures.get(measure_id, _NAN))
+        self._rows += 1
+
+    def extend(self, records: Iterable[Mapping[str, Any]]) -> int:
+        """Append every per-query record in `records`, skipping other record types.
+
+        Returns the number of records appended.
+        """
+        added = 0
+        for record in records:
+            if record.get("record_type") == "per-query-record":
+                self.append(record)
+                added += 1
+        return added
+
+    def merge(self, other: PerQueryColumns) -> None:
+        """Append all rows of `other` column-wise, without going through dicts."""
+        remap = array("I", (self._code(text) for text in other._strings))
+        for name in STRING_COLUMNS:
+            self._columns[name].extend(remap[code] for code in other._columns[name])
+        for name in _NUMERIC_COLUMNS:
+            self._columns[name].extend(other._columns[name])
+        for measure_id in other._measures.keys() - self._measures.keys():
+            self._measures[measure_id] = array("d", [_NAN]) * self._rows
+        for measure_id, column in self._measures.items():
+            theirs = other._measures.get(measure_id)
+            column.extend(theirs if theirs is not None else array("d", [_NAN]) * len(other))
+        self._rows += other._rows
+
+    @classmethod
+    def from_records(cls, records: Iterable[Mapping[str, Any]]) -> PerQueryColumns:
+        store = cls()
+        store.extend(records)
+        return store
+
+    # ── Reading ──────────────────────────────────────────────────
+
+    @property
+    def measure_ids(self) -> list[str]:
+        return sorted(self._measures)
+
+    def column(self, name: str) -> array:
+        """Return a raw column (string columns as dictionary codes)."""
+        return self._columns[name]
+
+    def strings(self, name: str) -> list[str]:
+        """Return a string column decoded to Python strings ("" = missing)."""
+        lookup = self._strings
+        return [lookup[code] for code in self._columns[name]]
+
+    def measure(self, measure_id: str) -> array:
+        """Return the values of one measure (NaN where a row lacks it)."""
+        column = self._measures.get(measure_id)
+        return column if column is not None else array("d", [_NAN]) * self._rows
+
+    def _row_mask(self, system_id: str | None) -> Iterable[bool]:
+        if system_id is None:
+            return [True] * self._rows
+        code = self._codes.get(system_id)
+        return [c == code for c in self._columns["system_id"]]
+
+    def accuracy(self, system_id: str | None = None) -> float:
+        """Fraction correct among rows that record correctness (0.0 if none)."""
+        right = total = 0
+        for keep, correct in zip(self._row_mask(system_id), self._columns["correct"]):
+            if keep and correct >= 0:
+                total += 1
+                right += correct
+        return right / total if total else 0.0
+
+    def bloom_accuracy(self, system_id: str | None = None) -> dict[str, float]:
+        """Accuracy per Bloom level, keyed ``"L1"``..``"L6"`` as `score_depth` expects.
+
+        Levels with no graded rows are omitted rather than reported as 0.
+        """
+        right = [0] * 7
+        total = [0] * 7
+        rows = zip(self._row_mask(system_id), self._columns["bloom_level"],
+                   self._columns["correct"])
+        for keep, level, correct in rows:
+            if keep and level and correct >= 0:
+                total[level] += 1
+                right[level] += correct
+        return {f"L{lvl}": right[lvl] / total[lvl] for lvl in range(1, 7) if total[lvl]}
+
+    def mean_latency_ms(self, system_id: str | None = None) -> float:
+        """Mean latency over rows that record one (0.0 if none)."""
+        values = [
+            v for keep, v in zip(self._row_mask(system_id), self._columns["latency_ms"])
+            if keep and not math.isnan(v)
+        ]
+        return sum(values) / len(values) if values else 0.0
+
+    def iter_records(self) -> Iterator[dict[str, Any]]:
+        """Yield each row as a per-query-record dict of the stored fields."""
+        lookup = self._strings
+        cols = self._columns
+        measures = sorted(self._measures.items())
+        for i in range(self._rows):
+            record: dict[str, Any] = {
+                "schema_version": "1.0.0",
+                "record_type": "per-query-record",
+            }
+            for name in STRING_COLUMNS:
+                text = lookup[cols[name][i]]
+                if text:
+                    record[name] = text
+            ts = cols["timestamp"][i]
+            if not math.isnan(ts):
+                record["timestamp"] = (
+                    datetime.fromtimestamp(ts, tz=timezone.utc).isoformat().replace("+00:00", "Z")
+                )
+            if cols["correct"][i] >= 0:
+                record["correct"] = bool(cols["correct"][i])
+            if not math.isnan(cols["latency_ms"][i]):
+                record["latency_ms"] = cols["latency_ms"][i]
+            if cols["bloom_level"][i]:
+                record["bloom_level"] = cols["bloom_level"][i]
+            values = {mid: col[i] for mid, col in measures if not math.isnan(col[i])}
+            if values:
+                record["measures"] = values
+            yield record
+
+    # ── Persistence ──────────────────────────────────────────────
+
+    def save(self, path: Path) -> None:
+        """Write the store to `path` (conventionally ``*.acfq``) atomically."""
+        blobs: list[bytes] = []
+        specs: list[dict[str, Any]] = []
+
+        def _add(name: str, typecode: str, raw: bytes) -> None:
+            packed = zlib.compress(raw, 6)
+            specs.append({"name": name, "typecode": typecode, "length": len(packed)})
+            blobs.append(packed)
+
+        # A JSON array, not a joined string, so any character (NUL included) survives.
+        _add("strings", "s", json.dumps(self._strings).encode("utf-8"))
+        for name, column in self._columns.items():
+            _add(name, column.typecode, column.tobytes())
+        for measure_id, column in sorted(self._measures.items()):
+            _add(f"measure:{measure_id}", "d", column.tobytes())
+
+        header = json.dumps({
+            "format": _FORMAT_VERSION,
+            "rows": self._rows,
+            "byteorder": sys.byteorder,
+            "itemsizes": {code: array(code).itemsize for code in "bdI"},
+            "columns": specs,
+        }).encode("utf-8")
+        atomic_write_bytes(
+            path,
+            b"".join([_MAGIC, len(header).to_bytes(4, "little"), header, *blobs]),
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> PerQueryColumns:
+        """Read a store written by `save`.
+
+        Raises:
+            ValueError: if `path` is not a readable ``.acfq`` file, including
+                one that is truncated or corrupt.
+        """
+        data = path.read_bytes()
+        if not data.startswith(_MAGIC):
+            raise ValueError(f"{path} is not an ACF columnar store")
+        try:
+            return cls._decode(path, data)
+        except (KeyError, TypeError, IndexError, AttributeError, zlib.error) as e:
+            # Whatever a damaged header or column trips over, callers (the
+            # loader's directory scans) only have to handle ValueError.
+            raise ValueError(f"{path}: corrupt columnar store ({type(e).__name__}: {e})") from e
+
+    @classmethod
+    def _decode(cls, path: Path, data: bytes) -> PerQueryColumns:
+        offset = len(_MAGIC)
+        header_len = int.from_bytes(data[offset:offset + 4], "little")
+        offset += 4
+        header = json.loads(data[offset:offset + header_len])
+        offset += header_len
+        version = header.get("format")
+        if version != _FORMAT_VERSION:
+            raise ValueError(f"{path}: unsupported columnar format {version!r}")
+        for code, size in header["itemsizes"].items():
+            if array(code).itemsize != size:
+                raise ValueError(f"{path}: written with {code!r} items of {size} bytes")
+        swap = header["byteorder"] != sys.byteorder
+
+        store = cls()
+        store._rows = rows = header["rows"]
+        for spec in header["columns"]:
+            end = offset + spec["length"]
+            if end > len(data):
+                raise ValueError(f"{path}: truncated columnar store")
+            raw = zlib.decompress(data[offset:end])
+            offset = end
+            name = spec["name"]
+            if name == "strings":
+                store._strings = _decode_strings(raw)
+                store._codes = {s: i for i, s in enumerate(store._strings)}
+                continue
+            column = array(spec["typecode"])
+            column.frombytes(raw)
+            if swap:
+                column.byteswap()
+            if len(column) != rows:
+                raise ValueError(f"{path}: column {name!r} has {len(column)} of {rows} rows")
+            if name.startswith("measure:"):
+                store._measures[name[len("measure:"):]] = column
+            else:
+                store._columns[name] = column
+        for name in STRING_COLUMNS:
+            codes = store._columns[name]
+            if len(codes) != rows or (codes and max(codes) >= len(store._strings)):
+                raise ValueError(f"{path}: column {name!r} does not match the string dictionary")
+        return store
+
+
+def _number(value: Any) -> float:
+    """`value` as a float, or NaN if it is missing or not a number (bools included)."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    return _NAN
+
+
+def _decode_strings(raw: bytes) -> list[str]:
+    strings = json.loads(raw.decode("utf-8"))
+    if not isinstance(strings, list) or not all(isinstance(s, str) for s in strings):
+        raise ValueError("string dictionary is not a list of strings")
+    return strings
@@ -3,21 +3,102 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
+from acf.data.columnar import COLUMNAR_SUFFIX, PerQueryColumns
+
+# Record-bearing file types: one record per ``.json`` file, one per line of a
+# ``.jsonl`` shard (as written by `acf.measures.sinks.JsonlSink`).
+DATA_SUFFIXES = (".json", ".jsonl")
+
+
+def data_files(data_dir: Path) -> list[Path]:
+    """Return the JSON and JSONL data files directly under `data_dir`, sorted."""
+    return sorted(p for p in data_dir.iterdir() if p.suffix in DATA_SUFFIXES and p.is_file())
+
+
+def iter_records(path: Path) -> Iterator[tuple[str, Any]]:
+    """Decode the records in one data file as ``(record_id, record)`` pairs, lazily.
+
+    A ``.json`` file holds one record whose id is the file stem. A ``.jsonl``
+    shard holds one record per line, with id ``<stem>-<line number>``, so ids
+    stay stable as the shard grows. Shards are read a line at a time, so
+    memory does not grow with the shard. Blank and undecodable lines are
+    skipped: the last line of a shard whose writer crashed mid-append is
+    torn, and the records before it are still good. An unreadable or
+    undecodable ``.json`` file yields nothing. A shard stops at the first
+    byte that is not valid text.
+    """
+    if path.suffix != ".jsonl":
+        try:
+            yield path.stem, json.loads(path.read_text())
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+            pass
+        return
+    try:
+        with path.open() as f:
+            for lineno, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    yield f"{path.stem}-{lineno}", json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+    except (OSError, UnicodeDecodeError):
+        return
+
+
+def read_records(path: Path) -> list[tuple[str, Any]]:
+    """All records in one data file; see `iter_records`."""
+    return list(iter_records(path))
+
+
+def iter_data_records(data_path: Path) -> Iterator[Any]:
+    """Stream the records of a data file, or of every data file in a directory."""
+    files = data_files(data_path) if data_path.is_dir() else [data_path]
+    for f in files:
+        for _, record in iter_records(f):
+            yield record
+
 
 def load_data_files(data_dir: Path) -> list[dict[str, Any]]:
-    """Load all JSON data files from a directory."""
-    records = []
-    for f in sorted(data_dir.glob("*.json")):
+    """Load all JSON and JSONL data files from a directory.
+
+    Columnar per-query stores (``*.acfq``) in the same directory are expanded
+    back into per-query-record dicts, so callers see one uniform record list.
+    """
+    records: list[dict[str, Any]] = []
+    for f in data_files(data_dir):
+        records.extend(record for _, record in read_records(f))
+    for f in sorted(data_dir.glob(f"*{COLUMNAR_SUFFIX}")):
         try:
-            records.append(json.loads(f.read_text()))
-        except (json.JSONDecodeError, OSError):
+            records.extend(PerQueryColumns.load(f).iter_records())
+        except (ValueError, OSError):
             continue
     return records
 
 
+def load_per_query_columns(data_dir: Path) -> PerQueryColumns:
+    """Load every per-query record under `data_dir` into one columnar store.
+
+    ``*.acfq`` stores are read column-wise; per-query records still stored as
+    JSON files or JSONL shards are appended to the result. Other record types are
+    ignored.
+    """
+    store = PerQueryColumns()
+    for f in sorted(data_dir.glob(f"*{COLUMNAR_SUFFIX}")):
+        try:
+            loaded = PerQueryColumns.load(f)
+        except (ValueError, OSError):
+            continue
+        store.merge(loaded)
+    for f in data_files(data_dir):
+        store.extend(record for _, record in read_records(f) if isinstance(record, dict))
+    return store
+
+
 def load_profiles(profile_dir: Path) -> list[dict[str, Any]]:
     """Load ACF profile JSON files from a directory."""
 
@@ -109,12 +109,19 @@ class LongitudinalSeries(CommonEnvelope):
 
 @dataclass
 class PerQueryRecord(CommonEnvelope):
-    """Raw per-query data for fine-grained analysis."""
+    """Raw per-query data for fine-grained analysis.
+
+    `response` is the deprecated name of `actual_answer`; `to_dict` writes it
+    as ``actual_answer`` when `actual_answer` is empty.
+    """
 
     record_type: str = "per-query-record"
     query: str = ""
-    response: str = ""
+    response: str = ""  # Deprecated alias of actual_answer
     signals: dict[str, Any] = field(default_factory=dict)
+    query_id: str = ""
+    actual_answer: str = ""
+    correct: bool = False
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -126,8 +133,10 @@ class PerQueryRecord(CommonEnvelope):
             "system_id": self.system_id,
             "measure_id": self.measure_id,
             "collector": self.collector,
+            "query_id": self.query_id,
             "query": self.query,
-            "response": self.response,
+            "actual_answer": self.actual_answer or self.response,
+            "correct": self.correct,
             "signals": self.signals,
             "notes": self.notes,
         }
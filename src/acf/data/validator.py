@@ -1,10 +1,42 @@
-"""Validate ACF data files against expected schemas."""
+"""Validate ACF data files against expected schemas.
+
+`validate_record` is a quick structural check of one record. `SchemaSet`
+enforces the full contracts in ``schemas/*.schema.json``: each
+record-type schema is loaded and compiled once per process, and every
+record is checked against the schema its ``record_type`` names. Without
+the optional ``jsonschema`` package it falls back to the envelope check
+`acf validate` has always made (``record_type``, plus ``measure_id`` for
+all but per-query records).
+
+`validate_files` checks many files across a process pool and yields one
+`FileReport` per file, in input order, as results arrive. `acf validate`
+streams these and totals them in a `ValidationSummary`.
+
+Usage:
+    from acf.data.validator import ValidationSummary, validate_files
+
+    summary = ValidationSummary()
+    for report in validate_files(paths):
+        summary.add(report)
+    print(summary.to_dict())
+"""
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import json
+import os
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import cache, partial
+from pathlib import Path
 from typing import Any
 
+try:
+    import jsonschema
+except ImportError:  # optional: pip install acf-framework[schemas]
+    jsonschema = None  # type: ignore[assignment]
+
 REQUIRED_ENVELOPE_FIELDS = ["record_type", "measure_id"]
 
 VALID_RECORD_TYPES = {"experiment-run", "longitudinal-series", "per-query-record"}
@@ -67,3 +99,210 @@ def validate_record(data: dict[str, Any]) -> ValidationResult:
         warnings=warnings,
         record_type=record_type,
     )
+
+
+# Same two layouts as the knowledge directory (see acf.graph): the wheel's
+# force-included `acf/_data/schemas`, then `<repo-root>/schemas`.
+def _default_schema_dir() -> Path:
+    here = Path(__file__).resolve().parent.parent
+    candidates = (here / "_data" / "schemas", here.parent.parent / "schemas")
+    for candidate in candidates:
+        if candidate.is_dir():
+            return candidate
+    return candidates[-1]
+
+
+SCHEMA_DIR = _default_schema_dir()
+
+# Only this many error messages are kept per file; the count is always exact.
+MAX_FILE_ERRORS = 20
+
+# Below this many files a process pool costs more to start than it saves.
+_PARALLEL_MIN_FILES = 256
+
+
+def _envelope_errors(record: dict[str, Any]) -> list[str]:
+    required = ["record_type"]
+    if record.get("record_type") != "per-query-record":
+        required.append("measure_id")
+    missing = [k for k in required if k not in record]
+    return [f"missing {missing}"] if missing else []
+
+
+def _error_path(error: Any) -> str:
+    return "/".join(str(part) for part in error.absolute_path)
+
+
+class SchemaSet:
+    """The record-type schemas, each compiled once, keyed by ``record_type``."""
+
+    def __init__(self, schema_dir: Path | None = None) -> None:
+        self.validators: dict[str, Any] = {}
+        if jsonschema is None:
+            return
+        schema_dir = schema_dir or SCHEMA_DIR
+        for record_type in sorted(VALID_RECORD_TYPES):
+            path = schema_dir / f"{record_type}.schema.json"
+            if not path.is_file():
+                continue
+            schema = json.loads(path.read_text())
+            cls = jsonschema.validators.validator_for(schema)
+            cls.check_schema(schema)
+            self.validators[record_type] = cls(schema, format_checker=jsonschema.FormatChecker())
+
+    @property
+    def enforcing(self) -> bool:
+        """Whether records are checked against full schemas, not just the envelope."""
+        return bool(self.validators)
+
+    def errors(self, record: Any) -> list[str]:
+        """Every way `record` breaks its schema; empty if it is valid."""
+        if not isinstance(record, dict):
+            return ["not a JSON object"]
+        if not self.enforcing:
+            return _envelope_errors(record)
+        record_type = record.get("record_type")
+        validator = self.validators.get(record_type) if isinstance(record_type, str) else None
+        if validator is None:
+            if "record_type" not in record:
+                return ["missing ['record_type']"]
+            return [f"no schema for record_type {record_type!r}"]
+        found = sorted(validator.iter_errors(record), key=_error_path)
+        return [f"{_error_path(e) or '(record)'}: {e.message}" for e in found]
+
+
+@cache
+def _schema_set(schema_dir: str | None) -> SchemaSet:
+    # One compiled SchemaSet per process (and per schema directory).
+    return SchemaSet(Path(schema_dir) if schema_dir else None)
+
+
+@dataclass
+class FileReport:
+    """The outcome of validating one data file."""
+
+    path: str
+    records: int = 0
+    invalid_records: int = 0
+    record_types: list[str] = field(default_factory=list)
+    n_errors: int = 0
+    errors: list[str] = field(default_factory=list)  # the first MAX_FILE_ERRORS
+
+    @property
+    def valid(self) -> bool:
+        return self.n_errors == 0
+
+    def error(self, message: str) -> None:
+        self.n_errors += 1
+        if len(self.errors) < MAX_FILE_ERRORS:
+            self.errors.append(message)
+
+    def check(self, schemas: SchemaSet, record: Any, where: str = "") -> None:
+        self.records += 1
+        if isinstance(record, dict) and record.get("record_type") not in self.record_types:
+            self.record_types.append(str(record.get("record_type")))
+        errors = schemas.errors(record)
+        if errors:
+            self.invalid_records += 1
+        for message in errors:
+            self.error(f"{where}{message}")
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "path": self.path,
+            "valid": self.valid,
+            "records": self.records,
+            "invalid_records": self.invalid_records,
+            "record_types": self.record_types,
+            "n_errors": self.n_errors,
+            "errors": self.errors,
+        }
+
+
+def validate_file(path: str, schema_dir: str | None = None) -> FileReport:
+    """Validate every record in one ``.json`` file or ``.jsonl`` shard.
+
+    Unlike `acf.data.loader.iter_records`, undecodable JSON is reported
+    rather than skipped. Module-level so `ProcessPoolExecutor` can pickle it.
+    """
+    schemas = _schema_set(schema_dir)
+    report = FileReport(path)
+    file = Path(path)
+    try:
+        if file.suffix != ".jsonl":
+            report.check(schemas, json.loads(file.read_text()))
+            return report
+        with file.open() as f:
+            for lineno, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as e:
+                    report.error(f"line {lineno}: invalid JSON — {e}")
+                    continue
+                report.check(schemas, record, f"line {lineno}: ")
+    except json.JSONDecodeError as e:
+        report.error(f"invalid JSON — {e}")
+    except (OSError, UnicodeDecodeError) as e:
+        report.error(f"unreadable — {e}")
+    return report
+
+
+def validate_files(
+    paths: Sequence[Path],
+    workers: int | None = None,
+    schema_dir: Path | None = None,
+) -> Iterator[FileReport]:
+    """Validate `paths`, yielding one `FileReport` per file in input order.
+
+    With more than one worker the files are spread over a process pool in
+    modest chunks, so reports stream back while the rest are still being
+    checked. `workers` defaults to the CPU count for large batches and to
+    in-process validation for small ones.
+    """
+    if workers is None:
+        workers = (os.cpu_count() or 1) if len(paths) >= _PARALLEL_MIN_FILES else 1
+    check = partial(validate_file, schema_dir=str(schema_dir) if schema_dir else None)
+    names = [str(p) for p in paths]
+    if workers > 1 and len(names) > 1:
+        # Capped so the first reports arrive early even for huge drops.
+        chunksize = max(1, min(64, len(names) // (workers * 4)))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            yield from pool.map(check, names, chunksize=chunksize)
+    else:
+        yield from map(check, names)
+
+
+@dataclass
+class ValidationSummary:
+    """Totals over the `FileReport`s of one validation run."""
+
+    files: int = 0
+    invalid_files: int = 0
+    records: int = 0
+    invalid_records: int = 0
+    schema_enforced: bool = jsonschema is not None
+    seconds: float = 0.0
+
+    @property
+    def valid_files(self) -> int:
+        return self.files - self.invalid_files
+
+    def add(self, report: FileReport) -> None:
+        self.files += 1
+        self.invalid_files += not report.valid
+        self.records += report.records
+        self.invalid_records += report.invalid_records
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "files": self.files,
+            "valid_files": self.valid_files,
+            "invalid_files": self.invalid_files,
+            "records": self.records,
+            "invalid_records": self.invalid_records,
+            "schema_enforced": self.schema_enforced,
+            "seconds": round(self.seconds, 4),
+            "files_per_second": round(self.files / self.seconds, 1) if self.seconds > 0 else 0.0,
+        }
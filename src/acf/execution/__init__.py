@@ -0,0 +1 @@
+"""ACF battery execution: drive a system-under-test over a battery."""
@@ -0,0 +1,174 @@
+"""Concurrent execution of an `AsyncBatteryRunner` over a battery.
+
+A system-under-test behind a remote model server spends nearly all of each
+item waiting on the network, so `AsyncBatteryEngine` keeps up to `concurrency`
+`run_item` coroutines in flight on one event loop instead of tying up a thread
+per item. An optional `rate` caps how many calls start per second, for servers
+that enforce request quotas. Timeouts cancel the awaiting coroutine, unlike
+the thread pool in `acf.execution.engine`, whose abandoned calls run on.
+
+Results, statistics, progress callbacks, checkpointing and response caching
+are the same as in the sync engine, and results come back in battery order.
+
+Usage:
+    from acf.execution.async_engine import AsyncBatteryEngine
+
+    engine = AsyncBatteryEngine(MyAsyncRunner(), concurrency=32, rate=20)
+    results = asyncio.run(engine.run("zorblaxia"))
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterable
+from typing import TYPE_CHECKING
+
+from acf.batteries import AsyncBatteryRunner, BatteryItem, load_battery
+from acf.execution.engine import (
+    ItemResult,
+    RunStats,
+    _describe,
+    _from_cache,
+    _item_id,
+    _resume,
+    _store,
+)
+
+if TYPE_CHECKING:
+    from acf.execution.checkpoint import Checkpoint
+    from acf.execution.response_cache import ResponseCache
+
+
+class RateLimiter:
+    """Space call starts at least ``1 / rate`` seconds apart on one event loop.
+
+    No lock is needed: each `acquire` claims its slot synchronously before
+    awaiting, so concurrent callers on the loop get consecutive slots.
+    """
+
+    def __init__(self, rate: float) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.interval = 1.0 / rate
+        self._next = 0.0
+
+    async def acquire(self) -> None:
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self._next)
+        self._next = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+class AsyncBatteryEngine:
+    """Run an `AsyncBatteryRunner` with bounded concurrency and an optional rate limit."""
+
+    def __init__(
+        self,
+        runner: AsyncBatteryRunner,
+        concurrency: int = 8,
+        rate: float | None = None,
+        timeout: float | None = None,
+        retries: int = 0,
+        on_progress: Callable[[RunStats], None] | None = None,
+        checkpoint: Checkpoint | None = None,
+        cache: ResponseCache | None = None,
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if retries < 0:
+            raise ValueError("retries must be non-negative")
+        self.runner = runner
+        self.concurrency = concurrency
+        self.rate = rate
+        self.timeout = timeout
+        self.retries = retries
+        self.on_progress = on_progress
+        self.checkpoint = checkpoint
+        self.cache = cache
+        self.stats = RunStats()
+
+    async def run(self, battery: str | Iterable[BatteryItem]) -> list[ItemResult]:
+        """Run every item and return all results in battery order."""
+        return [result async for result in self.iter_run(battery)]
+
+    async def iter_run(self, battery: str | Iterable[BatteryItem]) -> AsyncIterator[ItemResult]:
+        """Yield one `ItemResult` per item, in battery order.
+
+        At most ``2 * concurrency`` item tasks exist at once; the semaphore
+        keeps at most `concurrency` of them inside `run_item`. Checkpointed and
+        cached items are replayed without running, as in `BatteryEngine.iter_run`.
+        """
+        name = battery if isinstance(battery, str) else None
+        items = load_battery(battery) if isinstance(battery, str) else battery
+        total = len(items) if isinstance(items, (list, tuple)) else None
+        self.stats = RunStats(total=total)
+        semaphore = asyncio.Semaphore(self.concurrency)
+        limiter = RateLimiter(self.rate) if self.rate else None
+        window = 2 * self.concurrency
+        pending: deque[asyncio.Future[ItemResult]] = deque()
+        loop = asyncio.get_running_loop()
+        try:
+            for index, item in enumerate(items):
+                prior = _resume(self.checkpoint, name, index, item) or _from_cache(
+                    self.cache, index, item,
+                )
+                if prior is not None:
+                    replayed = loop.create_future()
+                    replayed.set_result(self._complete(prior, name, item))
+                    pending.append(replayed)
+                else:
+                    pending.append(asyncio.ensure_future(
+                        self._run_one(index, item, name, semaphore, limiter)
+                    ))
+                if len(pending) >= window:
+                    yield await pending.popleft()
+            while pending:
+                yield await pending.popleft()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _run_one(
+        self,
+        index: int,
+        item: BatteryItem,
+        battery: str | None,
+        semaphore: asyncio.Semaphore,
+        limiter: RateLimiter | None,
+    ) -> ItemResult:
+        attempts = 0
+        while True:
+            attempts += 1
+            async with semaphore:
+                if limiter is not None:
+                    await limiter.acquire()
+                start = time.perf_counter()
+                try:
+                    response = await asyncio.wait_for(self.runner.run_item(item), self.timeout)
+                    error = None
+                except asyncio.TimeoutError:
+                    response, error = None, f"TimeoutError: no result after {self.timeout}s"
+                except Exception as e:  # noqa: BLE001 — a failing item must not end the run
+                    response, error = None, _describe(e)
+                latency = time.perf_counter() - start
+            if error is None or attempts > self.retries:
+                break
+        result = ItemResult(
+            index=index,
+            item_id=_item_id(item, index),
+            response=response,
+            error=error,
+            attempts=attempts,
+            latency_s=latency,
+        )
+        return self._complete(result, battery, item)
+
+    def _complete(self, result: ItemResult, battery: str | None, item: BatteryItem) -> ItemResult:
+        _store(self.checkpoint, self.cache, result, battery, item)
+        self.stats.record(result)
+        if self.on_progress is not None:
+            self.on_progress(self.stats)
+        return result
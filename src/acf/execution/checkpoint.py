@@ -0,0 +1,132 @@
+"""Checkpoint log for resumable battery runs.
+
+A `Checkpoint` is an append-only JSONL file. Each line is one successful item
+result, keyed by (battery, item id, system id, system version). Pass one to
+`BatteryEngine` or `AsyncBatteryEngine` and every finished item is logged as
+soon as it completes. When a killed run is restarted, the items already in the
+log are replayed from it instead of calling the runner again, so a retry costs
+only the missing items.
+
+Failed items are not logged, so a resumed run tries them again. Several
+systems and versions can share one log: the key includes both, and a
+`Checkpoint` only replays the entries for its own system and version. As with
+`acf.measures.sinks.JsonlSink`, a torn last line from a crash is skipped on load
+and terminated before the next append.
+
+Usage:
+    from acf.execution.checkpoint import Checkpoint
+
+    with Checkpoint(Path("runs/fr36.ckpt.jsonl"), "my-ai", "1.2.0") as ckpt:
+        BatteryEngine(runner, checkpoint=ckpt).run("fr36")
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from types import TracebackType
+from typing import IO, TYPE_CHECKING, Any
+
+from acf.execution.engine import ItemResult
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+CheckpointKey = tuple[str, str, str, str]  # (battery, item_id, system_id, system_version)
+
+
+class Checkpoint:
+    """Append-only log of completed items for one system version."""
+
+    def __init__(
+        self,
+        path: Path,
+        system_id: str,
+        system_version: str,
+        fsync: bool = False,
+    ) -> None:
+        self.path = path
+        self.system_id = system_id
+        self.system_version = system_version
+        self.fsync = fsync
+        self._done: dict[CheckpointKey, ItemResult] = {}
+        self._file: IO[str] | None = None
+        self._torn = False
+        self._load()
+
+    def key(self, battery: str, item_id: str) -> CheckpointKey:
+        return (battery, item_id, self.system_id, self.system_version)
+
+    def _load(self) -> None:
+        try:
+            text = self.path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return
+        self._torn = bool(text) and not text.endswith("\n")
+        for line in text.splitlines():
+            try:
+                entry = json.loads(line)
+                key = (entry["battery"], entry["item_id"], entry["system_id"], entry["system_version"])
+                result = entry["result"]
+            except (json.JSONDecodeError, KeyError, TypeError):
+                continue  # torn or foreign line
+            if key[2:] != (self.system_id, self.system_version):
+                continue
+            self._done[key] = ItemResult(
+                index=result.get("index", -1),
+                item_id=key[1],
+                response=result.get("response"),
+                attempts=result.get("attempts", 1),
+                latency_s=result.get("latency_s", 0.0),
+            )
+
+    def __len__(self) -> int:
+        return len(self._done)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._done
+
+    def lookup(self, battery: str, item_id: str) -> ItemResult | None:
+        """Return the logged result for an item, or None if it still has to run."""
+        return self._done.get(self.key(battery, item_id))
+
+    def record(self, battery: str, result: ItemResult) -> None:
+        """Append a successful result to the log. Failed results are ignored."""
+        if not result.ok:
+            return
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = self.path.open("a", encoding="utf-8")
+            if self._torn:
+                self._file.write("\n")
+                self._torn = False
+        entry: dict[str, Any] = {
+            "battery": battery,
+            "item_id": result.item_id,
+            "system_id": self.system_id,
+            "system_version": self.system_version,
+            "result": result.to_dict(),
+        }
+        # One write per line: a crash can tear at most the line being written.
+        self._file.write(json.dumps(entry) + "\n")
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        self._done[self.key(battery, result.item_id)] = result
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
@@ -0,0 +1,421 @@
+"""Concurrent execution of a `BatteryRunner` over a battery.
+
+`BatteryRunner` defines a single `run_item(item)`. `BatteryEngine` drives a runner
+over a battery (or any iterable of items) on a thread or process pool, with a
+per-item timeout, a retry budget, and a progress callback for live readouts.
+Results come back as `ItemResult`s in battery (JSONL) order, which is the order
+the reference scorers consume items in, whatever order they finished in.
+
+Threads suit runners that wait on I/O (model servers, subprocesses) or release
+the GIL. Processes suit CPU-bound runners written in Python. Process workers
+receive a pickled copy of the runner once, when the worker starts.
+
+A timed-out attempt is abandoned, not interrupted: Python cannot stop a running
+thread, and the pool keeps its worker busy until `run_item` returns. The item is
+retried or recorded as failed right away, so one hung call cannot stall a run.
+Items are handed to the pool only when a worker is free to start them, so an
+item's timeout covers its own run, never time spent queued behind others. If
+every worker is held by an abandoned attempt for a further `timeout`, the items
+waiting for one fail with a "no free worker" timeout. Size `workers` with that
+in mind.
+
+Usage:
+    from acf.execution.engine import BatteryEngine
+
+    engine = BatteryEngine(MyRunner(), workers=8, timeout=30, retries=2)
+    for result in engine.run("fr36"):
+        print(result.item_id, result.ok, result.latency_s)
+"""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Literal
+
+from acf.batteries import BatteryItem, BatteryRunner, load_battery
+from acf.utils.stats import mean, percentile
+
+if TYPE_CHECKING:
+    from acf.execution.checkpoint import Checkpoint
+    from acf.execution.response_cache import ResponseCache
+
+PoolKind = Literal["thread", "process"]
+
+
+@dataclass
+class ItemResult:
+    """The outcome of running one battery item."""
+
+    index: int                    # position in the battery (JSONL order)
+    item_id: str
+    response: dict | None         # what run_item returned; None on failure
+    error: str | None = None      # last failure, e.g. "TimeoutError: ..." when not ok
+    attempts: int = 1
+    latency_s: float = 0.0        # duration of the final attempt
+    resumed: bool = False         # replayed from a checkpoint, not run
+    cached: bool = False          # answered from a response cache, not run
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "index": self.index,
+            "item_id": self.item_id,
+            "ok": self.ok,
+            "response": self.response,
+            "error": self.error,
+            "attempts": self.attempts,
+            "latency_s": round(self.latency_s, 6),
+            "resumed": self.resumed,
+            "cached": self.cached,
+        }
+
+
+@dataclass
+class RunStats:
+    """Running totals for a battery run, passed to progress callbacks."""
+
+    total: int | None = None      # None while the item count is unknown
+    completed: int = 0            # includes checkpoint replays and cache hits
+    resumed: int = 0
+    cached: int = 0
+    failed: int = 0
+    retries: int = 0
+    started: float = field(default_factory=time.perf_counter)
+    latencies: list[float] = field(default_factory=list)
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    @property
+    def items_per_second(self) -> float:
+        """Throughput of items actually run (checkpoint replays and cache hits are free)."""
+        run = self.completed - self.resumed - self.cached
+        return run / self.elapsed if self.elapsed > 0 else 0.0
+
+    def latency_ms(self, p: float) -> float:
+        """The p-th percentile latency of completed items, in milliseconds."""
+        return percentile(self.latencies, p) * 1000
+
+    def record(self, result: ItemResult) -> None:
+        self.completed += 1
+        if result.resumed:
+            self.resumed += 1
+            return
+        if result.cached:
+            self.cached += 1
+            return
+        self.failed += not result.ok
+        self.retries += result.attempts - 1
+        self.latencies.append(result.latency_s)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "total": self.total,
+            "completed": self.completed,
+            "resumed": self.resumed,
+            "cached": self.cached,
+            "failed": self.failed,
+            "retries": self.retries,
+            "seconds": round(self.elapsed, 3),
+            "items_per_second": round(self.items_per_second, 2),
+            "latency_ms_mean": round(mean(self.latencies) * 1000, 2),
+            "latency_ms_p50": round(self.latency_ms(50), 2),
+            "latency_ms_p95": round(self.latency_ms(95), 2),
+        }
+
+
+def _item_id(item: BatteryItem, index: int) -> str:
+    return str(item.get("id", f"#{index}"))
+
+
+def _describe(error: BaseException) -> str:
+    return f"{type(error).__name__}: {error}"
+
+
+def _resume(
+    checkpoint: Checkpoint | None, battery: str | None, index: int, item: BatteryItem,
+) -> ItemResult | None:
+    """Return the checkpointed result for `item`, re-indexed for this run, if any."""
+    if checkpoint is None:
+        return None
+    prior = checkpoint.lookup(_battery_of(item, battery), _item_id(item, index))
+    if prior is None:
+        return None
+    return ItemResult(
+        index=index, item_id=prior.item_id, response=prior.response,
+        attempts=prior.attempts, latency_s=prior.latency_s, resumed=True,
+    )
+
+
+def _from_cache(cache: ResponseCache | None, index: int, item: BatteryItem) -> ItemResult | None:
+    """Return a result built from the cached response for `item`, if any."""
+    if cache is None:
+        return None
+    response = cache.get(item)
+    if response is None:
+        return None
+    return ItemResult(index=index, item_id=_item_id(item, index), response=response, cached=True)
+
+
+def _battery_of(item: BatteryItem, battery: str | None) -> str:
+    """The checkpoint key's battery: the item's own tag, else the name it was loaded by."""
+    return str(item.get("battery") or battery or "")
+
+
+def _store(
+    checkpoint: Checkpoint | None,
+    cache: ResponseCache | None,
+    result: ItemResult,
+    battery: str | None,
+    item: BatteryItem,
+) -> None:
+    """Log a freshly finished result to the checkpoint and response cache."""
+    if result.resumed:
+        return
+    if checkpoint is not None:
+        checkpoint.record(_battery_of(item, battery), result)
+    if cache is not None and result.ok and not result.cached and result.response is not None:
+        cache.put(item, result.response)
+
+
+def _timed_call(runner: BatteryRunner, item: BatteryItem) -> tuple[dict, float]:
+    start = time.perf_counter()
+    response = runner.run_item(item)
+    return response, time.perf_counter() - start
+
+
+# Process workers get the runner once, through the pool initializer, rather
+# than a pickled copy with every item.
+_worker_runner: BatteryRunner | None = None
+
+
+def _init_worker(runner: BatteryRunner) -> None:
+    global _worker_runner
+    _worker_runner = runner
+
+
+def _run_in_worker(item: BatteryItem) -> tuple[dict, float]:
+    assert _worker_runner is not None
+    return _timed_call(_worker_runner, item)
+
+
+@dataclass
+class _Pending:
+    index: int
+    item: BatteryItem
+    attempts: int
+    started: float
+
+
+class BatteryEngine:
+    """Run a `BatteryRunner` over battery items concurrently, yielding ordered results."""
+
+    def __init__(
+        self,
+        runner: BatteryRunner,
+        workers: int = 4,
+        pool: PoolKind = "thread",
+        timeout: float | None = None,
+        retries: int = 0,
+        on_progress: Callable[[RunStats], None] | None = None,
+        checkpoint: Checkpoint | None = None,
+        cache: ResponseCache | None = None,
+    ) -> None:
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if retries < 0:
+            raise ValueError("retries must be non-negative")
+        if pool not in ("thread", "process"):
+            raise ValueError(f"Unknown pool {pool!r}; expected 'thread' or 'process'")
+        self.runner = runner
+        self.workers = workers
+        self.pool = pool
+        self.timeout = timeout
+        self.retries = retries
+        self.on_progress = on_progress
+        self.checkpoint = checkpoint
+        self.cache = cache
+        self.stats = RunStats()
+
+    def run(self, battery: str | Iterable[BatteryItem]) -> list[ItemResult]:
+        """Run every item and return all results in battery order."""
+        return list(self.iter_run(battery))
+
+    def iter_run(self, battery: str | Iterable[BatteryItem]) -> Iterator[ItemResult]:
+        """Yield one `ItemResult` per item, in battery order, as results become available.
+
+        `battery` is a battery name or any iterable of items. Items are pulled
+        lazily and at most ``2 * workers`` are in flight or waiting to be
+        yielded at once, so memory stays bounded on long item streams.
+
+        With a `checkpoint`, items it already holds are yielded from it
+        (``resumed=True``) without running, and each newly successful item
+        is logged to it as soon as it finishes. With a `cache`, items it has
+        a response for are yielded from it (``cached=True``), and new
+        successful responses are stored in it.
+        """
+        name = battery if isinstance(battery, str) else None
+        items = load_battery(battery) if isinstance(battery, str) else battery
+        total = len(items) if isinstance(items, (list, tuple)) else None
+        self.stats = RunStats(total=total)
+        executor = self._executor()
+        try:
+            yield from self._drive(executor, enumerate(items), name)
+        finally:
+            # Abandoned (timed-out) attempts must not block the caller here.
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _executor(self) -> Executor:
+        if self.pool == "process":
+            return ProcessPoolExecutor(
+                max_workers=self.workers, initializer=_init_worker, initargs=(self.runner,),
+            )
+        return ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="acf-battery")
+
+    def _submit(self, executor: Executor, item: BatteryItem) -> Future[tuple[dict, float]]:
+        if self.pool == "process":
+            return executor.submit(_run_in_worker, item)
+        return executor.submit(_timed_call, self.runner, item)
+
+    def _drive(
+        self,
+        executor: Executor,
+        source: Iterator[tuple[int, BatteryItem]],
+        battery: str | None,
+    ) -> Iterator[ItemResult]:
+        window = 2 * self.workers
+        queued: deque[_Pending] = deque()  # waiting for a free worker
+        running: dict[Future[tuple[dict, float]], _Pending] = {}
+        stuck: set[Future[Any]] = set()     # abandoned attempts still holding a worker
+        done: dict[int, ItemResult] = {}
+        next_index = 0
+        exhausted = False
+        starved_since: float | None = None
+
+        while True:
+            # Keep the pipeline full without running ahead of the ordered output.
+            while not exhausted and len(queued) + len(running) + len(done) < window:
+                try:
+                    index, item = next(source)
+                except StopIteration:
+                    exhausted = True
+                    break
+                prior = _resume(self.checkpoint, battery, index, item) or _from_cache(
+                    self.cache, index, item,
+                )
+                if prior is not None:
+                    self._complete(done, prior, battery, item)
+                    continue
+                queued.append(_Pending(index, item, 1, 0.0))
+
+            # Submit only when a worker is free to start the item at once, so
+            # its timeout clock never runs while it sits in the executor's queue.
+            stuck = {f for f in stuck if not f.done()}
+            while queued and len(running) + len(stuck) < self.workers:
+                pending = queued.popleft()
+                pending.started = time.perf_counter()
+                running[self._submit(executor, pending.item)] = pending
+
+            while next_index in done:
+                yield done.pop(next_index)
+                next_index += 1
+            if not running and not queued:
+                if exhausted:
+                    return
+                continue
+
+            if not running:
+                # Every worker is held by an abandoned attempt. Queued items get
+                # one timeout's grace for a worker to free up, then fail.
+                assert self.timeout is not None  # only timeouts abandon attempts
+                now = time.perf_counter()
+                starved_since = starved_since if starved_since is not None else now
+                grace = max(0.0, starved_since + self.timeout - now)
+                wait(stuck, timeout=grace, return_when=FIRST_COMPLETED)
+                now = time.perf_counter()
+                if now - starved_since >= self.timeout and all(not f.done() for f in stuck):
+                    message = f"TimeoutError: no free worker after {self.timeout}s"
+                    while queued:
+                        self._finish(done, queued.popleft(), None, message, 0.0, battery)
+                    starved_since = None
+                continue
+            starved_since = None
+
+            finished, _ = wait(
+                [*running, *stuck], timeout=self._wait_timeout(running), return_when=FIRST_COMPLETED,
+            )
+            now = time.perf_counter()
+            for future in list(running):
+                pending = running[future]
+                if future in finished:
+                    error = future.exception()
+                    if error is None:
+                        response, latency = future.result()
+                        self._finish(done, pending, response, None, latency, battery)
+                        del running[future]
+                        continue
+                    message = _describe(error)
+                elif self.timeout is not None and now - pending.started >= self.timeout:
+                    if not future.cancel():
+                        stuck.add(future)
+                    message = f"TimeoutError: no result after {self.timeout}s"
+                else:
+                    continue
+                del running[future]
+                if pending.attempts <= self.retries:
+                    queued.appendleft(_Pending(pending.index, pending.item, pending.attempts + 1, 0.0))
+                else:
+                    self._finish(done, pending, None, message, now - pending.started, battery)
+
+    def _wait_timeout(self, running: dict[Future[Any], _Pending]) -> float | None:
+        if self.timeout is None:
+            return None
+        oldest = min(p.started for p in running.values())
+        return max(0.0, oldest + self.timeout - time.perf_counter())
+
+    def _finish(
+        self,
+        done: dict[int, ItemResult],
+        pending: _Pending,
+        response: dict | None,
+        error: str | None,
+        latency: float,
+        battery: str | None,
+    ) -> None:
+        result = ItemResult(
+            index=pending.index,
+            item_id=_item_id(pending.item, pending.index),
+            response=response,
+            error=error,
+            attempts=pending.attempts,
+            latency_s=latency,
+        )
+        self._complete(done, result, battery, pending.item)
+
+    def _complete(
+        self,
+        done: dict[int, ItemResult],
+        result: ItemResult,
+        battery: str | None,
+        item: BatteryItem,
+    ) -> None:
+        done[result.index] = result
+        _store(self.checkpoint, self.cache, result, battery, item)
+        self.stats.record(result)
+        if self.on_progress is not None:
+            self.on_progress(self.stats)
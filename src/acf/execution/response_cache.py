@@ -0,0 +1,220 @@
+"""Content-addressed on-disk cache of `run_item` responses.
+
+Re-scoring a system build after a change to the scoring procedure should not
+re-run the system. A `ResponseCache` stores each successful `run_item` response
+under a key made from:
+
+- a hash of the item's canonical JSON, so an edited item misses while an
+  unchanged one hits wherever it sits in the battery;
+- the system id and system version;
+- the runner config (model, temperature, prompt template...), so changing
+  how the system is driven also misses. Only declared, public settings go
+  into the key: plain JSON values as they are, an object's ``cache_key()``
+  or ``to_dict()`` if it has one, a dataclass by its public fields (leave a
+  field out with ``field(compare=False)``, e.g. for an SDK client), paths as
+  strings. Anything else raises `TypeError`: keying on an object's private
+  state (session ids, counters, locks) would miss on every run.
+
+Pass one to `BatteryEngine` or `AsyncBatteryEngine` and items with a cached
+response are answered from it (``cached=True``) without calling the runner.
+
+Entries are one small JSON file each under ``<cache_root>/responses``. Hits
+bump the file's mtime, and when the cache grows past `max_bytes` or
+`max_entries` the least recently used entries are deleted first. The totals
+are tracked per process, so several processes sharing a cache can each
+overshoot the limit briefly before one of them evicts.
+
+Unlike a `Checkpoint`, which belongs to one run and replays it in order, the
+cache is shared across runs, batteries and scoring changes. Failed responses
+are never cached.
+
+Usage:
+    from acf.execution.response_cache import ResponseCache
+
+    cache = ResponseCache("my-ai", "1.2.0", runner_config={"model": "m-7b"})
+    BatteryEngine(runner, cache=cache).run("fr36")
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import os
+from pathlib import Path, PurePath
+from typing import Any
+
+from acf.batteries import BatteryItem
+from acf.utils.cache import atomic_write_bytes, cache_root
+
+_ENTRY_SUFFIX = ".json"
+
+
+def item_hash(item: BatteryItem) -> str:
+    """SHA-256 of the item's canonical JSON (sorted keys, no whitespace)."""
+    canonical = json.dumps(item, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _config_json(value: Any) -> Any:
+    """`json.dumps` fallback for runner configs that are not plain JSON."""
+    for method in ("cache_key", "to_dict"):
+        encode = getattr(value, method, None)
+        if callable(encode) and not isinstance(value, type):
+            return encode()
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {
+            f.name: getattr(value, f.name)
+            for f in dataclasses.fields(value)
+            if f.compare and not f.name.startswith("_")
+        }
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    if isinstance(value, PurePath):
+        return str(value)
+    raise TypeError(
+        f"cannot key the response cache on a {type(value).__name__}: give it a "
+        "cache_key() or to_dict() method, or make it a dataclass"
+    )
+
+
+class ResponseCache:
+    """LRU-evicted, content-addressed store of runner responses for one system build."""
+
+    def __init__(
+        self,
+        system_id: str,
+        system_version: str,
+        runner_config: Any = None,
+        directory: Path | None = None,
+        max_bytes: int = 256 << 20,
+        max_entries: int | None = None,
+    ) -> None:
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        if max_entries is not None and max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self.system_id = system_id
+        self.system_version = system_version
+        self.runner_config = runner_config
+        if directory is None:
+            root = cache_root()
+            directory = root / "responses" if root is not None else None
+        self.directory = directory  # None: caching disabled, every lookup misses
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        # The part of the key shared by every item of this system build.
+        self._scope = json.dumps(
+            [system_id, system_version, runner_config],
+            sort_keys=True, separators=(",", ":"), default=_config_json,
+        )
+        self._usage: tuple[int, int] | None = None  # (entries, bytes), scanned on first put
+
+    @property
+    def enabled(self) -> bool:
+        return self.directory is not None
+
+    def key(self, item: BatteryItem) -> str:
+        h = hashlib.sha256(item_hash(item).encode("ascii"))
+        h.update(b"\0")
+        h.update(self._scope.encode("utf-8"))
+        return h.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        assert self.directory is not None
+        # Two-level fan-out keeps directories small on large caches.
+        return self.directory / key[:2] / f"{key}{_ENTRY_SUFFIX}"
+
+    def get(self, item: BatteryItem) -> dict | None:
+        """Return the cached response for `item`, or None on a miss."""
+        if self.directory is None:
+            self.misses += 1
+            return None
+        path = self._path(self.key(item))
+        try:
+            response = json.loads(path.read_bytes())["response"]
+        except (OSError, ValueError, KeyError, TypeError):
+            response = None  # missing, evicted, or torn by a crash
+        if not isinstance(response, dict):
+            self.misses += 1
+            return None
+        try:
+            os.utime(path)  # mark as recently used
+        except OSError:
+            pass
+        self.hits += 1
+        return response
+
+    def put(self, item: BatteryItem, response: dict) -> None:
+        """Store a response, then evict least recently used entries if over budget."""
+        if self.directory is None:
+            return
+        path = self._path(self.key(item))
+        data = json.dumps({
+            "item_id": item.get("id"),
+            "system_id": self.system_id,
+            "system_version": self.system_version,
+            "response": response,
+        }).encode("utf-8")
+        entries, size = self._scan() if self._usage is None else self._usage
+        try:
+            previous = path.stat().st_size
+        except OSError:
+            previous = None
+        try:
+            atomic_write_bytes(path, data)
+        except OSError:
+            return  # a read-only cache just means the next run misses too
+        if previous is None:
+            entries, size = entries + 1, size + len(data)
+        else:
+            size += len(data) - previous
+        self._usage = (entries, size)
+        if size > self.max_bytes or (self.max_entries is not None and entries > self.max_entries):
+            self.evict()
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        if self.directory is None or not self.directory.is_dir():
+            return []
+        found = []
+        for path in self.directory.glob(f"*/*{_ENTRY_SUFFIX}"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue  # evicted by another process mid-scan
+            found.append((st.st_mtime, st.st_size, path))
+        return found
+
+    def _scan(self) -> tuple[int, int]:
+        found = self._entries()
+        return len(found), sum(size for _, size, _ in found)
+
+    def evict(self) -> int:
+        """Delete least recently used entries down to 90% of the limits; return how many."""
+        found = sorted(self._entries())
+        entries, size = len(found), sum(s for _, s, _ in found)
+        # Evicting below the limit leaves headroom, so a full cache is not
+        # rescanned on every put.
+        byte_goal = self.max_bytes * 9 // 10
+        entry_goal = self.max_entries * 9 // 10 if self.max_entries is not None else None
+        removed = 0
+        for _, entry_size, path in found:
+            if size <= byte_goal and (entry_goal is None or entries <= entry_goal):
+                break
+            path.unlink(missing_ok=True)
+            entries -= 1
+            size -= entry_size
+            removed += 1
+        self._usage = (entries, size)
+        return removed
+
+    def clear(self) -> None:
+        """Delete every entry in the cache directory (all systems and versions)."""
+        for _, _, path in self._entries():
+            path.unlink(missing_ok=True)
+        self._usage = (0, 0)
+
+    def __len__(self) -> int:
+        return self._scan()[0]
@@ -5,24 +5,48 @@ Loads all knowledge files (dimensions, levels, measures, hypotheses, config)
 into a unified RDF graph via yurtle-rdflib. Optionally ingests JSON data files
 as triples for unified SPARQL querying.
 
+The parsed knowledge graph is snapshotted to the ACF cache directory (see
+`acf.utils.cache.cache_root`) keyed by a content hash of the knowledge files,
+so only the first construction after an edit pays the Markdown parse.
+
 Usage:
     from acf.graph import ACFGraph
 
     graph = ACFGraph()  # Loads bundled knowledge/
     graph = ACFGraph(data_dir=Path("my-evaluation/data"))  # + data
+    graph = ACFGraph(use_cache=False)  # Always re-parse knowledge/
 """
 
 from __future__ import annotations
 
+import hashlib
+import heapq
 import json
-from dataclasses import dataclass, field
+import os
+import pickle
+import re
+import time
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+from importlib.metadata import PackageNotFoundError
+from importlib.metadata import version as _dist_version
 from pathlib import Path
-from typing import Any, cast
+from typing import Any, TypeVar, cast
 
 import yurtle_rdflib
 from rdflib import Graph, Literal, Namespace
 from rdflib.namespace import RDF, RDFS, XSD
-from rdflib.query import ResultRow
+from rdflib.plugins.sparql import prepareQuery
+from rdflib.plugins.sparql.sparql import Query
+from rdflib.query import Result, ResultRow
+from rdflib.term import Identifier, Node, URIRef, Variable
+
+from acf.data.loader import data_files, read_records
+from acf.utils.cache import atomic_write_bytes, cache_root, hash_files
+
+_T = TypeVar("_T")
 
 # ACF namespace for all framework-specific predicates
 ACF = Namespace("https://acf-framework.dev/ns/")
@@ -45,6 +69,106 @@ def _default_knowledge_dir() -> Path:
 
 KNOWLEDGE_DIR = _default_knowledge_dir()
 
+# Bumped whenever the snapshot layout changes, so stale pickles from an older
+# acf-framework are ignored rather than misread.
+_GRAPH_CACHE_FORMAT = "acf-graph-1"
+
+# Snapshots kept per cache directory. Each knowledge edit writes a new one, so
+# older ones are pruned (least recently used first); a few are kept so that
+# several checkouts sharing one cache do not evict each other on every run.
+_GRAPH_SNAPSHOTS_KEPT = 4
+
+
+def _package_version(dist: str) -> str:
+    try:
+        return _dist_version(dist)
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def _knowledge_cache_key(knowledge_dir: Path) -> str:
+    """Content hash of everything `load_workspace` would read from `knowledge_dir`.
+
+    The resolved directory is part of the key because yurtle-rdflib records an
+    absolute ``file://`` provenance triple per document; the parser versions are
+    part of it because a parser upgrade can change the triples for identical bytes.
+    """
+    root = knowledge_dir.resolve()
+    files = [
+        p for p in root.glob("**/*.md")
+        if p.is_file() and not p.name.startswith(".")
+    ]
+    return hash_files(root, files, extra=(
+        _GRAPH_CACHE_FORMAT,
+        str(root),
+        _package_version("yurtle-rdflib"),
+        _package_version("rdflib"),
+    ))
+
+
+def _read_snapshot(path: Path) -> Graph | None:
+    """Unpickle a graph snapshot; None if it is missing, corrupt or not a graph."""
+    try:
+        graph = pickle.loads(path.read_bytes())
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return None
+    return graph if isinstance(graph, Graph) else None
+
+
+def _write_snapshot(path: Path, graph: Graph) -> bool:
+    """Pickle `graph` to `path` atomically; an unwritable cache is not an error."""
+    try:
+        atomic_write_bytes(path, pickle.dumps(graph, protocol=pickle.HIGHEST_PROTOCOL))
+    except OSError:
+        return False
+    return True
+
+
+def _prune_snapshots(keep: Path) -> None:
+    """Delete all but the `_GRAPH_SNAPSHOTS_KEPT` most recently used snapshots beside `keep`."""
+    def _mtime(path: Path) -> float:
+        try:
+            return path.stat().st_mtime
+        except OSError:
+            return 0.0
+
+    others = sorted(
+        (p for p in keep.parent.glob("*.pickle") if p != keep),
+        key=_mtime, reverse=True,
+    )
+    for stale in others[_GRAPH_SNAPSHOTS_KEPT - 1:]:
+        try:
+            stale.unlink()
+        except OSError:
+            pass  # another process got there first, or the cache is read-only
+
+
+def _load_knowledge_graph(
+    knowledge_dir: Path,
+    cache_dir: Path | None,
+    key: str | None = None,
+) -> Graph:
+    """Load `knowledge_dir`, from a pickled snapshot when one matches its content hash.
+
+    Any failure to read or write the snapshot falls back to a plain parse: the
+    cache is an accelerator, never a new way for `ACFGraph()` to fail.
+    """
+    if cache_dir is None:
+        return yurtle_rdflib.load_workspace(str(knowledge_dir))
+
+    snapshot = cache_dir / "graph" / f"{key or _knowledge_cache_key(knowledge_dir)}.pickle"
+    graph = _read_snapshot(snapshot)
+    if graph is None:
+        graph = yurtle_rdflib.load_workspace(str(knowledge_dir))
+        if _write_snapshot(snapshot, graph):
+            _prune_snapshots(snapshot)
+    else:
+        try:
+            os.utime(snapshot)  # mark it recently used, so pruning keeps it
+        except OSError:
+            pass
+    return graph
+
 
 @dataclass
 class Dimension:
@@ -104,6 +228,14 @@ class Hypothesis:
     status: str = "pending"
 
 
+@dataclass
+class _MeasureIndex:
+    """Materialized measures keyed by ID and by mapped dimension ID."""
+
+    by_id: dict[str, Measure]
+    by_dimension: dict[str, list[Measure]]
+
+
 @dataclass
 class DataPoint:
     """A data point from ingested JSON."""
@@ -116,23 +248,318 @@ class DataPoint:
     timestamp: str = ""
 
 
+@dataclass
+class IngestStats:
+    """Throughput of one `ACFGraph.ingest` call."""
+
+    files: int = 0
+    records: int = 0
+    triples: int = 0
+    seconds: float = 0.0
+    reused: int = 0   # incremental mode: files served from the snapshot unparsed
+    deleted: int = 0  # incremental mode: files gone since the last run
+
+    @property
+    def records_per_second(self) -> float:
+        return self.records / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def triples_per_second(self) -> float:
+        return self.triples / self.seconds if self.seconds > 0 else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "files": self.files,
+            "records": self.records,
+            "triples": self.triples,
+            "seconds": round(self.seconds, 4),
+            "records_per_second": round(self.records_per_second, 1),
+            "triples_per_second": round(self.triples_per_second, 1),
+            "reused": self.reused,
+            "deleted": self.deleted,
+        }
+
+
+_Triple = tuple[Node, Node, Node]
+_Quad = tuple[Node, Node, Node, Graph]
+
+# Below this many files a process pool costs more to start than it saves.
+_PARALLEL_MIN_FILES = 256
+
+_ENVELOPE_FIELDS = (
+    "measure_id", "system_id", "system_version",
+    "experiment_id", "timestamp", "collector", "notes",
+)
+# NuSy-era field names accepted as fallbacks for the ACF envelope fields.
+_LEGACY_FIELDS = {"system_id": "being", "experiment_id": "expedition"}
+
+
+# Term constructors are memoized: rdflib term construction dominates ingestion
+# time, and envelope values (system ids, versions, measure ids, collectors,
+# booleans, small integers) repeat across nearly every record. `typed=True`
+# keeps 1, 1.0 and True apart — they hash equal but are distinct literals.
+_TERM_CACHE_SIZE = 1 << 16
+
+
+@lru_cache(maxsize=_TERM_CACHE_SIZE)
+def _acf_term(name: str) -> URIRef:
+    return ACF[name]
+
+
+@lru_cache(maxsize=_TERM_CACHE_SIZE)
+def _plain_literal(value: str) -> Literal:
+    return Literal(value)
+
+
+@lru_cache(maxsize=_TERM_CACHE_SIZE, typed=True)
+def _double_literal(value: float) -> Literal:
+    return Literal(value, datatype=XSD.double)
+
+
+@lru_cache(maxsize=2, typed=True)
+def _boolean_literal(value: Any) -> Literal:
+    return Literal(value, datatype=XSD.boolean)
+
+
+def _typed_literal(value: Any) -> Literal:
+    if isinstance(value, (int, float)):
+        return _double_literal(value)
+    return _plain_literal(str(value))
+
+
+def _record_triples(record: dict[str, Any], record_id: str) -> list[_Triple]:
+    """Convert a single JSON record to RDF triples."""
+    subject = ACF[f"data/{record_id}"]
+    record_type = record.get("record_type", "unknown")
+    triples: list[_Triple] = [
+        (subject, RDF.type, ACF.DataRecord),
+        (subject, ACF.recordType, _plain_literal(str(record_type))),
+    ]
+
+    # Common envelope fields
+    for field_name in _ENVELOPE_FIELDS:
+        # Support both NuSy field names and ACF field names
+        value = record.get(field_name) or record.get(_LEGACY_FIELDS.get(field_name, ""))
+        if value:
+            triples.append((subject, _acf_term(field_name), _plain_literal(str(value))))
+
+    # Link to measure node
+    measure_id = record.get("measure_id", "")
+    if measure_id:
+        triples.append((subject, ACF.measure, _acf_term(measure_id)))
+
+    # Record-type-specific fields
+    if record_type == "experiment-run":
+        for field_name in ("value", "target", "n", "comparison"):
+            if field_name in record:
+                triples.append(
+                    (subject, _acf_term(field_name), _typed_literal(record[field_name]))
+                )
+        if "pass" in record:
+            triples.append((subject, ACF.passed, _boolean_literal(record["pass"])))
+
+    elif record_type == "longitudinal-series":
+        for i, dp in enumerate(record.get("data_points", [])):
+            dp_node = ACF[f"data/{record_id}/dp{i}"]
+            triples.append((subject, ACF.dataPoint, dp_node))
+            triples.append((dp_node, RDF.type, ACF.DataPoint))
+            for k, v in dp.items():
+                triples.append((dp_node, _acf_term(k), _typed_literal(v)))
+
+    return triples
+
+
+def _read_data_file(path: str) -> list[tuple[str, Any]]:
+    """Read and decode the ``(record_id, record)`` pairs in one data file.
+
+    This is the half of ingestion that runs in worker processes. It returns
+    plain decoded JSON rather than rdflib terms: terms are costly to pickle
+    back to the parent, while decoded records round-trip cheaply, and term
+    construction is memoized in the parent anyway. Module-level (not a method)
+    so `ProcessPoolExecutor` can pickle it by name.
+    """
+    return read_records(Path(path))
+
+
+_DATA_STATE_FORMAT = "acf-data-1"
+
+
+@dataclass
+class _ManifestEntry:
+    """What the incremental manifest remembers about one ingested data file."""
+
+    mtime_ns: int
+    size: int
+    sha256: str
+    subjects: list[str]
+
+
+@dataclass
+class _DataState:
+    """Persisted incremental-ingestion state for one data directory.
+
+    Lives under ``<cache>/data/<hash of resolved data_dir>/`` as a JSON
+    manifest plus a pickled snapshot of the COMBINED graph (knowledge + data).
+    Snapshotting the combined graph is deliberate: merging a separate data
+    graph back in costs a full ``addN`` — the same store-insert work as
+    re-ingesting — whereas one unpickle restores both halves. The manifest
+    pins the knowledge cache key, so a knowledge edit forces a cold start.
+    """
+
+    root: Path
+    knowledge_key: str
+    files: dict[str, _ManifestEntry]
+    graph: Graph | None
+
+    @classmethod
+    def load(cls, cache_dir: Path, data_dir: Path, knowledge_key: str) -> _DataState:
+        key = hashlib.sha256(str(data_dir.resolve()).encode("utf-8")).hexdigest()[:24]
+        root = cache_dir / "data" / key
+        cold = cls(root=root, knowledge_key=knowledge_key, files={}, graph=None)
+        try:
+            manifest = json.loads((root / "manifest.json").read_text())
+            if (manifest.get("format"), manifest.get("knowledge")) != (
+                _DATA_STATE_FORMAT, knowledge_key,
+            ):
+                return cold
+            files = {
+                name: _ManifestEntry(**entry) for name, entry in manifest["files"].items()
+            }
+        except (OSError, ValueError, KeyError, TypeError):
+            # Missing or unreadable state is a cold start, never an error.
+            return cold
+        graph = _read_snapshot(root / "graph.pickle")
+        if graph is None:
+            return cold
+        return cls(root=root, knowledge_key=knowledge_key, files=files, graph=graph)
+
+    def save(self, graph: Graph) -> None:
+        # Snapshot first, manifest second: a crash in between leaves the old
+        # manifest beside a newer snapshot, and on the next run every changed
+        # file is diffed — and its subjects removed — all over again.
+        _write_snapshot(self.root / "graph.pickle", graph)
+        manifest = {
+            "format": _DATA_STATE_FORMAT,
+            "knowledge": self.knowledge_key,
+            "files": {name: asdict(entry) for name, entry in sorted(self.files.items())},
+        }
+        try:
+            atomic_write_bytes(self.root / "manifest.json", json.dumps(manifest).encode("utf-8"))
+        except OSError:
+            pass
+
+
+# Parsed + algebrized SPARQL, keyed by query text and the prefixes it was
+# resolved against (prefixes are bound at prepare time, not at execution).
+_PREPARED_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=_PREPARED_CACHE_SIZE)
+def _prepare_query(sparql: str, namespaces: tuple[tuple[str, str], ...]) -> Query:
+    return prepareQuery(sparql, initNs=dict(namespaces))
+
+
+@dataclass
+class QueryStream:
+    """Lazy rows of a SPARQL query plus the variables it projects.
+
+    `variables` is known before the first row, which lets writers emit a
+    header (CSV) without buffering. Iterate it exactly once.
+    """
+
+    variables: list[str]
+    rows: Iterator[dict[str, str]]
+
+    def __iter__(self) -> Iterator[dict[str, str]]:
+        return self.rows
+
+
+def _result_rows(results: Result) -> Iterator[dict[str, str]]:
+    """Yield `results` as ``{variable: str(value)}`` dicts, omitting unbound variables.
+
+    For SELECT, rdflib's lazy binding generator is drained directly: iterating
+    the ``Result`` object instead appends every row to an internal list, which
+    defeats streaming.
+    """
+    variables = results.vars or []
+    # `_genbindings` is private to rdflib (stable through 7.x). It is None once
+    # the result has been iterated, and missing if a future rdflib drops it;
+    # either way the public iteration below still gives the right rows, just
+    # buffered. TestStreamingQuery flags the loss of streaming.
+    pending = getattr(results, "_genbindings", None) if results.type == "SELECT" else None
+    if pending is not None:
+        for solution in pending:
+            if solution:  # rdflib skips the empty solution too
+                yield {
+                    str(var): str(solution[var])
+                    for var in variables if solution.get(var) is not None
+                }
+        return
+    for item in results:
+        row = cast(ResultRow, item)
+        yield {str(var): str(row[var]) for var in variables if row[var] is not None}
+
+
+def _timestamp_key(point: DataPoint) -> str:
+    return point.timestamp
+
+
+def _version_key(version: str) -> tuple[tuple[int, int | str], ...]:
+    """Sort key for version strings: numeric parts numerically, the rest lexically.
+
+    ``"1.10.0"`` sorts after ``"1.9.2"``, and a leading ``v`` is ignored. Numeric
+    parts sort before textual ones at the same position, so ``"1.0.0"`` sorts
+    before ``"1.0.0-rc1"`` — good enough for range filters, not a SemVer engine.
+    """
+    parts = re.split(r"[.\-+_]", version.strip().lstrip("vV"))
+    return tuple((0, int(p)) if p.isdigit() else (1, p) for p in parts if p)
+
+
 class ACFGraph:
     """Central knowledge graph for the ACF framework.
 
     Loads all knowledge/ Yurtle files into an RDF graph via yurtle-rdflib,
-    then provides typed Python accessors backed by SPARQL queries.
+    then provides typed Python accessors backed by SPARQL queries. Accessor
+    results are materialized on first use and keyed by ID, so repeated
+    lookups are dictionary reads until the graph changes.
+
+    Args:
+        knowledge_dir: Yurtle knowledge directory (defaults to the bundled one).
+        data_dir: Optional directory of JSON data records to ingest as triples.
+        use_cache: Load/store the parsed knowledge graph snapshot on disk.
+        cache_dir: Cache root override; defaults to `acf.utils.cache.cache_root()`.
+        ingest_workers: Process count for data ingestion (None = automatic).
+        incremental: Reuse the persisted triples of unchanged data files.
     """
 
     def __init__(
         self,
         knowledge_dir: Path | None = None,
         data_dir: Path | None = None,
+        use_cache: bool = True,
+        cache_dir: Path | None = None,
+        ingest_workers: int | None = None,
+        incremental: bool = False,
     ):
         self._knowledge_dir = knowledge_dir or KNOWLEDGE_DIR
+        self._cache_dir = (cache_dir or cache_root()) if use_cache else None
+        self._memo: dict[str, Any] = {}
+        self._memo_size = -1
+
+        # Incremental mode may restore knowledge AND data from one snapshot.
+        state: _DataState | None = None
+        knowledge_key: str | None = None
+        if incremental and self._cache_dir is not None and data_dir and data_dir.exists():
+            knowledge_key = _knowledge_cache_key(self._knowledge_dir)
+            state = _DataState.load(self._cache_dir, data_dir, knowledge_key)
 
         # Load all Yurtle knowledge files into the graph
-        if self._knowledge_dir.exists():
-            self.graph: Graph = yurtle_rdflib.load_workspace(str(self._knowledge_dir))
+        if state is not None and state.graph is not None:
+            self.graph: Graph = state.graph
+        elif self._knowledge_dir.exists():
+            self.graph = _load_knowledge_graph(
+                self._knowledge_dir, self._cache_dir, knowledge_key,
+            )
         else:
             self.graph = Graph()
 
@@ -142,96 +569,192 @@ class ACFGraph:
         self.graph.bind("rdfs", RDFS)
 
         # Ingest JSON data files if provided
-        if data_dir and data_dir.exists():
-            self._ingest_data(data_dir)
+        self.last_ingest: IngestStats | None = None
+        if state is not None and data_dir is not None:
+            self._ingest_incremental(data_dir, state, ingest_workers)
+        elif data_dir and data_dir.exists():
+            self.ingest(data_dir, workers=ingest_workers)
+
+    def ingest(self, data_dir: Path, workers: int | None = None) -> IngestStats:
+        """Convert the JSON and JSONL data files in `data_dir` into triples and add them.
 
-    def _ingest_data(self, data_dir: Path) -> int:
-        """Convert JSON data files into RDF triples and add to graph.
+        Files are read and JSON-decoded in a process pool when there are enough
+        of them to amortize worker start-up (or whenever `workers` > 1 is given
+        explicitly); each record becomes a triple batch that is streamed into a
+        single ``Graph.addN`` call. Unparseable files are skipped, as before.
 
-        Returns number of records ingested.
+        Returns throughput statistics, also kept on `self.last_ingest`.
         """
-        count = 0
-        for json_file in sorted(data_dir.glob("*.json")):
-            try:
-                record = json.loads(json_file.read_text())
-                self._ingest_record(record, json_file.stem)
-                count += 1
-            except (json.JSONDecodeError, KeyError):
+        start = time.perf_counter()
+        paths = data_files(data_dir)
+        stats = IngestStats(files=len(paths))
+        self._add_files(paths, workers, stats)
+        stats.seconds = time.perf_counter() - start
+        self.last_ingest = stats
+        return stats
+
+    def _add_files(
+        self,
+        paths: list[Path],
+        workers: int | None,
+        stats: IngestStats,
+        on_file: Callable[[Path, list[_Triple]], None] | None = None,
+    ) -> None:
+        """Parse `paths` and stream their triples into the graph with one ``addN``.
+
+        `on_file` sees each successfully converted record with its file and
+        triples, which is how the incremental manifest learns which subjects a
+        file produced (a JSONL shard produces many).
+        """
+        if workers is None:
+            workers = (os.cpu_count() or 1) if len(paths) >= _PARALLEL_MIN_FILES else 1
+
+        def _quads(parsed: Iterable[list[tuple[str, Any]]]) -> Iterator[_Quad]:
+            for path, items in zip(paths, parsed):
+                for record_id, record in items:
+                    try:
+                        batch = _record_triples(record, record_id)
+                    except (KeyError, AttributeError, TypeError):
+                        continue
+                    stats.records += 1
+                    stats.triples += len(batch)
+                    if on_file is not None:
+                        on_file(path, batch)
+                    for s, p, o in batch:
+                        yield s, p, o, self.graph
+
+        names = [str(p) for p in paths]
+        if workers > 1 and len(names) > 1:
+            chunksize = max(1, len(names) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                self.graph.addN(_quads(pool.map(_read_data_file, names, chunksize=chunksize)))
+        else:
+            self.graph.addN(_quads(map(_read_data_file, names)))
+
+    def _ingest_incremental(
+        self,
+        data_dir: Path,
+        state: _DataState,
+        workers: int | None,
+    ) -> IngestStats:
+        """Bring the graph restored from `state` up to date with `data_dir`.
+
+        The manifest maps each file name to its (mtime, size, sha256) and the
+        subject IRIs its records produced. A file whose mtime and size are
+        unchanged is trusted without reading it; one whose stat changed but
+        whose hash did not only has its manifest entry refreshed. Changed and
+        deleted files have their subjects' triples removed, then changed and
+        added files are parsed. The snapshot is rewritten only when something
+        changed, so re-opening an untouched directory is a single unpickle.
+        """
+        start = time.perf_counter()
+        paths = data_files(data_dir)
+        stats = IngestStats(files=len(paths))
+        dirty = state.graph is None
+
+        stale_subjects: list[str] = []
+        for name in [n for n in state.files if not (data_dir / n).is_file()]:
+            stale_subjects.extend(state.files.pop(name).subjects)
+            stats.deleted += 1
+            dirty = True
+
+        to_parse: list[Path] = []
+        for path in paths:
+            entry = state.files.get(path.name)
+            st = path.stat()
+            if entry is not None and (entry.mtime_ns, entry.size) == (st.st_mtime_ns, st.st_size):
                 continue
-        return count
+            dirty = True
+            digest = hashlib.sha256(path.read_bytes()).hexdigest()
+            if entry is not None and entry.sha256 == digest:
+                entry.mtime_ns, entry.size = st.st_mtime_ns, st.st_size
+                continue
+            if entry is not None:
+                stale_subjects.extend(entry.subjects)
+            to_parse.append(path)
+            # Recorded up front so unparseable files are not re-read every run.
+            state.files[path.name] = _ManifestEntry(st.st_mtime_ns, st.st_size, digest, [])
+
+        for subject in stale_subjects:
+            self.graph.remove((URIRef(subject), None, None))
+
+        produced: dict[str, set[str]] = {}
+
+        def _record_subjects(path: Path, batch: list[_Triple]) -> None:
+            produced.setdefault(path.name, set()).update(str(s) for s, _, _ in batch)
+
+        self._add_files(to_parse, workers, stats, on_file=_record_subjects)
+        for name, subjects in produced.items():
+            state.files[name].subjects = sorted(subjects)
+        stats.reused = len(paths) - len(to_parse)
+        if dirty:
+            state.save(self.graph)
+
+        stats.seconds = time.perf_counter() - start
+        self.last_ingest = stats
+        return stats
 
     def _ingest_record(self, record: dict[str, Any], record_id: str) -> None:
         """Convert a single JSON record to RDF triples."""
-        subject = ACF[f"data/{record_id}"]
-        self.graph.add((subject, RDF.type, ACF.DataRecord))
-
-        record_type = record.get("record_type", "unknown")
-        self.graph.add((subject, ACF.recordType, Literal(record_type)))
-
-        # Common envelope fields
-        for field_name in [
-            "measure_id", "system_id", "system_version",
-            "experiment_id", "timestamp", "collector", "notes",
-        ]:
-            # Support both NuSy field names and ACF field names
-            value = record.get(field_name) or record.get(
-                {"system_id": "being", "experiment_id": "expedition"}.get(field_name, ""),
-            )
-            if value:
-                self.graph.add((subject, ACF[field_name], Literal(str(value))))
-
-        # Link to measure node
-        measure_id = record.get("measure_id", "")
-        if measure_id:
-            self.graph.add((subject, ACF.measure, ACF[measure_id]))
-
-        # Record-type-specific fields
-        if record_type == "experiment-run":
-            for field_name in ["value", "target", "n", "comparison"]:
-                if field_name in record:
-                    if isinstance(record[field_name], (int, float)):
-                        self.graph.add((
-                            subject, ACF[field_name],
-                            Literal(record[field_name], datatype=XSD.double),
-                        ))
-                    else:
-                        self.graph.add((
-                            subject, ACF[field_name],
-                            Literal(str(record[field_name])),
-                        ))
-            if "pass" in record:
-                self.graph.add((
-                    subject, ACF.passed,
-                    Literal(record["pass"], datatype=XSD.boolean),
-                ))
-
-        elif record_type == "longitudinal-series":
-            for i, dp in enumerate(record.get("data_points", [])):
-                dp_node = ACF[f"data/{record_id}/dp{i}"]
-                self.graph.add((subject, ACF.dataPoint, dp_node))
-                self.graph.add((dp_node, RDF.type, ACF.DataPoint))
-                for k, v in dp.items():
-                    if isinstance(v, (int, float)):
-                        self.graph.add((
-                            dp_node, ACF[k],
-                            Literal(v, datatype=XSD.double),
-                        ))
-                    else:
-                        self.graph.add((dp_node, ACF[k], Literal(str(v))))
-
-    # ── Typed Accessors (SPARQL-backed) ──────────────────────────
-
-    def _select(self, sparql: str) -> list[ResultRow]:
+        self.graph.addN((s, p, o, self.graph) for s, p, o in _record_triples(record, record_id))
+
+    # ── Typed Accessors (SPARQL-backed, materialized) ────────────
+    #
+    # Each accessor's SPARQL runs once and its typed result is kept in
+    # `self._memo`. The memo is dropped whenever the triple count changes, so
+    # `_ingest_record` (or a caller adding to `self.graph` directly) never sees
+    # stale dataclasses. Accessors return fresh lists, but the dataclass
+    # instances inside them are shared between calls — treat them as read-only.
+
+    def _memoized(self, key: str, build: Callable[[], _T]) -> _T:
+        """Return the memoized value for `key`, building it if the graph changed."""
+        size = len(self.graph)
+        if size != self._memo_size:
+            self._memo.clear()
+            self._memo_size = size
+        if key not in self._memo:
+            self._memo[key] = build()
+        return cast(_T, self._memo[key])
+
+    def invalidate(self) -> None:
+        """Drop every materialized accessor result.
+
+        Only needed after editing `self.graph` in a way that leaves the triple
+        count unchanged (e.g. removing one triple and adding another); any
+        change in size invalidates automatically.
+        """
+        self._memo.clear()
+        self._memo_size = -1
+
+    def _namespaces(self) -> tuple[tuple[str, str], ...]:
+        return tuple((prefix, str(uri)) for prefix, uri in self.graph.namespaces())
+
+    def _run(self, sparql: str, bindings: Mapping[str, Any] | None = None) -> Result:
+        """Execute `sparql` through the prepared-query cache with bound parameters.
+
+        Values in `bindings` that are not already RDF terms become literals,
+        so callers pass parameters instead of formatting them into the text.
+        """
+        prepared = _prepare_query(sparql, self._namespaces())
+        init: dict[str, Identifier] = {
+            Variable(k): v if isinstance(v, Identifier) else Literal(v)
+            for k, v in (bindings or {}).items()
+        }
+        return self.graph.query(prepared, initBindings=init)
+
+    def _select(self, sparql: str, bindings: Mapping[str, Any] | None = None) -> list[ResultRow]:
         """Run a SELECT query and return its rows, narrowed to ``ResultRow``.
 
         rdflib's ``Graph.query`` is typed as a union over SELECT / ASK /
         CONSTRUCT results; every accessor below issues a SELECT, so narrow the
         rows once here rather than at each field access.
         """
-        return [cast(ResultRow, row) for row in self.graph.query(sparql)]
+        return [cast(ResultRow, row) for row in self._run(sparql, bindings)]
 
-    def dimensions(self) -> list[Dimension]:
-        """Return all ACF dimensions."""
+    def _dimension_index(self) -> dict[str, Dimension]:
+        return self._memoized("dimensions", self._build_dimensions)
+
+    def _build_dimensions(self) -> dict[str, Dimension]:
         results = self._select("""
             SELECT ?id ?label ?shortName ?subLevelCount ?weight ?desc WHERE {
                 ?s a acf:Dimension .
@@ -244,8 +767,9 @@ class ACFGraph:
             }
             ORDER BY ?id
         """)
-        return [
-            Dimension(
+        index: dict[str, Dimension] = {}
+        for row in results:
+            index[str(row.id)] = Dimension(
                 id=str(row.id),
                 label=str(row.label or row.id),
                 short_name=str(row.shortName or ""),
@@ -253,38 +777,36 @@ class ACFGraph:
                 weight=float(row.weight) if row.weight else 0.0,
                 description=str(row.desc or ""),
             )
-            for row in results
-        ]
+        return index
+
+    def dimensions(self) -> list[Dimension]:
+        """Return all ACF dimensions."""
+        return list(self._dimension_index().values())
 
     def dimension(self, name: str) -> Dimension | None:
         """Return a single dimension by ID."""
-        for d in self.dimensions():
-            if d.id == name:
-                return d
-        return None
+        return self._dimension_index().get(name)
 
-    def sub_levels(self, dimension_id: str | None = None) -> list[SubLevel]:
-        """Return sub-levels, optionally filtered by dimension."""
-        filter_clause = ""
-        if dimension_id:
-            filter_clause = f'FILTER(STR(?dimId) = "{dimension_id}")'
+    def _sub_level_index(self) -> dict[str, list[SubLevel]]:
+        return self._memoized("sub_levels", self._build_sub_levels)
 
-        results = self._select(f"""
-            SELECT ?id ?dimId ?level ?label ?scoreRange ?desc WHERE {{
+    def _build_sub_levels(self) -> dict[str, list[SubLevel]]:
+        results = self._select("""
+            SELECT ?id ?dimId ?level ?label ?scoreRange ?desc WHERE {
                 ?s a acf:SubLevel .
                 ?s acf:id ?id .
                 ?s acf:dimension ?dim .
                 ?dim acf:id ?dimId .
-                OPTIONAL {{ ?s acf:level ?level }}
-                OPTIONAL {{ ?s acf:label ?label }}
-                OPTIONAL {{ ?s acf:scoreRange ?scoreRange }}
-                OPTIONAL {{ ?s acf:description ?desc }}
-                {filter_clause}
-            }}
+                OPTIONAL { ?s acf:level ?level }
+                OPTIONAL { ?s acf:label ?label }
+                OPTIONAL { ?s acf:scoreRange ?scoreRange }
+                OPTIONAL { ?s acf:description ?desc }
+            }
             ORDER BY ?dimId ?level
         """)
-        return [
-            SubLevel(
+        index: dict[str, list[SubLevel]] = {}
+        for row in results:
+            sub_level = SubLevel(
                 id=str(row.id),
                 dimension_id=str(row.dimId),
                 level=int(row.level) if row.level else 0,
@@ -292,70 +814,77 @@ class ACFGraph:
                 score_range=str(row.scoreRange or ""),
                 description=str(row.desc or ""),
             )
-            for row in results
-        ]
+            index.setdefault(sub_level.dimension_id, []).append(sub_level)
+        return index
 
-    def measures(self, dimension: str | None = None) -> list[Measure]:
-        """Return measures, optionally filtered by ACF dimension."""
-        filter_clause = ""
-        if dimension:
-            filter_clause = f'FILTER(STR(?dimId) = "{dimension}")'
+    def sub_levels(self, dimension_id: str | None = None) -> list[SubLevel]:
+        """Return sub-levels, optionally filtered by dimension."""
+        index = self._sub_level_index()
+        if dimension_id:
+            return list(index.get(dimension_id, ()))
+        return [sl for group in index.values() for sl in group]
 
-        results = self._select(f"""
-            SELECT ?id ?name ?unit ?collection ?desc WHERE {{
-                ?s a acf:Measure .
-                ?s acf:id ?id .
-                OPTIONAL {{ ?s acf:name ?name }}
-                OPTIONAL {{ ?s acf:unit ?unit }}
-                OPTIONAL {{ ?s acf:collection ?collection }}
-                OPTIONAL {{ ?s acf:description ?desc }}
-                OPTIONAL {{
-                    ?s acf:mapsTo ?dim .
-                    ?dim acf:id ?dimId .
-                }}
-                {filter_clause}
-            }}
-            ORDER BY ?id
-        """)
+    def _measure_index(self) -> _MeasureIndex:
+        return self._memoized("measures", self._build_measures)
 
-        # Build measures with dimension mappings
-        measures_dict: dict[str, Measure] = {}
-        for row in results:
-            mid = str(row.id)
-            if mid not in measures_dict:
-                measures_dict[mid] = Measure(
+    def _build_measures(self) -> _MeasureIndex:
+        """Gather measures and their dimension mappings in one graph traversal.
+
+        This used to be two SPARQL SELECTs — the measure rows, then every
+        measure→dimension mapping in the graph — joined in Python. Both are
+        simple star patterns around ``?s a acf:Measure``, so walking the
+        subject's triples directly yields the same rows without query parsing,
+        algebra translation or the OPTIONAL left-joins, and it scales linearly
+        with the catalog (see ``benchmarks/bench_measures.py``).
+        """
+        graph = self.graph
+        dimension_ids: dict[Any, list[str]] = {}
+        rows: list[tuple[str, Measure]] = []
+        for s in graph.subjects(RDF.type, ACF.Measure, unique=True):
+            ids = [str(o) for o in graph.objects(s, ACF.id)]
+            if not ids:
+                continue
+            dims: list[str] = []
+            for dim in graph.objects(s, ACF.mapsTo):
+                if dim not in dimension_ids:
+                    dimension_ids[dim] = [str(o) for o in graph.objects(dim, ACF.id)]
+                dims.extend(dimension_ids[dim])
+            name = graph.value(s, ACF.name)
+            unit = graph.value(s, ACF.unit)
+            collection = graph.value(s, ACF.collection)
+            desc = graph.value(s, ACF.description)
+            for mid in ids:
+                rows.append((mid, Measure(
                     id=mid,
-                    name=str(row.name or mid),
-                    unit=str(row.unit or ""),
-                    collection=str(row.collection or "automated"),
-                    description=str(row.desc or ""),
-                )
+                    name=str(name or mid),
+                    unit=str(unit or ""),
+                    collection=str(collection or "automated"),
+                    dimensions=sorted(dims),
+                    description=str(desc or ""),
+                )))
 
-        # Fetch dimension mappings for all measures
-        dim_results = self._select("""
-            SELECT ?measId ?dimId WHERE {
-                ?s a acf:Measure .
-                ?s acf:id ?measId .
-                ?s acf:mapsTo ?dim .
-                ?dim acf:id ?dimId .
-            }
-        """)
-        for row in dim_results:
-            mid = str(row.measId)
-            if mid in measures_dict:
-                measures_dict[mid].dimensions.append(str(row.dimId))
+        by_id: dict[str, Measure] = {}
+        for mid, measure in sorted(rows, key=lambda r: r[0]):
+            by_id.setdefault(mid, measure)
 
-        return list(measures_dict.values())
+        by_dimension: dict[str, list[Measure]] = {}
+        for m in by_id.values():
+            for dim_id in dict.fromkeys(m.dimensions):
+                by_dimension.setdefault(dim_id, []).append(m)
+        return _MeasureIndex(by_id=by_id, by_dimension=by_dimension)
+
+    def measures(self, dimension: str | None = None) -> list[Measure]:
+        """Return measures, optionally filtered by ACF dimension."""
+        index = self._measure_index()
+        if dimension:
+            return list(index.by_dimension.get(dimension, ()))
+        return list(index.by_id.values())
 
     def measure(self, measure_id: str) -> Measure | None:
         """Return a single measure by ID."""
-        for m in self.measures():
-            if m.id == measure_id:
-                return m
-        return None
+        return self._measure_index().by_id.get(measure_id)
 
-    def levels(self) -> list[CertificationLevel]:
-        """Return all certification levels."""
+    def _build_levels(self) -> list[CertificationLevel]:
         results = self._select("""
             SELECT ?id ?label ?scoreMin ?scoreMax ?humanEquiv WHERE {
                 ?s a acf:CertificationLevel .
@@ -378,8 +907,14 @@ class ACFGraph:
             for row in results
         ]
 
-    def hypotheses(self) -> list[Hypothesis]:
-        """Return all hypotheses."""
+    def levels(self) -> list[CertificationLevel]:
+        """Return all certification levels."""
+        return list(self._memoized("levels", self._build_levels))
+
+    def _hypothesis_index(self) -> dict[str, Hypothesis]:
+        return self._memoized("hypotheses", self._build_hypotheses)
+
+    def _build_hypotheses(self) -> dict[str, Hypothesis]:
         results = self._select("""
             SELECT ?id ?desc ?target ?status WHERE {
                 ?s a acf:Hypothesis .
@@ -390,50 +925,124 @@ class ACFGraph:
             }
             ORDER BY ?id
         """)
-        return [
-            Hypothesis(
+        index: dict[str, Hypothesis] = {}
+        for row in results:
+            index[str(row.id)] = Hypothesis(
                 id=str(row.id),
                 description=str(row.desc or ""),
                 target=str(row.target or ""),
                 status=str(row.status or "pending"),
             )
-            for row in results
-        ]
+        return index
 
-    def data_series(self, measure_id: str) -> list[DataPoint]:
-        """Return all data points for a given measure."""
-        results = self._select(f"""
-            SELECT ?value ?sysId ?sysVer ?expId ?ts WHERE {{
-                ?s acf:measure acf:{measure_id} .
-                OPTIONAL {{ ?s acf:value ?value }}
-                OPTIONAL {{ ?s acf:system_id ?sysId }}
-                OPTIONAL {{ ?s acf:system_version ?sysVer }}
-                OPTIONAL {{ ?s acf:experiment_id ?expId }}
-                OPTIONAL {{ ?s acf:timestamp ?ts }}
-            }}
-            ORDER BY ?ts
-        """)
-        return [
-            DataPoint(
-                measure_id=measure_id,
-                value=float(row.value) if row.value else 0.0,
-                system_id=str(row.sysId or ""),
-                system_version=str(row.sysVer or ""),
-                experiment_id=str(row.expId or ""),
-                timestamp=str(row.ts or ""),
+    def hypotheses(self) -> list[Hypothesis]:
+        """Return all hypotheses."""
+        return list(self._hypothesis_index().values())
+
+    def hypothesis(self, hypothesis_id: str) -> Hypothesis | None:
+        """Return a single hypothesis by ID."""
+        return self._hypothesis_index().get(hypothesis_id)
+
+    def _series_index(self) -> dict[str, dict[str, list[DataPoint]]]:
+        return self._memoized("data_series", self._build_series)
+
+    def _build_series(self) -> dict[str, dict[str, list[DataPoint]]]:
+        """Index every data record as measure_id -> system_id -> points by timestamp.
+
+        One pass over the ``acf:measure`` triples replaces a five-OPTIONAL
+        SPARQL query per `data_series` call. Like the other accessor indexes it
+        is rebuilt on first use after the graph changes — i.e. once per
+        ingestion — and every later call is a dictionary read.
+        """
+        graph = self.graph
+        prefix = str(ACF)
+        index: dict[str, dict[str, list[DataPoint]]] = {}
+        for s, _, measure in graph.triples((None, ACF.measure, None)):
+            measure_uri = str(measure)
+            if not measure_uri.startswith(prefix):
+                continue
+            value = graph.value(s, ACF.value)
+            point = DataPoint(
+                measure_id=measure_uri[len(prefix):],
+                value=float(str(value)) if value else 0.0,
+                system_id=str(graph.value(s, ACF.system_id) or ""),
+                system_version=str(graph.value(s, ACF.system_version) or ""),
+                experiment_id=str(graph.value(s, ACF.experiment_id) or ""),
+                timestamp=str(graph.value(s, ACF.timestamp) or ""),
             )
-            for row in results
-        ]
+            index.setdefault(point.measure_id, {}).setdefault(point.system_id, []).append(point)
+        for by_system in index.values():
+            for points in by_system.values():
+                points.sort(key=_timestamp_key)
+        return index
 
-    def query(self, sparql: str) -> list[dict[str, Any]]:
-        """Run an arbitrary SPARQL query and return results as dicts."""
-        results = self.graph.query(sparql)
-        variables = results.vars or []
-        rows = [cast(ResultRow, row) for row in results]
-        return [
-            {str(var): str(row[var]) for var in variables if row[var] is not None}
-            for row in rows
-        ]
+    def data_series(
+        self,
+        measure_id: str,
+        system_id: str | None = None,
+        version_min: str | None = None,
+        version_max: str | None = None,
+    ) -> list[DataPoint]:
+        """Return the data points for a measure, ordered by timestamp.
+
+        Args:
+            measure_id: Measure to read, e.g. ``"M-003"``.
+            system_id: Only points recorded for this system.
+            version_min: Only points whose ``system_version`` is >= this.
+            version_max: Only points whose ``system_version`` is <= this.
+                Versions compare component-wise (``"1.10.0" > "1.9.2"``);
+                points with no version are excluded by either bound.
+        """
+        by_system = self._series_index().get(measure_id, {})
+        if system_id is not None:
+            points: Iterable[DataPoint] = by_system.get(system_id, ())
+        elif len(by_system) == 1:
+            points = next(iter(by_system.values()))
+        else:
+            points = heapq.merge(*by_system.values(), key=_timestamp_key)
+
+        if version_min is None and version_max is None:
+            return list(points)
+        low = _version_key(version_min) if version_min is not None else None
+        high = _version_key(version_max) if version_max is not None else None
+        selected = []
+        for point in points:
+            if not point.system_version:
+                continue
+            key = _version_key(point.system_version)
+            if (low is None or key >= low) and (high is None or key <= high):
+                selected.append(point)
+        return selected
+
+    def query(
+        self,
+        sparql: str,
+        bindings: Mapping[str, Any] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Run an arbitrary SPARQL query and return results as dicts.
+
+        `bindings` pre-binds query variables (``{"id": "depth"}`` binds
+        ``?id``); plain Python values are bound as literals. The parsed and
+        algebrized query is cached, so repeating a query skips both steps.
+        """
+        return list(self.iter_query(sparql, bindings))
+
+    def iter_query(
+        self,
+        sparql: str,
+        bindings: Mapping[str, Any] | None = None,
+    ) -> QueryStream:
+        """Run a SPARQL query and return its rows as a lazy, single-pass stream.
+
+        Rows are produced as the query engine yields them and are not retained,
+        so memory stays flat however many rows a query returns (ORDER BY and
+        aggregates still materialize inside rdflib — that is inherent to them).
+        Errors in the query text raise here; evaluation errors raise while
+        iterating.
+        """
+        results = self._run(sparql, bindings)
+        variables = [str(var) for var in results.vars or []]
+        return QueryStream(variables=variables, rows=_result_rows(results))
 
     def triple_count(self) -> int:
         """Return total number of triples in the graph."""
@@ -17,7 +17,4 @@ class HypothesisRegistry:
 
     def get(self, hypothesis_id: str) -> Hypothesis | None:
         """Get a single hypothesis by ID."""
-        for h in self.all():
-            if h.id == hypothesis_id:
-                return h
-        return None
+        return self.graph.hypothesis(hypothesis_id)
@@ -0,0 +1,163 @@
+"""Asyncio-friendly batched collection of ACF records.
+
+Calling `record_experiment_run(..., data_dir=...)` from an evaluation loop
+blocks that loop on a `mkdir` and a file write for every record. An
+`AsyncCollector` takes records from coroutines (`record`,
+`record_experiment_run`) and from plain threads (`record_threadsafe`), puts
+them on a bounded queue, and hands them to a `RecordSink` from one background
+writer task. The writer drains up to `batch_size` queued records at a time
+and writes and flushes each batch in a worker thread, so the event loop never
+waits on disk and the sink sees one flush per batch instead of one per record.
+
+When writing falls behind and the queue is full, producers wait (coroutines
+await, threads block) instead of buffering without bound. A sink error stops
+all further writing and is re-raised from every later `record`, `flush` and
+`close`, so a broken sink cannot silently drop a run's data.
+
+Usage:
+    from acf.measures.async_collector import AsyncCollector
+    from acf.measures.sinks import JsonlSink
+
+    async with AsyncCollector(JsonlSink(Path("data/"))) as collector:
+        await collector.record_experiment_run("M-001", "EXP-1", "my-ai", "1.0.0", 0.9, 0.8)
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Mapping
+from types import TracebackType
+from typing import TYPE_CHECKING, Any
+
+from acf.measures.collector import record_experiment_run
+from acf.measures.sinks import RecordSink
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+# Queued to tell the writer task to exit once everything before it is written.
+_STOP = object()
+
+
+class AsyncCollector:
+    """Queue records from coroutines and threads; write them to a sink in batches."""
+
+    def __init__(
+        self,
+        sink: RecordSink,
+        max_queue: int = 10_000,
+        batch_size: int = 500,
+    ) -> None:
+        self.sink = sink
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.written = 0
+        self._queue: asyncio.Queue[Any] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._writer: asyncio.Task[None] | None = None
+        self._error: BaseException | None = None
+        self._closed = False
+
+    # ── Lifecycle ────────────────────────────────────────────────
+
+    async def start(self) -> None:
+        """Start the writer task on the running loop (idempotent)."""
+        if self._closed:
+            raise RuntimeError("AsyncCollector is closed")
+        if self._writer is None:
+            self._loop = asyncio.get_running_loop()
+            self._queue = asyncio.Queue(maxsize=self.max_queue)
+            self._writer = asyncio.create_task(self._run())
+
+    async def flush(self) -> None:
+        """Wait until every record queued so far has been written and flushed."""
+        if self._queue is not None:
+            await self._queue.join()
+        self._raise_pending()
+
+    async def close(self) -> None:
+        """Write everything still queued, stop the writer, and close the sink."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._queue is not None and self._writer is not None:
+            await self._queue.put(_STOP)
+            await self._writer
+        await asyncio.to_thread(self.sink.close)
+        self._raise_pending()
+
+    async def __aenter__(self) -> Self:
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    # ── Producers ────────────────────────────────────────────────
+
+    async def record(self, record: Mapping[str, Any]) -> None:
+        """Queue one record, waiting while the queue is full."""
+        self._raise_pending()
+        if self._closed:
+            raise RuntimeError("AsyncCollector is closed")
+        await self.start()
+        assert self._queue is not None
+        await self._queue.put(record)
+
+    async def record_experiment_run(self, *args: Any, **kwargs: Any) -> dict[str, Any]:
+        """Build an experiment-run record (same arguments as the sync helper) and queue it."""
+        if "data_dir" in kwargs or "sink" in kwargs:
+            raise TypeError("AsyncCollector writes to its own sink; omit data_dir/sink")
+        record = record_experiment_run(*args, **kwargs)
+        await self.record(record)
+        return record
+
+    def record_threadsafe(self, record: Mapping[str, Any], timeout: float | None = None) -> None:
+        """Queue a record from a thread other than the loop's, blocking while the queue is full.
+
+        Raises:
+            RuntimeError: if the collector has not been started.
+            TimeoutError: if the record could not be queued within `timeout` seconds.
+        """
+        if self._loop is None:
+            raise RuntimeError("AsyncCollector.start() has not run")
+        future = asyncio.run_coroutine_threadsafe(self.record(record), self._loop)
+        future.result(timeout)
+
+    # ── Writer ───────────────────────────────────────────────────
+
+    async def _run(self) -> None:
+        assert self._queue is not None
+        queue = self._queue
+        stopping = False
+        while not (stopping and queue.empty()):
+            batch = [await queue.get()]
+            while len(batch) < self.batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+            # A producer that was blocked on a full queue when close() ran can
+            # land after the stop marker; keep draining until nothing is left.
+            stopping = stopping or any(r is _STOP for r in batch)
+            records = [r for r in batch if r is not _STOP]
+            try:
+                if records and self._error is None:
+                    await asyncio.to_thread(self._write_batch, records)
+                    self.written += len(records)
+            except Exception as e:  # noqa: BLE001 — surfaced to producers via _raise_pending
+                self._error = e
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    def _write_batch(self, records: list[Mapping[str, Any]]) -> None:
+        for record in records:
+            self.sink.write(record)
+        self.sink.flush()
+
+    def _raise_pending(self) -> None:
+        if self._error is not None:
+            raise self._error
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-import json
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from acf.measures.sinks import JsonFileSink, RecordSink
+
 
 def record_experiment_run(
     measure_id: str,
@@ -19,15 +20,22 @@ def record_experiment_run(
     n: int = 0,
     data_dir: Path | None = None,
     notes: str = "",
+    sink: RecordSink | None = None,
     **kwargs: Any,
 ) -> dict[str, Any]:
-    """Create and optionally save an experiment-run record."""
+    """Create and optionally save an experiment-run record.
+
+    The record goes to `sink` when given (e.g. a `JsonlSink` for long runs),
+    otherwise to one JSON file in `data_dir` when that is given.
+    """
+    if sink is not None and data_dir is not None:
+        raise ValueError("Pass either data_dir or sink, not both")
     # ONE clock read feeds both the record timestamp and the filename date: two
     # independent reads let a run straddling UTC midnight write a file named for
     # one day holding a record stamped the other (invisible wherever local date
     # equals UTC, which is why it survived — pinned by the ticking-clock test).
-    now_dt = datetime.now(timezone.utc)
-    now = now_dt.isoformat()
+    # Sinks derive the file date from the record's timestamp, never the clock.
+    now = datetime.now(timezone.utc).isoformat()
     record = {
         "schema_version": "1.0.0",
         "record_type": "experiment-run",
@@ -45,11 +53,10 @@ def record_experiment_run(
         "notes": notes,
     }
 
-    if data_dir:
-        data_dir.mkdir(parents=True, exist_ok=True)
-        date_str = now_dt.strftime("%Y-%m-%d")
-        filename = f"{experiment_id}_{measure_id}_{system_id}_{date_str}.json"
-        (data_dir / filename).write_text(json.dumps(record, indent=2))
+    if sink is None and data_dir:
+        sink = JsonFileSink(data_dir)
+    if sink is not None:
+        sink.write(record)
 
     return record
 
@@ -0,0 +1,212 @@
+"""Record sinks: where collected ACF records are written.
+
+`record_experiment_run` historically wrote one pretty-printed JSON file per
+call. That is still the default (`JsonFileSink`), but a long evaluation makes
+millions of calls, and one file plus one fsync per record turns the data
+directory into the bottleneck. `JsonlSink` appends compact records to one
+JSONL shard per UTC day instead, buffering writes in memory and flushing on
+size, age, or `close()`.
+
+Every sink satisfies `RecordSink`, so anything that collects records can take
+a sink without caring how they are stored. `acf.data.loader` reads both
+layouts, and so do `ACFGraph` and `acf score`.
+
+Usage:
+    from acf.measures.sinks import JsonlSink
+
+    with JsonlSink(Path("data/")) as sink:
+        record_experiment_run("M-001", "EXP-1", "my-ai", "1.0.0", 0.9, 0.8, sink=sink)
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from collections.abc import Mapping
+from datetime import datetime, timezone
+from pathlib import Path
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
+
+from acf.utils.timestamps import parse_timestamp
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+
+@runtime_checkable
+class RecordSink(Protocol):
+    """Anything that accepts ACF records for persistence."""
+
+    def write(self, record: Mapping[str, Any]) -> None:
+        """Accept one record. May buffer; see `flush`."""
+        ...
+
+    def flush(self) -> None:
+        """Persist everything accepted so far."""
+        ...
+
+    def close(self) -> None:
+        """Flush and release resources. Further writes are an error."""
+        ...
+
+
+def _record_date(record: Mapping[str, Any]) -> str:
+    """Return the UTC date (YYYY-MM-DD) a record belongs to.
+
+    Taken from the record's own timestamp, so a record and the file it lands
+    in never disagree about the day; records without one use the current time.
+    """
+    stamp = parse_timestamp(record.get("timestamp")) or datetime.now(timezone.utc)
+    return stamp.strftime("%Y-%m-%d")
+
+
+class JsonFileSink:
+    """Write each record as its own pretty-printed JSON file (the legacy layout).
+
+    Files are named ``<experiment>_<measure>_<system>_<date>.json``; a later
+    record with the same name replaces the earlier one, as it always has.
+    """
+
+    def __init__(self, data_dir: Path) -> None:
+        self.data_dir = data_dir
+
+    def write(self, record: Mapping[str, Any]) -> None:
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        filename = "_".join([
+            str(record.get("experiment_id", "")),
+            str(record.get("measure_id", "")),
+            str(record.get("system_id", "")),
+            _record_date(record),
+        ]) + ".json"
+        (self.data_dir / filename).write_text(json.dumps(record, indent=2))
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+class JsonlSink:
+    """Append records as compact JSON lines to one shard per UTC day.
+
+    Shards are named ``<prefix>-<YYYY-MM-DD>.jsonl`` after each record's
+    timestamp, so a run that crosses midnight rotates to a new shard. Lines
+    are buffered and written with one append per flush, which happens when
+    the buffer reaches `max_records` or `max_bytes`, when the oldest buffered
+    line is older than `max_age` seconds (checked on each write), or on
+    `flush`/`close`. With `fsync=True` each flush is also synced to disk.
+
+    Crash safety: a writer killed mid-append can leave a torn final line. The
+    reader (`acf.data.loader.read_records`) skips undecodable lines, and the
+    first time this sink appends to an existing shard it checks the shard's
+    last byte and, if that line was torn, terminates it, so the torn fragment
+    stays on its own line instead of corrupting the next record. Records
+    still in the buffer when the process dies are lost; `max_records` and
+    `max_age` bound how many.
+    """
+
+    def __init__(
+        self,
+        data_dir: Path,
+        prefix: str = "records",
+        max_records: int = 1000,
+        max_bytes: int = 1 << 20,
+        max_age: float = 5.0,
+        fsync: bool = False,
+    ) -> None:
+        self.data_dir = data_dir
+        self.prefix = prefix
+        self.max_records = max_records
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.fsync = fsync
+        self._buffers: dict[str, list[str]] = {}
+        self._buffered = 0
+        self._buffered_bytes = 0
+        self._oldest: float | None = None
+        self._checked: set[str] = set()
+        self._closed = False
+
+    def shard_path(self, date: str) -> Path:
+        """Return the shard file records dated `date` are appended to."""
+        return self.data_dir / f"{self.prefix}-{date}.jsonl"
+
+    def write(self, record: Mapping[str, Any]) -> None:
+        if self._closed:
+            raise ValueError("write to closed JsonlSink")
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        self._buffers.setdefault(_record_date(record), []).append(line)
+        self._buffered += 1
+        self._buffered_bytes += len(line)
+        now = time.monotonic()
+        if self._oldest is None:
+            self._oldest = now
+        if (
+            self._buffered >= self.max_records
+            or self._buffered_bytes >= self.max_bytes
+            or now - self._oldest >= self.max_age
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._buffers:
+            return
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        for date, lines in self._buffers.items():
+            path = self.shard_path(date)
+            data = "".join(lines).encode("utf-8")
+            if path.name not in self._checked:
+                data = self._terminate_torn_line(path) + data
+                self._checked.add(path.name)
+            with open(path, "ab") as f:
+                f.write(data)
+                if self.fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+        self._buffers.clear()
+        self._buffered = 0
+        self._buffered_bytes = 0
+        self._oldest = None
+
+    @staticmethod
+    def _terminate_torn_line(path: Path) -> bytes:
+        """Return the bytes needed to end a torn last line in `path` (often none)."""
+        try:
+            with open(path, "rb") as f:
+                f.seek(0, os.SEEK_END)
+                if f.tell() == 0:
+                    return b""
+                f.seek(-1, os.SEEK_END)
+                return b"" if f.read(1) == b"\n" else b"\n"
+        except FileNotFoundError:
+            return b""
+
+    def close(self) -> None:
+        if not self._closed:
+            self.flush()
+            self._closed = True
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
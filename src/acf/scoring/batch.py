@@ -0,0 +1,376 @@
+"""Batch variants of the dimension scorers in `acf.scoring.scorer`.
+
+Sweeps over thousands of system snapshots, and sensitivity analyses, would
+otherwise call the scalar `score_*` functions in a Python loop. Each
+``score_*_batch`` function here takes the same arguments as its scalar
+counterpart. Any argument can be a NumPy array, a sequence or a scalar, and
+scalars broadcast. The result is a `BatchScores` holding one score and one
+sub-level code per snapshot.
+
+With NumPy installed (``pip install acf-framework[numpy]``) each call runs as
+a few array operations. The arithmetic is done in float64 in the same order
+as the scalar function, so every score is bit-identical to the scalar one.
+Without NumPy the batch functions loop over the scalar functions and return
+lists, so results are still identical, just not faster.
+
+Usage:
+    from acf.scoring.batch import score_gba_batch
+
+    batch = score_gba_batch(calibration, ood_rates, graceful, meta)
+    batch.scores      # float64 array
+    batch.sub_levels  # array of codes, e.g. "GBA3"
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from acf.scoring.profile import ACFDimensionScore
+from acf.scoring.scorer import (
+    BLOOM_DEPTH_MAP,
+    score_action_capability,
+    score_autonomy,
+    score_breadth,
+    score_compositional_generalization,
+    score_depth,
+    score_factual_grounding,
+    score_formal_reasoning,
+    score_gba,
+    score_knowledge_transparency,
+    score_service_orientation,
+)
+
+try:
+    import numpy as np
+except ImportError:  # optional extra; the batch functions fall back to loops
+    np = None  # type: ignore[assignment]
+
+_BLOOM_LEVELS = ("L1", "L2", "L3", "L4", "L5", "L6")
+
+
+@dataclass
+class BatchScores:
+    """Scores and sub-level codes for a batch of snapshots of one dimension."""
+
+    dimension: str
+    scores: Any       # float64 ndarray, or list[float] without NumPy
+    sub_levels: Any   # str ndarray, or list[str] without NumPy
+
+    def __len__(self) -> int:
+        return len(self.scores)
+
+    def __getitem__(self, index: int) -> tuple[float, str]:
+        return float(self.scores[index]), str(self.sub_levels[index])
+
+
+def _broadcast(inputs: Sequence[Any]) -> list[list[Any]]:
+    """Pure-Python broadcasting: scalars repeat, sequences must share a length."""
+    lengths = {len(x) for x in inputs if _is_sequence(x)}
+    if len(lengths) > 1:
+        raise ValueError(f"Batch inputs have mismatched lengths {sorted(lengths)}")
+    n = lengths.pop() if lengths else 1
+    return [list(x) if _is_sequence(x) else [x] * n for x in inputs]
+
+
+def _is_sequence(value: Any) -> bool:
+    return hasattr(value, "__len__") and not isinstance(value, (str, bytes))
+
+
+def _loop(
+    dimension: str,
+    scalar: Callable[..., ACFDimensionScore],
+    inputs: Sequence[Any],
+) -> BatchScores:
+    results = [scalar(*row) for row in zip(*_broadcast(inputs))]
+    return BatchScores(dimension, [r.score for r in results], [r.sub_level for r in results])
+
+
+def _arrays(inputs: Sequence[Any]) -> list[Any]:
+    return [np.atleast_1d(a) for a in np.broadcast_arrays(*(np.asarray(x) for x in inputs))]
+
+
+def _batch(
+    dimension: str,
+    scalar: Callable[..., ACFDimensionScore],
+    vector: Callable[..., tuple[Any, Any]],
+    *inputs: Any,
+) -> BatchScores:
+    if np is None:
+        return _loop(dimension, scalar, inputs)
+    scores, sub_levels = vector(*_arrays(inputs))
+    return BatchScores(dimension, scores, sub_levels)
+
+
+def _f(a: Any) -> Any:
+    return a.astype(np.float64, copy=False)
+
+
+def _select(conditions: list[Any], codes: list[str], default: str) -> Any:
+    return np.select(conditions, codes, default)
+
+
+# --- Vector kernels. Each mirrors its scalar scorer expression by expression,
+# so that float64 rounding matches exactly. ---
+
+def _breadth(covered: Any, total: Any, domains: Any, xd_passed: Any, xd_total: Any) -> tuple[Any, Any]:
+    covered, total, xd_passed, xd_total = _f(covered), _f(total), _f(xd_passed), _f(xd_total)
+    defined = total != 0
+    coverage = np.divide(covered, total, out=np.zeros_like(total), where=defined)
+    cross = np.divide(xd_passed, xd_total, out=np.zeros_like(xd_total), where=xd_total > 0)
+    conditions = [
+        ~defined,
+        (coverage >= 0.95) & (domains >= 3) & (cross >= 0.8),
+        (coverage >= 0.80) & (domains >= 2),
+        coverage >= 0.50,
+        coverage > 0,
+    ]
+    scores = np.select(conditions, [
+        0.0,
+        90 + (coverage - 0.95) * 200,
+        60 + (coverage - 0.80) * 150,
+        30 + (coverage - 0.50) * 100,
+        coverage * 60,
+    ], 0.0)
+    return np.minimum(scores, 100.0), _select(conditions, ["B0", "B4", "B3", "B2", "B1"], "B0")
+
+
+def _formal_reasoning(single: Any, multi: Any, proof: Any) -> tuple[Any, Any]:
+    single, multi, proof = _f(single), _f(multi), _f(proof)
+    scores = single * 30 + multi * 40 + proof * 30
+    sub_levels = _select(
+        [proof >= 0.5, multi >= 0.5, single >= 0.5, single > 0],
+        ["FR4", "FR3", "FR2", "FR1"], "FR0",
+    )
+    return np.minimum(scores, 100.0), sub_levels
+
+
+def _factual_grounding(provenance: Any, hallucination: Any) -> tuple[Any, Any]:
+    provenance, hallucination = _f(provenance), _f(hallucination)
+    correctness = 1.0 - hallucination
+    scores = (provenance * 0.6 + correctness * 0.4) * 100
+    sub_levels = _select(
+        [
+            (provenance >= 0.99) & (hallucination == 0),
+            (provenance >= 0.90) & (hallucination < 0.02),
+            (provenance >= 0.50) & (hallucination < 0.10),
+            provenance > 0,
+        ],
+        ["FG4", "FG3", "FG2", "FG1"], "FG0",
+    )
+    return np.minimum(scores, 100.0), sub_levels
+
+
+def _compositional_generalization(known: Any, novel: Any, scan: Any) -> tuple[Any, Any]:
+    known, novel, scan = _f(known), _f(novel), _f(scan)
+    scores = known * 30 + novel * 35 + scan * 35
+    sub_levels = _select([scan >= 0.5, novel >= 0.5, known > 0], ["CG3", "CG2", "CG1"], "CG0")
+    return np.minimum(scores, 100.0), sub_levels
+
+
+def _knowledge_transparency(inspectable: Any, queryable: Any, trace: Any) -> tuple[Any, Any]:
+    inspectable, queryable, trace = inspectable.astype(bool), queryable.astype(bool), _f(trace)
+    scores = np.where(inspectable, 0.0 + 33, 0.0)
+    scores = np.where(queryable, scores + 33, scores)
+    scores = scores + trace * 34
+    sub_levels = _select(
+        [queryable & (trace >= 0.8), queryable, inspectable], ["KT3", "KT2", "KT1"], "KT0",
+    )
+    return np.minimum(scores, 100.0), sub_levels
+
+
+def _service_orientation(completion: Any, explanation: Any, trust: Any) -> tuple[Any, Any]:
+    completion, explanation, trust = _f(completion), _f(explanation), _f(trust)
+    scores = completion * 40 + explanation * 30 + trust * 30
+    sub_levels = _select(
+        [(completion >= 0.9) & (trust >= 0.8), completion >= 0.7, completion >= 0.4, completion > 0],
+        ["SO4", "SO3", "SO2", "SO1"], "SO0",
+    )
+    return np.minimum(scores, 100.0), sub_levels
+
+
+def _gba(calibration: Any, ood: Any, graceful: Any, meta: Any) -> tuple[Any, Any]:
+    calibration, ood, graceful, meta = _f(calibration), _f(ood), _f(graceful), _f(meta)
+    weighted = calibration * 0.3 + ood * 0.4 + graceful * 0.2 + meta * 0.1
+    scores = weighted * 100
+    sub_levels = _select(
+        [weighted >= 0.90, weighted >= 0.75, weighted >= 0.50, weighted > 0],
+        ["GBA4", "GBA3", "GBA2", "GBA1"], "GBA0",
+    )
+    return np.minimum(scores, 100.0), sub_levels
+
+
+def _action_capability(per: Any, scr: Any, acr: Any) -> tuple[Any, Any]:
+    composite = _f(per) * _f(scr) * _f(acr)
+    scores = composite * 100.0
+    sub_levels = _select(
+        [scores >= 75, scores >= 60, scores >= 30, scores >= 15], ["AC4", "AC3", "AC2", "AC1"], "AC0",
+    )
+    return np.minimum(scores, 100.0), sub_levels
+
+
+def _autonomy(rate: Any, gaps: Any, self_directed: Any) -> tuple[Any, Any]:
+    rate, gaps = _f(rate), _f(gaps)
+    scores = rate * 50 + gaps * 30
+    scores = np.where(self_directed.astype(bool), scores + 20, scores)
+    sub_levels = _select(
+        [scores >= 80, (scores >= 50) & (gaps > 0.5), gaps > 0.3, rate > 0],
+        ["AU4", "AU3", "AU2", "AU1"], "AU0",
+    )
+    return np.minimum(scores, 100.0), sub_levels
+
+
+# --- Public batch API ---
+
+def score_breadth_batch(
+    topics_covered: Any,
+    topics_total: Any,
+    domain_count: Any,
+    cross_domain_passed: Any = 0,
+    cross_domain_total: Any = 0,
+) -> BatchScores:
+    """Batch `score_breadth`."""
+    return _batch(
+        "breadth", score_breadth, _breadth,
+        topics_covered, topics_total, domain_count, cross_domain_passed, cross_domain_total,
+    )
+
+
+def score_depth_batch(
+    bloom_scores: Mapping[str, Any],
+    highest_bloom_demonstrated: Any = "",
+) -> BatchScores:
+    """Batch `score_depth`.
+
+    `bloom_scores` maps each level ("L1".."L6") to that level's accuracy for
+    every snapshot. Levels left out count as 0.0, as they do in the scalar
+    scorer. An empty mapping scores every snapshot L0.
+    """
+    levels = [level for level in _BLOOM_LEVELS if level in bloom_scores]
+    unknown = set(bloom_scores) - set(_BLOOM_LEVELS)
+    if unknown:
+        raise ValueError(f"Unknown Bloom levels: {sorted(unknown)}")
+    inputs = [bloom_scores[level] for level in levels] + [highest_bloom_demonstrated]
+    if np is None:
+        columns = _broadcast(inputs)
+        results = [
+            score_depth(dict(zip(levels, row[:-1])), row[-1])
+            for row in zip(*columns)
+        ]
+        return BatchScores("depth", [r.score for r in results], [r.sub_level for r in results])
+
+    *accuracies, override = _arrays(inputs)
+    if not levels:
+        return BatchScores("depth", np.zeros(override.shape), np.full(override.shape, "L0"))
+    by_level = dict(zip(levels, (_f(a) for a in accuracies)))
+    zero = np.zeros(override.shape, dtype=np.float64)
+    # Highest level at >= 0.5, scanning down from L6 as the scalar scorer does.
+    highest = np.full(override.shape, "L0", dtype="<U2")
+    for level in _BLOOM_LEVELS:
+        if level in by_level:
+            highest = np.where(by_level[level] >= 0.5, level, highest)
+    override = override.astype(str)
+    highest = np.where(override != "", override, highest)
+    base = np.zeros(override.shape, dtype=np.int64)
+    performance = zero
+    for level, accuracy in by_level.items():
+        performance = np.where(highest == level, accuracy, performance)
+    for level, points in BLOOM_DEPTH_MAP.items():
+        base = np.where(highest == level, points, base)
+    scores = np.minimum(base + performance * 10, 100.0)
+    return BatchScores("depth", scores, highest)
+
+
+def score_formal_reasoning_batch(
+    single_step_accuracy: Any = 0.0,
+    multi_step_accuracy: Any = 0.0,
+    proof_construction: Any = 0.0,
+) -> BatchScores:
+    """Batch `score_formal_reasoning`."""
+    return _batch(
+        "formal_reasoning", score_formal_reasoning, _formal_reasoning,
+        single_step_accuracy, multi_step_accuracy, proof_construction,
+    )
+
+
+def score_factual_grounding_batch(provenance_rate: Any, hallucination_rate: Any) -> BatchScores:
+    """Batch `score_factual_grounding`."""
+    return _batch(
+        "factual_grounding", score_factual_grounding, _factual_grounding,
+        provenance_rate, hallucination_rate,
+    )
+
+
+def score_compositional_generalization_batch(
+    known_composition_accuracy: Any = 0.0,
+    novel_combination_accuracy: Any = 0.0,
+    scan_cogs_accuracy: Any = 0.0,
+) -> BatchScores:
+    """Batch `score_compositional_generalization`."""
+    return _batch(
+        "compositional_generalization", score_compositional_generalization,
+        _compositional_generalization,
+        known_composition_accuracy, novel_combination_accuracy, scan_cogs_accuracy,
+    )
+
+
+def score_knowledge_transparency_batch(
+    inspectable: Any = False,
+    queryable: Any = False,
+    traceable_provenance_rate: Any = 0.0,
+) -> BatchScores:
+    """Batch `score_knowledge_transparency`."""
+    return _batch(
+        "knowledge_transparency", score_knowledge_transparency, _knowledge_transparency,
+        inspectable, queryable, traceable_provenance_rate,
+    )
+
+
+def score_service_orientation_batch(
+    task_completion_rate: Any = 0.0,
+    explanation_quality: Any = 0.0,
+    user_trust_score: Any = 0.0,
+) -> BatchScores:
+    """Batch `score_service_orientation`."""
+    return _batch(
+        "service_orientation", score_service_orientation, _service_orientation,
+        task_completion_rate, explanation_quality, user_trust_score,
+    )
+
+
+def score_gba_batch(
+    gba1_calibration: Any,
+    gba2_ood_detection: Any,
+    gba3_graceful: Any = 0.0,
+    gba4_meta: Any = 0.0,
+) -> BatchScores:
+    """Batch `score_gba`."""
+    return _batch(
+        "gba", score_gba, _gba,
+        gba1_calibration, gba2_ood_detection, gba3_graceful, gba4_meta,
+    )
+
+
+def score_action_capability_batch(
+    procedure_execution_rate: Any,
+    step_completion_rate: Any,
+    answer_correctness_rate: Any,
+) -> BatchScores:
+    """Batch `score_action_capability`."""
+    return _batch(
+        "action_capability", score_action_capability, _action_capability,
+        procedure_execution_rate, step_completion_rate, answer_correctness_rate,
+    )
+
+
+def score_autonomy_batch(
+    autonomy_rate: Any,
+    gap_detection_rate: Any = 0.0,
+    self_directed_learning: Any = False,
+) -> BatchScores:
+    """Batch `score_autonomy`."""
+    return _batch(
+        "autonomy", score_autonomy, _autonomy,
+        autonomy_rate, gap_detection_rate, self_directed_learning,
+    )
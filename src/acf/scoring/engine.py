@@ -0,0 +1,285 @@
+"""Single-pass scoring of experiment-run records into ACF profiles.
+
+`ScoringEngine` consumes records one at a time, from any iterable, a data
+file or a data directory. It keeps only running state for each
+(system, measure) pair: the record count per system, the system version,
+and the record that currently stands for each measure. Memory therefore
+grows with the number of systems and measures, not with the number of
+records. `score` turns that state into an `ACFProfile` at any point.
+
+Scoring rules (the ones `acf score` has always used):
+
+- only ``experiment-run`` records count. The system is the record's
+  ``system_id``, else its legacy ``being``, else ``"unknown"``;
+- the latest record for a measure stands for it, by parsed ``timestamp``,
+  whatever order the files or lines come in. Undated records rank below
+  dated ones, and on a tie the record seen first is kept (files are read
+  in sorted order). The system version is taken the same way, from the
+  system's latest record;
+- each dimension scores the mean of its measures' values, normalised to
+  0-100 (values in [0, 1] are fractions). The sub-level comes from a
+  `SubLevelTable`: the highest one whose range starts at or below that
+  score. The confidence is
+  "measured" from 3 measures up, "estimated" below that;
+- measures that map to no dimension are reported as unmapped.
+
+By default records are partitioned by system only. With
+``by_version=True`` each (system, version) pair is its own partition, and
+`score_all` yields one profile per pair. This scores every system and
+release in a shared results directory in a single scan.
+
+`since` and `until` restrict scoring to a time slice: records dated in
+``[since, until)`` count, and undated records are dropped. JSONL shards
+named ``<prefix>-YYYY-MM-DD.jsonl``, as `acf.measures.sinks.JsonlSink`
+writes them, only hold records from that UTC day. `consume_path` therefore
+skips shards that lie wholly outside the window without reading them.
+
+Usage:
+    from acf.scoring.engine import ScoringEngine
+
+    engine = ScoringEngine.from_graph(graph)
+    engine.consume_path(Path("data/"))
+    result = engine.score()  # the system with the most records
+    print(result.profile.certification_level)
+
+    engine = ScoringEngine.from_graph(graph, by_version=True)
+    engine.consume_path(Path("data/"))
+    for result in engine.score_all():
+        print(result.profile.system_id, result.profile.version)
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from acf.data.loader import data_files, iter_records
+from acf.scoring.profile import ACFDimensionScore, ACFProfile
+from acf.scoring.sublevels import SubLevelTable
+from acf.utils.timestamps import parse_timestamp
+
+if TYPE_CHECKING:
+    from acf.graph import ACFGraph
+
+
+@dataclass
+class MeasureState:
+    """The record that currently stands for one (system, measure) pair."""
+
+    value: Any
+    passed: bool
+    timestamp: datetime | None = None
+
+
+@dataclass
+class SystemState:
+    """Running state for one system: record count, version and per-measure records."""
+
+    system_id: str
+    version: str
+    n_records: int = 0
+    measures: dict[str, MeasureState] = field(default_factory=dict)
+    version_timestamp: datetime | None = None
+
+
+def _newer(stamp: datetime | None, current: datetime | None) -> bool:
+    """Whether a record dated `stamp` replaces one dated `current` (undated ranks lowest)."""
+    return stamp is not None and (current is None or stamp > current)
+
+
+def _as_utc(moment: datetime | None) -> datetime | None:
+    if moment is None:
+        return None
+    if moment.tzinfo is None:
+        return moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc)
+
+
+# JsonlSink shard names: <prefix>-YYYY-MM-DD.jsonl, dated by the records' UTC day.
+_SHARD_DATE = re.compile(r"-(\d{4}-\d{2}-\d{2})\.jsonl$")
+
+
+@dataclass
+class SystemScore:
+    """A scored system: its profile plus the measures no dimension claimed."""
+
+    profile: ACFProfile
+    unmapped: list[str]
+    n_records: int
+
+
+def _normalize(value: float) -> float:
+    # Values in [0, 1] are fractions; anything else is already on the 0-100 scale.
+    if 0.0 <= value <= 1.0:
+        return value * 100
+    return min(value, 100.0)
+
+
+class ScoringEngine:
+    """Fold experiment-run records into per-system state, then score profiles from it."""
+
+    def __init__(
+        self,
+        measure_dimensions: Mapping[str, Sequence[str]],
+        sub_levels: SubLevelTable,
+        system_id: str | None = None,
+        by_version: bool = False,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> None:
+        """
+        Args:
+            measure_dimensions: measure id -> ids of the dimensions it maps to.
+            sub_levels: compiled score -> sub-level ranges per dimension.
+            system_id: if given, records from every other system are dropped.
+            by_version: partition by (system, version) instead of by system.
+            since, until: only score records dated in ``[since, until)``.
+                Naive datetimes are taken as UTC.
+        """
+        self.measure_dimensions = measure_dimensions
+        self.sub_levels = sub_levels
+        self.system_filter = system_id
+        self.by_version = by_version
+        self.since = _as_utc(since)
+        self.until = _as_utc(until)
+        # Keyed by (system, version), or by (system, None) unless by_version.
+        self.states: dict[tuple[str, str | None], SystemState] = {}
+
+    @classmethod
+    def from_graph(
+        cls, graph: ACFGraph, system_id: str | None = None, by_version: bool = False,
+        since: datetime | None = None, until: datetime | None = None,
+    ) -> ScoringEngine:
+        """An engine using the graph's measure→dimension mappings and sub-levels."""
+        return cls(
+            {m.id: m.dimensions for m in graph.measures()}, SubLevelTable.from_graph(graph),
+            system_id, by_version, since, until,
+        )
+
+    @property
+    def windowed(self) -> bool:
+        return self.since is not None or self.until is not None
+
+    def add(self, record: Any) -> bool:
+        """Fold in one record; return whether it was a scorable experiment run."""
+        if not isinstance(record, dict) or record.get("record_type") != "experiment-run":
+            return False
+        sid = record.get("system_id") or record.get("being", "unknown")
+        if self.system_filter and sid != self.system_filter:
+            return False
+        stamp = parse_timestamp(record.get("timestamp"))  # parsed once, compared as datetimes
+        if self.windowed and (
+            stamp is None
+            or (self.since is not None and stamp < self.since)
+            or (self.until is not None and stamp >= self.until)
+        ):
+            return False
+        version = record.get("system_version", "")
+        key = (sid, version if self.by_version else None)
+        state = self.states.get(key)
+        if state is None:
+            state = self.states[key] = SystemState(sid, version, version_timestamp=stamp)
+        elif _newer(stamp, state.version_timestamp):
+            state.version, state.version_timestamp = version, stamp
+        state.n_records += 1
+        mid = record.get("measure_id", "")
+        current = state.measures.get(mid)
+        if current is None or _newer(stamp, current.timestamp):
+            state.measures[mid] = MeasureState(record.get("value", 0.0), record.get("pass", False), stamp)
+        return True
+
+    def consume(self, records: Iterable[Any]) -> int:
+        """Fold in a stream of records; return how many were scorable."""
+        return sum(self.add(record) for record in records)
+
+    def consume_path(self, data_path: Path) -> int:
+        """Stream the records of a data file, or of every data file in a directory."""
+        files = data_files(data_path) if data_path.is_dir() else [data_path]
+        return sum(
+            self.consume(record for _, record in iter_records(f))
+            for f in files if not self._outside_window(f)
+        )
+
+    def _outside_window(self, path: Path) -> bool:
+        """Whether a dated JSONL shard can hold no record inside the window."""
+        match = _SHARD_DATE.search(path.name) if self.windowed else None
+        if match is None:
+            return False
+        try:
+            day = datetime.strptime(match.group(1), "%Y-%m-%d").replace(tzinfo=timezone.utc)
+        except ValueError:
+            return False
+        return (self.until is not None and day >= self.until) or (
+            self.since is not None and day + timedelta(days=1) <= self.since
+        )
+
+    @property
+    def record_counts(self) -> dict[str, int]:
+        """Scorable records per system (all versions together), in first-seen order."""
+        counts: dict[str, int] = {}
+        for (sid, _), state in self.states.items():
+            counts[sid] = counts.get(sid, 0) + state.n_records
+        return counts
+
+    def primary_system(self) -> str | None:
+        """The system with the most records (the first seen on a tie), or None if empty."""
+        counts = self.record_counts
+        return max(counts, key=lambda s: counts[s]) if counts else None
+
+    def score(self, system_id: str | None = None, version: str | None = None) -> SystemScore | None:
+        """Score one system (default: `primary_system`). None if it has no records.
+
+        With `by_version`, `version` picks the partition; it defaults to the
+        system's first-seen version.
+        """
+        sid = system_id or self.primary_system()
+        if sid is None:
+            return None
+        if not self.by_version:
+            state = self.states.get((sid, None))
+        elif version is not None:
+            state = self.states.get((sid, version))
+        else:
+            state = next((s for (k, _), s in self.states.items() if k == sid), None)
+        return self._score_state(state) if state is not None else None
+
+    def score_all(self) -> Iterator[SystemScore]:
+        """Score every partition, in first-seen order."""
+        for state in self.states.values():
+            yield self._score_state(state)
+
+    def _score_state(self, state: SystemState) -> SystemScore:
+        by_dimension: dict[str, list[MeasureState]] = {}
+        unmapped: list[str] = []
+        for mid, measure in state.measures.items():
+            dims = self.measure_dimensions.get(mid, [])
+            if not dims:
+                unmapped.append(mid)
+            for dim in dims:
+                by_dimension.setdefault(dim, []).append(measure)
+
+        dimensions: dict[str, ACFDimensionScore] = {}
+        for dim_id, measures in sorted(by_dimension.items()):
+            total = len(measures)
+            passed = sum(1 for m in measures if m.passed)
+            values = [_normalize(m.value) for m in measures if m.value is not None]
+            avg_value = sum(values) / len(values) if values else 0.0
+            dimensions[dim_id] = ACFDimensionScore(
+                dimension=dim_id,
+                score=round(avg_value, 1),
+                sub_level=self.sub_levels.lookup(dim_id, avg_value),
+                evidence=f"{passed}/{total} measures passed, avg={avg_value:.1f}",
+                confidence="measured" if total >= 3 else "estimated",
+            )
+
+        profile = ACFProfile(
+            system_id=state.system_id,
+            system_type="unknown",
+            version=state.version,
+            dimensions=dimensions,
+        )
+        return SystemScore(profile, unmapped, state.n_records)
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, TypeVar, cast
+
+_T = TypeVar("_T")
 
 # ACF v1.2 dimension weights (must sum to 1.0).
 # Per ACF Specification v1.2 Section 3.2. v1.2 adds the modular-capability
@@ -130,9 +133,28 @@ class ACFProfile:
 
     dimensions: dict[str, ACFDimensionScore] = field(default_factory=dict)
 
+    def _derived(self, name: str, compute: Callable[[], _T]) -> _T:
+        """Return a cached value computed from `dimensions`, recomputing if they changed.
+
+        The cache is keyed on the (name, score) pairs, so it follows edits to
+        the dict and to the scores in it alike.
+        """
+        key = tuple((dim, d.score) for dim, d in self.dimensions.items())
+        cache = self.__dict__.setdefault("_derived_cache", {})
+        entry = cache.get(name)
+        if entry is None or entry[0] != key:
+            entry = cache[name] = (key, compute())
+        return cast(_T, entry[1])
+
     @property
     def aggregate_score(self) -> float:
-        """Weighted average of all dimension scores using v1.2 weights."""
+        """Weighted average of all dimension scores using v1.2 weights.
+
+        Cached until `dimensions` or one of its scores changes.
+        """
+        return self._derived("aggregate_score", self._aggregate_score)
+
+    def _aggregate_score(self) -> float:
         if not self.dimensions:
             return 0.0
         total_weight = 0.0
@@ -158,7 +180,12 @@ class ACFProfile:
         provide a score for one, it is treated as N/A and does not gate — so a
         system that loads no capability modules is not penalized for a paradigm
         it does not use.
+
+        Cached until `dimensions` or one of its scores changes.
         """
+        return self._derived("certification_level", self._certification_level)
+
+    def _certification_level(self) -> str:
         dim_scores = {name: d.score for name, d in self.dimensions.items()}
 
         for level in _LEVEL_ORDER:
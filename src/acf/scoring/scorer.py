@@ -8,8 +8,13 @@ a complete ACFProfile with certification level.
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from acf.scoring.profile import ACFDimensionScore, ACFProfile
 
+if TYPE_CHECKING:
+    from acf.data.columnar import PerQueryColumns
+
 # Bloom level to depth score mapping (ACF v1.1 Section 5.4 midpoints)
 BLOOM_DEPTH_MAP = {
     "L1": 10,   # Remember — base score 10
@@ -99,6 +104,18 @@ def score_depth(
     )
 
 
+def score_depth_from_columns(
+    columns: PerQueryColumns,
+    system_id: str | None = None,
+) -> ACFDimensionScore:
+    """Score Depth directly from a columnar per-query store.
+
+    Per-level accuracy is computed in one pass over the ``bloom_level`` and
+    ``correct`` columns instead of materializing every record.
+    """
+    return score_depth(columns.bloom_accuracy(system_id))
+
+
 def score_formal_reasoning(
     single_step_accuracy: float = 0.0,
     multi_step_accuracy: float = 0.0,
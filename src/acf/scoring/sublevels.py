@@ -0,0 +1,106 @@
+"""Compiled score → sub-level lookup tables.
+
+Each ACF sub-level has a ``score_range`` string such as ``"40-59"`` or
+``"40–59"`` (with an en dash). A dimension score maps to the highest
+sub-level whose range starts at or below it. `SubLevelTable` parses every
+range once into a sorted tuple of numeric lower bounds per dimension, and
+each lookup is then a `bisect`, with no per-score string parsing or
+sub-level scans. `acf.scoring.engine.ScoringEngine`, and so `acf score`,
+map scores through it.
+
+The result is the same as the old linear rule "walk the sub-levels from the
+last to the first and take the first whose lower bound is <= score", even
+if the ranges are listed out of order. Sub-levels with an empty or
+unparseable range are never chosen by score. A score below every bound
+(or NaN) gets the dimension's first sub-level, or "?" if the dimension has
+none.
+
+Usage:
+    from acf.scoring.sublevels import SubLevelTable
+
+    table = SubLevelTable.from_graph(graph)
+    table.lookup("depth", 63.5)  # -> "L4"
+"""
+
+from __future__ import annotations
+
+import math
+from bisect import bisect_right
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from acf.graph import ACFGraph, SubLevel
+
+UNKNOWN_SUB_LEVEL = "?"
+
+
+def range_lower_bound(score_range: str) -> float | None:
+    """The numeric lower bound of a ``score_range`` string, or None if it has none."""
+    if not score_range:
+        return None
+    try:
+        return float(score_range.replace("–", "-").split("-")[0].strip())
+    except ValueError:
+        return None
+
+
+@dataclass(frozen=True)
+class SubLevelRanges:
+    """One dimension's sub-levels as ascending lower bounds for bisect lookup."""
+
+    dimension: str
+    bounds: tuple[float, ...]   # strictly ascending
+    ids: tuple[str, ...]        # ids[i] applies from bounds[i] up to bounds[i + 1]
+    fallback: str               # below every bound: the first listed sub-level
+
+    @classmethod
+    def compile(cls, dimension: str, sub_levels: Sequence[SubLevel]) -> SubLevelRanges:
+        """Compile sub-levels, listed lowest first, into a boundary table."""
+        bounds: list[float] = []
+        ids: list[str] = []
+        # Walking from the last sub-level back, keep only those whose bound is
+        # below every later one: a later sub-level with a lower or equal bound
+        # would always win, so the rest can never be chosen.
+        ceiling = float("inf")
+        for sl in reversed(sub_levels):
+            low = range_lower_bound(sl.score_range)
+            if low is not None and low < ceiling:
+                bounds.append(low)
+                ids.append(sl.id)
+                ceiling = low
+        bounds.reverse()
+        ids.reverse()
+        fallback = sub_levels[0].id if sub_levels else UNKNOWN_SUB_LEVEL
+        return cls(dimension, tuple(bounds), tuple(ids), fallback)
+
+    def lookup(self, score: float) -> str:
+        i = bisect_right(self.bounds, score) - 1
+        if i < 0 or math.isnan(score):  # below every bound, or NaN
+            return self.fallback
+        return self.ids[i]
+
+
+class SubLevelTable:
+    """Compiled `SubLevelRanges` for every dimension."""
+
+    def __init__(self, ranges: Iterable[SubLevelRanges] = ()) -> None:
+        self.ranges = {r.dimension: r for r in ranges}
+
+    @classmethod
+    def from_sub_levels(cls, sub_levels: Iterable[SubLevel]) -> SubLevelTable:
+        """Compile sub-levels for any number of dimensions, each listed lowest first."""
+        by_dimension: dict[str, list[SubLevel]] = {}
+        for sl in sub_levels:
+            by_dimension.setdefault(sl.dimension_id, []).append(sl)
+        return cls(SubLevelRanges.compile(dim, subs) for dim, subs in by_dimension.items())
+
+    @classmethod
+    def from_graph(cls, graph: ACFGraph) -> SubLevelTable:
+        return cls.from_sub_levels(graph.sub_levels())
+
+    def lookup(self, dimension: str, score: float) -> str:
+        """The sub-level id for `score` on `dimension` ("?" for an unknown dimension)."""
+        ranges = self.ranges.get(dimension)
+        return ranges.lookup(score) if ranges is not None else UNKNOWN_SUB_LEVEL
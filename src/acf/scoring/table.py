@@ -0,0 +1,183 @@
+"""Dense systems × dimensions table of many ACF profiles.
+
+`ACFProfile.aggregate_score` and `certification_level` walk the profile's
+dimension dict in Python each time they are read. Comparing thousands of
+systems (snapshots, ablations, a leaderboard) therefore costs thousands of
+those loops. `ProfileTable` stores the scores as one float64 matrix, with a
+row per profile and a column per dimension, plus a mask of which scores
+were provided. It computes every row's aggregate score and certification
+level in a few array operations. The rules are the same as in `ACFProfile`:
+
+- the aggregate is the `DIMENSION_WEIGHTS`-weighted sum of the provided
+  scores. A row with no weighted dimension falls back to the plain mean of
+  whatever it has, and an empty row scores 0;
+- certification is the highest level in `CERTIFICATION_THRESHOLDS` that
+  every applicable dimension meets. A missing core dimension counts as 0.
+  A missing modular-capability dimension is N/A and does not gate.
+
+Certification levels are identical to the `ACFProfile` values. Aggregates
+are too, down to the last float bit, for profiles whose dimensions are in
+`DIMENSION_WEIGHTS` order; `ACFProfile` sums in insertion order, so other
+orders can differ in the last bits.
+
+Requires NumPy (``pip install acf-framework[numpy]``).
+
+Usage:
+    from acf.scoring.table import ProfileTable
+
+    table = ProfileTable.from_profiles(profiles)
+    for system_id, level in zip(table.system_ids, table.certification_levels):
+        ...
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from functools import cached_property
+from typing import Any
+
+from acf.scoring.profile import (
+    _LEVEL_ORDER,
+    CERTIFICATION_LABELS,
+    CERTIFICATION_THRESHOLDS,
+    DIMENSION_WEIGHTS,
+    MODULAR_CAPABILITY_DIMS,
+    ACFProfile,
+)
+
+try:
+    import numpy as np
+except ImportError:  # optional extra; ProfileTable raises on construction
+    np = None  # type: ignore[assignment]
+
+# Column order: the weighted dimensions, then any dimension only a threshold names.
+DIMENSIONS: tuple[str, ...] = tuple(DIMENSION_WEIGHTS) + tuple(
+    dim
+    for level in _LEVEL_ORDER
+    for dim in CERTIFICATION_THRESHOLDS[level]
+    if dim not in DIMENSION_WEIGHTS
+)
+_COLUMN = {dim: j for j, dim in enumerate(DIMENSIONS)}
+
+
+class ProfileTable:
+    """Scores of many profiles as a systems × `DIMENSIONS` matrix with an N/A mask."""
+
+    def __init__(
+        self,
+        system_ids: Sequence[str],
+        versions: Sequence[str],
+        scores: Any,
+        present: Any,
+        other_sum: Any = None,
+        other_count: Any = None,
+    ) -> None:
+        """Wrap prebuilt arrays; most callers want `from_profiles`.
+
+        `scores` and `present` are ``(n, len(DIMENSIONS))`` arrays. Scores
+        under a False `present` entry are ignored. `other_sum` and
+        `other_count` hold each row's total and count of scores on
+        dimensions outside `DIMENSIONS`, which only matter to the
+        plain-mean fallback. Both default to zero.
+        """
+        if np is None:
+            raise ImportError("ProfileTable needs NumPy: pip install acf-framework[numpy]")
+        n = len(system_ids)
+        self.system_ids = list(system_ids)
+        self.versions = list(versions)
+        self.scores = np.asarray(scores, dtype=np.float64).reshape(n, len(DIMENSIONS))
+        self.present = np.asarray(present, dtype=bool).reshape(n, len(DIMENSIONS))
+        self.other_sum = np.zeros(n) if other_sum is None else np.asarray(other_sum, dtype=np.float64)
+        self.other_count = (
+            np.zeros(n, dtype=np.int64) if other_count is None else np.asarray(other_count, dtype=np.int64)
+        )
+        if len(self.versions) != n or self.other_sum.shape != (n,) or self.other_count.shape != (n,):
+            raise ValueError("ProfileTable columns must all have one entry per system")
+
+    @classmethod
+    def from_profiles(cls, profiles: Iterable[ACFProfile]) -> ProfileTable:
+        profiles = list(profiles)
+        if np is None:
+            raise ImportError("ProfileTable needs NumPy: pip install acf-framework[numpy]")
+        n = len(profiles)
+        scores = np.zeros((n, len(DIMENSIONS)))
+        present = np.zeros((n, len(DIMENSIONS)), dtype=bool)
+        other_sum = np.zeros(n)
+        other_count = np.zeros(n, dtype=np.int64)
+        for i, profile in enumerate(profiles):
+            for name, dim in profile.dimensions.items():
+                j = _COLUMN.get(name)
+                if j is None:
+                    other_sum[i] += dim.score
+                    other_count[i] += 1
+                else:
+                    scores[i, j] = dim.score
+                    present[i, j] = True
+        return cls(
+            [p.system_id for p in profiles], [p.version for p in profiles],
+            scores, present, other_sum, other_count,
+        )
+
+    def __len__(self) -> int:
+        return len(self.system_ids)
+
+    def column(self, dimension: str) -> Any:
+        """One dimension's scores as a masked array (masked where N/A)."""
+        j = _COLUMN[dimension]
+        return np.ma.masked_array(self.scores[:, j], mask=~self.present[:, j])
+
+    @cached_property
+    def aggregate_scores(self) -> Any:
+        """Per-row aggregate score (float64 array), as `ACFProfile.aggregate_score`."""
+        weights = np.array([DIMENSION_WEIGHTS.get(dim, 0.0) for dim in DIMENSIONS])
+        weighted = self.present & (weights > 0)
+        given = np.where(self.present, self.scores, 0.0)
+        # Accumulate column by column, in DIMENSION_WEIGHTS order, rather than
+        # with a pairwise .sum(), so the float results match ACFProfile's
+        # exactly for profiles built in that order.
+        weighted_sum = np.zeros(len(self))
+        for j, w in enumerate(weights):
+            if w > 0:
+                weighted_sum = np.where(weighted[:, j], weighted_sum + given[:, j] * w, weighted_sum)
+        count = self.present.sum(axis=1) + self.other_count
+        plain_mean = np.divide(
+            given.sum(axis=1) + self.other_sum, count,
+            out=np.zeros(len(self)), where=count > 0,
+        )
+        return np.where(weighted.any(axis=1), weighted_sum, plain_mean)
+
+    @cached_property
+    def certification_levels(self) -> Any:
+        """Per-row certification level codes ("ACF-0".."ACF-6"), highest passing level first."""
+        thresholds = np.array([
+            [CERTIFICATION_THRESHOLDS[level].get(dim, -np.inf) for dim in DIMENSIONS]
+            for level in _LEVEL_ORDER
+        ])  # (levels, dims); -inf: the level does not gate on that dimension
+        modular = np.array([dim in MODULAR_CAPABILITY_DIMS for dim in DIMENSIONS])
+        given = np.where(self.present, self.scores, 0.0)
+        exempt = ~self.present & modular  # N/A modular dimensions never gate
+        # (rows, levels, dims) -> (rows, levels)
+        passes = ((given[:, None, :] >= thresholds[None, :, :]) | exempt[:, None, :]).all(axis=2)
+        first = passes.argmax(axis=1)
+        codes = np.array(_LEVEL_ORDER + ["ACF-0"])
+        return codes[np.where(passes.any(axis=1), first, len(_LEVEL_ORDER))]
+
+    @property
+    def certification_labels(self) -> list[str]:
+        return [CERTIFICATION_LABELS.get(str(level), "Unknown") for level in self.certification_levels]
+
+    def to_records(self) -> list[dict[str, Any]]:
+        """One summary dict per row, with the same rounding as `ACFProfile.to_dict`."""
+        return [
+            {
+                "system_id": system_id,
+                "version": version,
+                "aggregate_score": round(float(aggregate), 1),
+                "certification_level": str(level),
+                "certification_label": label,
+            }
+            for system_id, version, aggregate, level, label in zip(
+                self.system_ids, self.versions, self.aggregate_scores,
+                self.certification_levels, self.certification_labels,
+            )
+        ]
@@ -0,0 +1,66 @@
+"""On-disk cache location and write helpers shared by ACF's persistent caches."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+from collections.abc import Iterable
+from pathlib import Path
+
+# Environment override for the cache root. Setting it to an empty string is NOT
+# the same as unsetting it: an explicit empty value disables persistence entirely
+# (callers receive None), which is what CI and read-only containers want.
+CACHE_ENV_VAR = "ACF_CACHE_DIR"
+
+
+def cache_root() -> Path | None:
+    """Return the directory ACF persists caches under, or None when disabled.
+
+    Resolution order: ``$ACF_CACHE_DIR``, then ``$XDG_CACHE_HOME/acf``, then
+    ``~/.cache/acf``. The directory is not created here — writers create it
+    lazily so a read-only environment never fails at import or construction.
+    """
+    override = os.environ.get(CACHE_ENV_VAR)
+    if override is not None:
+        return Path(override).expanduser() if override else None
+    xdg = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg).expanduser() if xdg else Path.home() / ".cache"
+    return base / "acf"
+
+
+def hash_files(root: Path, files: Iterable[Path], extra: Iterable[str] = ()) -> str:
+    """Return a SHA-256 hex digest over file paths (relative to `root`) and contents.
+
+    Paths are hashed alongside contents so that renaming or moving a file
+    invalidates the key even when the bytes are unchanged. `extra` folds in
+    anything else the cached artifact depends on (library versions, format tags).
+    """
+    h = hashlib.sha256()
+    for token in extra:
+        h.update(token.encode("utf-8"))
+        h.update(b"\0")
+    for path in sorted(files):
+        h.update(path.relative_to(root).as_posix().encode("utf-8"))
+        h.update(b"\0")
+        h.update(path.read_bytes())
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write `data` to `path` via a sibling temp file and `os.replace`.
+
+    Concurrent writers (several CLI invocations, a pool of workers) each write
+    their own temp file and the last rename wins; a reader never observes a
+    half-written cache file.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
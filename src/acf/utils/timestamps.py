@@ -0,0 +1,27 @@
+"""Timestamp parsing for ACF data records."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+
+def parse_timestamp(value: object) -> datetime | None:
+    """Parse an ISO 8601 record timestamp into an aware UTC datetime.
+
+    Accepts the trailing ``Z`` the schemas' examples use (which
+    `datetime.fromisoformat` only learned in Python 3.11) and treats naive
+    timestamps as UTC. Returns None for anything missing or unparseable, so
+    callers decide whether an undated record is skipped or sorted first.
+    """
+    if not isinstance(value, str) or not value:
+        return None
+    text = value.strip()
+    if text.endswith(("Z", "z")):
+        text = text[:-1] + "+00:00"
+    try:
+        parsed = datetime.fromisoformat(text)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
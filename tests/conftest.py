@@ -0,0 +1,21 @@
+"""Shared pytest fixtures."""
+
+from __future__ import annotations
+
+import pytest
+
+from acf.utils.cache import CACHE_ENV_VAR
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _hermetic_cache(tmp_path_factory):
+    """Keep graph snapshots and battery/response caches out of the real ~/.cache/acf.
+
+    One root per test session: tests still share snapshots with each other
+    (so the suite stays fast) but never with earlier runs or the developer's
+    own cache. Session-scoped so module-scoped graph fixtures are covered
+    too. Tests that need a cache of their own set ACF_CACHE_DIR again.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv(CACHE_ENV_VAR, str(tmp_path_factory.mktemp("acf-cache")))
+        yield
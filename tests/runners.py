@@ -0,0 +1,26 @@
+"""Battery runners shared by the execution tests."""
+
+from __future__ import annotations
+
+
+class CountingRunner:
+    """Records which items it was asked to run; can die partway through."""
+
+    def __init__(self, die_after: int | None = None):
+        self.calls: list[str] = []
+        self.die_after = die_after
+
+    def run_item(self, item):
+        if self.die_after is not None and len(self.calls) >= self.die_after:
+            raise KeyboardInterrupt  # stands in for the process being killed
+        self.calls.append(item["id"])
+        return {"id": item["id"], "response_text": item["id"].upper()}
+
+
+class AsyncCountingRunner:
+    def __init__(self):
+        self.calls: list[str] = []
+
+    async def run_item(self, item):
+        self.calls.append(item["id"])
+        return {"id": item["id"], "response_text": item["id"].upper()}
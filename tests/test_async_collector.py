@@ -0,0 +1,140 @@
+"""Tests for acf.measures.async_collector."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+
+from acf.data.loader import load_data_files
+from acf.measures.async_collector import AsyncCollector
+from acf.measures.sinks import JsonlSink
+
+
+class _ListSink:
+    """In-memory sink that records how writes were batched."""
+
+    def __init__(self, fail: bool = False):
+        self.records: list = []
+        self.flushes = 0
+        self.closed = False
+        self.fail = fail
+
+    def write(self, record):
+        if self.fail:
+            raise OSError("disk full")
+        self.records.append(record)
+
+    def flush(self):
+        self.flushes += 1
+
+    def close(self):
+        self.closed = True
+
+
+class TestAsyncCollector:
+    def test_records_from_many_coroutines(self, tmp_path):
+        async def main():
+            async with AsyncCollector(JsonlSink(tmp_path), max_queue=8) as collector:
+                await asyncio.gather(*(
+                    collector.record_experiment_run("M-1", "E", f"sys-{i}", "1.0", 0.9, 0.8)
+                    for i in range(50)
+                ))
+            return collector
+
+        collector = asyncio.run(main())
+        assert collector.written == 50
+        assert len(load_data_files(tmp_path)) == 50
+
+    def test_batches_coalesce_flushes(self):
+        sink = _ListSink()
+
+        async def main():
+            async with AsyncCollector(sink, batch_size=100) as collector:
+                for i in range(300):
+                    await collector.record({"i": i})
+
+        asyncio.run(main())
+        assert [r["i"] for r in sink.records] == list(range(300))
+        assert sink.flushes < 300
+        assert sink.closed
+
+    def test_flush_waits_for_writes(self):
+        sink = _ListSink()
+
+        async def main():
+            collector = AsyncCollector(sink)
+            await collector.start()
+            for i in range(10):
+                await collector.record({"i": i})
+            await collector.flush()
+            seen = len(sink.records)
+            await collector.close()
+            return seen
+
+        assert asyncio.run(main()) == 10
+
+    def test_backpressure_bounds_queue(self):
+        sink = _ListSink()
+
+        async def main():
+            gate = asyncio.Event()
+            collector = AsyncCollector(sink, max_queue=2, batch_size=1)
+            original = collector._write_batch
+
+            def slow_write(records):
+                asyncio.run_coroutine_threadsafe(gate.wait(), loop).result()
+                original(records)
+
+            loop = asyncio.get_running_loop()
+            collector._write_batch = slow_write
+            await collector.start()
+            producer = asyncio.gather(*(collector.record({"i": i}) for i in range(10)))
+            await asyncio.sleep(0.05)
+            # One record held by the stalled writer, two queued; the rest wait.
+            assert collector._queue.qsize() == 2
+            assert not producer.done()
+            gate.set()
+            await producer
+            await collector.close()
+
+        asyncio.run(main())
+        assert len(sink.records) == 10
+
+    def test_record_from_threads(self):
+        sink = _ListSink()
+
+        async def main():
+            async with AsyncCollector(sink) as collector:
+                threads = [
+                    threading.Thread(target=collector.record_threadsafe, args=({"t": i},))
+                    for i in range(8)
+                ]
+                for t in threads:
+                    t.start()
+                await asyncio.to_thread(lambda: [t.join() for t in threads])
+
+        asyncio.run(main())
+        assert sorted(r["t"] for r in sink.records) == list(range(8))
+
+    def test_sink_error_surfaces(self):
+        async def main():
+            collector = AsyncCollector(_ListSink(fail=True))
+            await collector.start()
+            await collector.record({"i": 0})
+            with pytest.raises(OSError, match="disk full"):
+                await collector.flush()
+            with pytest.raises(OSError):
+                await collector.close()
+
+        asyncio.run(main())
+
+    def test_rejects_own_destination(self, tmp_path):
+        async def main():
+            async with AsyncCollector(_ListSink()) as collector:
+                with pytest.raises(TypeError):
+                    await collector.record_experiment_run(
+                        "M-1", "E", "sys", "1.0", 0.9, 0.8, data_dir=tmp_path)
+
+        asyncio.run(main())
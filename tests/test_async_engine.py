@@ -0,0 +1,147 @@
+"""Tests for acf.execution.async_engine, run against a local stand-in model server."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+
+import pytest
+from click.testing import CliRunner
+
+from acf.batteries import BATTERY_NAMES, AsyncBatteryRunner, load_battery
+from acf.cli import main
+from acf.execution.async_engine import AsyncBatteryEngine, RateLimiter
+
+
+class StandInServer:
+    """A tiny line-delimited JSON "model server" on localhost.
+
+    Each connection sends one item and receives one answer after `delay`
+    seconds. The server records how many requests were in flight at once
+    and when each arrived, which is what the engine's limits control.
+    """
+
+    def __init__(self, delay: float = 0.02):
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+        self.arrivals: list[float] = []
+        self.port = 0
+        self._server: asyncio.base_events.Server | None = None
+
+    async def __aenter__(self):
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def __aexit__(self, *exc):
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader, writer):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        self.arrivals.append(time.perf_counter())
+        try:
+            item = json.loads(await reader.readline())
+            await asyncio.sleep(self.delay)
+            writer.write(json.dumps({"id": item["id"], "response_text": "42"}).encode() + b"\n")
+            await writer.drain()
+        finally:
+            self.active -= 1
+            writer.close()
+
+
+class RemoteRunner:
+    """An AsyncBatteryRunner that asks the stand-in server."""
+
+    def __init__(self, port: int):
+        self.port = port
+
+    async def run_item(self, item):
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.port)
+        try:
+            payload = {"id": item["id"], "question": item.get("question", "")}
+            writer.write(json.dumps(payload).encode() + b"\n")
+            await writer.drain()
+            return json.loads(await reader.readline())
+        finally:
+            writer.close()
+
+
+class LocalAsyncRunner:
+    async def run_item(self, item):
+        await asyncio.sleep(0)
+        return {"id": item["id"], "response_text": ""}
+
+
+class TestAsyncBatteryEngine:
+    @pytest.mark.parametrize("battery", BATTERY_NAMES)
+    def test_bundled_batteries_with_concurrency_limit(self, battery):
+        async def main():
+            async with StandInServer() as server:
+                engine = AsyncBatteryEngine(RemoteRunner(server.port), concurrency=4)
+                return await engine.run(battery), server
+
+        results, server = asyncio.run(main())
+        assert [r.item_id for r in results] == [item["id"] for item in load_battery(battery)]
+        assert all(r.ok and r.response["response_text"] == "42" for r in results)
+        assert 1 < server.max_active <= 4
+
+    def test_rate_limit_spaces_requests(self):
+        items = load_battery("fr36")[:10]
+
+        async def main():
+            async with StandInServer(delay=0.0) as server:
+                engine = AsyncBatteryEngine(RemoteRunner(server.port), concurrency=10, rate=50)
+                await engine.run(items)
+                return server.arrivals
+
+        arrivals = asyncio.run(main())
+        # 10 starts at 50/s span at least 9 intervals of 20 ms.
+        assert arrivals[-1] - arrivals[0] >= 0.9 * 9 / 50
+
+    def test_timeout_cancels_and_retries(self):
+        calls: list[str] = []
+
+        class SlowOnce:
+            async def run_item(self, item):
+                calls.append(item["id"])
+                if calls.count(item["id"]) == 1:
+                    await asyncio.sleep(10)
+                return {"id": item["id"]}
+
+        items = [{"id": "a"}, {"id": "b"}]
+        engine = AsyncBatteryEngine(SlowOnce(), timeout=0.05, retries=1)
+        start = time.perf_counter()
+        results = asyncio.run(engine.run(items))
+        assert time.perf_counter() - start < 1
+        assert [(r.ok, r.attempts) for r in results] == [(True, 2), (True, 2)]
+
+    def test_errors_recorded(self):
+        class Broken:
+            async def run_item(self, item):
+                raise RuntimeError("boom")
+
+        (result,) = asyncio.run(AsyncBatteryEngine(Broken()).run([{"id": "x"}]))
+        assert result.error == "RuntimeError: boom"
+
+    def test_protocol(self):
+        assert isinstance(LocalAsyncRunner(), AsyncBatteryRunner)
+
+    def test_rate_limiter_rejects_nonpositive(self):
+        with pytest.raises(ValueError):
+            RateLimiter(0)
+
+
+class TestBatteriesRunAsync:
+    def test_cli_uses_async_engine(self):
+        result = CliRunner().invoke(main, [
+            "batteries", "run", "cg100", "--runner", "tests.test_async_engine:LocalAsyncRunner",
+            "--rate", "10000", "--json-output",
+        ])
+        assert result.exit_code == 0, result.output
+        summary = json.loads(result.output)
+        assert summary["completed"] == summary["total"] == len(load_battery("cg100"))
+        assert summary["failed"] == 0
@@ -0,0 +1,142 @@
+"""Tests for acf.scoring.batch — batch scorers must match the scalar ones bit for bit."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from acf.scoring import batch, scorer
+
+# Boundary values from the scalar scorers' thresholds, plus random fill.
+_EDGES = [0.0, 0.01, 0.02, 0.1, 0.15, 0.3, 0.4, 0.5, 0.6, 0.7, 0.75, 0.8, 0.9, 0.95, 0.99, 1.0]
+
+
+def _rates(rng: random.Random, n: int) -> list[float]:
+    return [rng.choice(_EDGES) if rng.random() < 0.4 else rng.random() for _ in range(n)]
+
+
+def _assert_identical(result: batch.BatchScores, expected: list) -> None:
+    assert len(result) == len(expected)
+    for i, want in enumerate(expected):
+        score, sub_level = result[i]
+        assert score.hex() == float(want.score).hex(), (i, score, want.score)
+        assert sub_level == want.sub_level, (i, sub_level, want.sub_level)
+
+
+def _cases(n: int = 400):
+    """(batch function, kwargs of columns, scalar function) for every dimension."""
+    rng = random.Random(1234)
+    bools = [rng.random() < 0.5 for _ in range(n)]
+    return [
+        (batch.score_breadth_batch, scorer.score_breadth, {
+            "topics_covered": [rng.randint(0, 40) for _ in range(n)],
+            "topics_total": [rng.choice([0, 20, 40]) for _ in range(n)],
+            "domain_count": [rng.randint(0, 4) for _ in range(n)],
+            "cross_domain_passed": [rng.randint(0, 5) for _ in range(n)],
+            "cross_domain_total": [rng.choice([0, 5]) for _ in range(n)],
+        }),
+        (batch.score_formal_reasoning_batch, scorer.score_formal_reasoning, {
+            "single_step_accuracy": _rates(rng, n),
+            "multi_step_accuracy": _rates(rng, n),
+            "proof_construction": _rates(rng, n),
+        }),
+        (batch.score_factual_grounding_batch, scorer.score_factual_grounding, {
+            "provenance_rate": _rates(rng, n), "hallucination_rate": _rates(rng, n),
+        }),
+        (batch.score_compositional_generalization_batch, scorer.score_compositional_generalization, {
+            "known_composition_accuracy": _rates(rng, n),
+            "novel_combination_accuracy": _rates(rng, n),
+            "scan_cogs_accuracy": _rates(rng, n),
+        }),
+        (batch.score_knowledge_transparency_batch, scorer.score_knowledge_transparency, {
+            "inspectable": bools,
+            "queryable": [rng.random() < 0.5 for _ in range(n)],
+            "traceable_provenance_rate": _rates(rng, n),
+        }),
+        (batch.score_service_orientation_batch, scorer.score_service_orientation, {
+            "task_completion_rate": _rates(rng, n),
+            "explanation_quality": _rates(rng, n),
+            "user_trust_score": _rates(rng, n),
+        }),
+        (batch.score_gba_batch, scorer.score_gba, {
+            "gba1_calibration": _rates(rng, n), "gba2_ood_detection": _rates(rng, n),
+            "gba3_graceful": _rates(rng, n), "gba4_meta": _rates(rng, n),
+        }),
+        (batch.score_action_capability_batch, scorer.score_action_capability, {
+            "procedure_execution_rate": _rates(rng, n),
+            "step_completion_rate": _rates(rng, n),
+            "answer_correctness_rate": _rates(rng, n),
+        }),
+        (batch.score_autonomy_batch, scorer.score_autonomy, {
+            "autonomy_rate": _rates(rng, n), "gap_detection_rate": _rates(rng, n),
+            "self_directed_learning": bools,
+        }),
+    ]
+
+
+def _scalar_results(scalar, columns: dict) -> list:
+    n = len(next(iter(columns.values())))
+    return [scalar(**{k: v[i] for k, v in columns.items()}) for i in range(n)]
+
+
+def _depth_columns(n: int = 400):
+    rng = random.Random(99)
+    bloom = {level: _rates(rng, n) for level in ("L1", "L2", "L3", "L5", "L6")}  # no L4
+    override = [rng.choice(["", "", "", "L2", "L4", "L7"]) for _ in range(n)]
+    return bloom, override
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(batch, "np", None)
+    return request.param
+
+
+class TestBatchMatchesScalar:
+    @pytest.mark.parametrize("index", range(9))
+    def test_dimension(self, backend, index):
+        batch_fn, scalar, columns = _cases()[index]
+        result = batch_fn(**columns)
+        _assert_identical(result, _scalar_results(scalar, columns))
+        assert result.dimension == scalar(**{k: v[0] for k, v in columns.items()}).dimension
+
+    def test_depth(self, backend):
+        bloom, override = _depth_columns()
+        expected = [
+            scorer.score_depth({lv: v[i] for lv, v in bloom.items()}, override[i])
+            for i in range(len(override))
+        ]
+        _assert_identical(batch.score_depth_batch(bloom, override), expected)
+        plain = [scorer.score_depth({lv: v[i] for lv, v in bloom.items()}) for i in range(len(override))]
+        _assert_identical(batch.score_depth_batch(bloom), plain)
+
+    def test_depth_empty_scores_l0(self, backend):
+        result = batch.score_depth_batch({}, ["L3", ""])
+        assert [result[i] for i in range(2)] == [(0.0, "L0"), (0.0, "L0")]
+
+    def test_scalars_broadcast(self, backend):
+        result = batch.score_gba_batch([0.2, 0.9, 1.0], 0.8, gba3_graceful=0.5)
+        _assert_identical(result, [scorer.score_gba(g, 0.8, 0.5) for g in (0.2, 0.9, 1.0)])
+
+    def test_length_mismatch(self, backend):
+        with pytest.raises(ValueError):
+            batch.score_factual_grounding_batch([0.1, 0.2], [0.0, 0.1, 0.2])
+
+    def test_unknown_bloom_level(self, backend):
+        with pytest.raises(ValueError):
+            batch.score_depth_batch({"L9": [0.5]})
+
+
+class TestNumpyArrays:
+    def test_accepts_and_returns_arrays(self):
+        np = pytest.importorskip("numpy")
+        single = np.linspace(0.0, 1.0, 101)
+        result = batch.score_formal_reasoning_batch(single, single[::-1], 0.25)
+        assert isinstance(result.scores, np.ndarray) and result.scores.dtype == np.float64
+        assert result.sub_levels.shape == (101,)
+        expected = [scorer.score_formal_reasoning(s, m, 0.25) for s, m in zip(single, single[::-1])]
+        _assert_identical(result, expected)
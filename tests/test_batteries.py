@@ -0,0 +1,174 @@
+"""Tests for acf.batteries streaming and random access."""
+
+from __future__ import annotations
+
+import json
+import os
+from itertools import islice
+
+import pytest
+from click.testing import CliRunner
+
+from acf import batteries
+from acf.batteries import (
+    battery_counts,
+    battery_index,
+    battery_size,
+    battery_view,
+    clear_battery_cache,
+    get_item,
+    iter_battery,
+    load_battery,
+    select_items,
+)
+from acf.cli import main
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    """Give each test its own cache dir and a cold in-process index cache."""
+    monkeypatch.setenv("ACF_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(batteries, "_INDEXES", {})
+    monkeypatch.setattr(batteries, "_PARSED", {})
+    return tmp_path / "cache"
+
+
+@pytest.fixture
+def fake_root(tmp_path, monkeypatch):
+    """A battery root whose fr36 JSONL is small and writable."""
+    root = tmp_path / "batteries"
+    (root / "fr36").mkdir(parents=True)
+    monkeypatch.setattr(batteries, "_battery_root", lambda: root)
+    return root / "fr36" / "fr36.jsonl"
+
+
+def _write(path, items, tail=""):
+    path.write_text("\n".join(json.dumps(i) for i in items) + "\n" + tail)
+
+
+class TestIterBattery:
+    def test_matches_load_battery(self):
+        for name in batteries.BATTERY_NAMES:
+            assert list(iter_battery(name)) == load_battery(name)
+
+    def test_streams_lazily(self, fake_root):
+        items = [{"id": f"x{i}", "level": "FR1"} for i in range(3)]
+        _write(fake_root, items, tail="{broken line\n")
+        # The malformed 4th line is never parsed when only 3 items are taken.
+        assert list(islice(iter_battery("fr36"), 3)) == items
+        with pytest.raises(json.JSONDecodeError):
+            load_battery("fr36")
+
+
+class TestRandomAccess:
+    def test_get_item(self):
+        for item in load_battery("cg100")[::17]:
+            assert get_item("cg100", item["id"]) == item
+        with pytest.raises(KeyError):
+            get_item("cg100", "no-such-item")
+
+    def test_select_items(self):
+        everything = load_battery("cg100")
+        picked = list(select_items("cg100", level="CG2", domain="logic"))
+        assert picked == [i for i in everything if i["level"] == "CG2" and i["domain"] == "logic"]
+        assert picked
+        assert list(select_items("fr36", subtype="2-hop")) == [
+            i for i in load_battery("fr36") if i["subtype"] == "2-hop"
+        ]
+        assert list(select_items("fr36", level="nope")) == []
+        with pytest.raises(ValueError, match="indexed fields"):
+            select_items("fr36", question="x")
+
+    def test_sidecar_reused_across_processes(self, isolated_cache, monkeypatch):
+        index = battery_index("fr36")
+        (sidecar,) = (isolated_cache / "batteries").iterdir()
+        monkeypatch.setattr(batteries, "_INDEXES", {})
+
+        def _fail(*args):
+            raise AssertionError("index rebuilt despite a fresh sidecar")
+
+        monkeypatch.setattr(batteries, "_build_index", _fail)
+        assert battery_index("fr36").spans == index.spans
+        assert sidecar.name.endswith(".idx.json")
+
+    def test_index_invalidated_when_file_changes(self, fake_root):
+        _write(fake_root, [{"id": "a", "level": "FR1"}])
+        assert get_item("fr36", "a")["level"] == "FR1"
+
+        _write(fake_root, [{"id": "a", "level": "FR2"}, {"id": "b", "level": "FR2"}])
+        st = fake_root.stat()
+        os.utime(fake_root, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        assert get_item("fr36", "a")["level"] == "FR2"
+        assert len(list(select_items("fr36", level="FR2"))) == 2
+
+    def test_cache_disabled(self, monkeypatch):
+        monkeypatch.setenv("ACF_CACHE_DIR", "")
+        assert get_item("zorblaxia", load_battery("zorblaxia")[0]["id"])
+
+
+class TestMemoizedLoading:
+    def test_parsed_once(self, monkeypatch):
+        first = load_battery("fr36")
+        monkeypatch.setattr(batteries.json, "loads", None)  # any re-parse would fail
+        second = load_battery("fr36")
+        assert second == first and second is not first
+        assert second[0] is first[0]
+
+    def test_reparsed_when_file_changes(self, fake_root):
+        _write(fake_root, [{"id": "a"}])
+        assert len(load_battery("fr36")) == 1
+        _write(fake_root, [{"id": "a"}, {"id": "b"}])
+        st = fake_root.stat()
+        os.utime(fake_root, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        assert [i["id"] for i in load_battery("fr36")] == ["a", "b"]
+
+    def test_views(self):
+        items = load_battery("cg100")
+        by_domain = battery_view("cg100", "domain")
+        assert sum(len(group) for group in by_domain.values()) == len(items)
+        assert by_domain["logic"] == [i for i in items if i["domain"] == "logic"]
+        assert set(battery_view("fr36", "level")) == {"FR-boundary", "FR1", "FR2"}
+        assert set(battery_view("zorblaxia", "acf_dimension")) == {
+            "GeneralizationBoundaryAwareness"
+        }
+        assert battery_view("zorblaxia", "subtype") == {}
+        with pytest.raises(ValueError):
+            battery_view("fr36", "question")
+
+    def test_counts_without_parsing(self, monkeypatch):
+        expected = {name: len(load_battery(name)) for name in batteries.BATTERY_NAMES}
+        for name in expected:
+            battery_index(name)
+        levels = battery_counts("cg100", "level")
+        clear_battery_cache()  # cold process: only the index sidecar is left
+        monkeypatch.setattr(batteries, "_build_index", None)
+        monkeypatch.setattr(batteries, "_parsed", None)
+        assert {name: battery_size(name) for name in expected} == expected
+        assert battery_counts("cg100", "level") == levels
+        assert sum(levels.values()) == expected["cg100"]
+
+
+class TestInspectCommand:
+    def test_list_counts(self):
+        result = CliRunner().invoke(main, ["batteries", "list", "--json-output"])
+        assert {r["name"]: r["n_items"] for r in json.loads(result.output)} == {
+            "fr36": 36, "zorblaxia": 10, "cg100": 100,
+        }
+
+    def test_inspect_by_id(self):
+        result = CliRunner().invoke(main, [
+            "batteries", "inspect", "fr36", "--id", "fr-boundary-01", "--json-output",
+        ])
+        assert result.exit_code == 0
+        assert [i["id"] for i in json.loads(result.output)] == ["fr-boundary-01"]
+
+    def test_inspect_filtered(self):
+        result = CliRunner().invoke(main, [
+            "batteries", "inspect", "cg100", "--level", "CG3", "--limit", "2", "--json-output",
+        ])
+        items = json.loads(result.output)
+        assert len(items) == 2 and all(i["level"] == "CG3" for i in items)
+
+    def test_inspect_unknown_id(self):
+        result = CliRunner().invoke(main, ["batteries", "inspect", "fr36", "--id", "nope"])
+        assert result.exit_code == 1
@@ -0,0 +1,109 @@
+"""Tests for acf.execution.checkpoint — resumable battery runs."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+from click.testing import CliRunner
+
+from acf.batteries import load_battery
+from acf.cli import main
+from acf.execution.async_engine import AsyncBatteryEngine
+from acf.execution.checkpoint import Checkpoint
+from acf.execution.engine import BatteryEngine
+from tests.runners import AsyncCountingRunner, CountingRunner
+
+
+def _sync_run(path, runner, battery="fr36", system=("sys", "1.0")):
+    with Checkpoint(path, *system) as ckpt:
+        return BatteryEngine(runner, workers=1, checkpoint=ckpt).run(battery)
+
+
+class TestCheckpoint:
+    def test_resume_skips_completed_items(self, tmp_path):
+        path = tmp_path / "ckpt.jsonl"
+        first = CountingRunner(die_after=10)
+        try:
+            _sync_run(path, first)
+        except KeyboardInterrupt:
+            pass
+        assert len(Checkpoint(path, "sys", "1.0")) == 10
+
+        second = CountingRunner()
+        results = _sync_run(path, second)
+        all_ids = [item["id"] for item in load_battery("fr36")]
+        assert second.calls == all_ids[10:]
+        assert [r.item_id for r in results] == all_ids
+        assert [r.resumed for r in results] == [True] * 10 + [False] * 26
+        assert results[0].response == {"id": all_ids[0], "response_text": all_ids[0].upper()}
+
+    def test_keyed_by_system_and_version(self, tmp_path):
+        path = tmp_path / "ckpt.jsonl"
+        _sync_run(path, CountingRunner(), battery="zorblaxia")
+        other_version = CountingRunner()
+        _sync_run(path, other_version, battery="zorblaxia", system=("sys", "2.0"))
+        assert len(other_version.calls) == len(load_battery("zorblaxia"))
+        again = CountingRunner()
+        _sync_run(path, again, battery="zorblaxia")
+        assert again.calls == []
+
+    def test_failures_are_not_checkpointed(self, tmp_path):
+        class Failing:
+            def run_item(self, item):
+                raise RuntimeError("nope")
+
+        path = tmp_path / "ckpt.jsonl"
+        items = load_battery("cg100")[:3]
+        with Checkpoint(path, "sys", "1.0") as ckpt:
+            BatteryEngine(Failing(), checkpoint=ckpt).run(items)
+        assert len(Checkpoint(path, "sys", "1.0")) == 0
+
+    def test_torn_line_tolerated(self, tmp_path):
+        path = tmp_path / "ckpt.jsonl"
+        items = load_battery("fr36")[:4]
+        with Checkpoint(path, "sys", "1.0") as ckpt:
+            BatteryEngine(CountingRunner(), checkpoint=ckpt).run(items[:2])
+        with path.open("a") as f:
+            f.write('{"battery": "fr36", "item_id"')  # crash mid-line
+
+        runner = CountingRunner()
+        with Checkpoint(path, "sys", "1.0") as ckpt:
+            BatteryEngine(runner, checkpoint=ckpt).run(items)
+        assert runner.calls == [item["id"] for item in items[2:]]
+        assert len(Checkpoint(path, "sys", "1.0")) == 4
+
+    def test_async_engine_resumes(self, tmp_path):
+        path = tmp_path / "ckpt.jsonl"
+        items = load_battery("cg100")
+        _sync_run(path, CountingRunner(), battery=items[:5])
+
+        runner = AsyncCountingRunner()
+        with Checkpoint(path, "sys", "1.0") as ckpt:
+            engine = AsyncBatteryEngine(runner, concurrency=4, checkpoint=ckpt)
+            results = asyncio.run(engine.run(items))
+        assert runner.calls == [item["id"] for item in items[5:]]
+        assert engine.stats.resumed == 5
+        assert [r.item_id for r in results] == [item["id"] for item in items]
+
+
+class TestBatteriesRunCheckpoint:
+    def test_cli_resume(self, tmp_path):
+        path = tmp_path / "ckpt.jsonl"
+        args = [
+            "batteries", "run", "fr36", "--runner", "tests.test_engine:EchoRunnerAnyId",
+            "--checkpoint", str(path), "--system", "sys", "--system-version", "1.0",
+            "--json-output",
+        ]
+        runner = CliRunner()
+        first = json.loads(runner.invoke(main, args).output)
+        second = json.loads(runner.invoke(main, args).output)
+        assert (first["resumed"], second["resumed"]) == (0, 36)
+
+    def test_cli_requires_key(self, tmp_path):
+        result = CliRunner().invoke(main, [
+            "batteries", "run", "fr36", "--runner", "tests.test_engine:EchoRunnerAnyId",
+            "--checkpoint", str(tmp_path / "c.jsonl"),
+        ])
+        assert result.exit_code != 0
+        assert "--system" in result.output
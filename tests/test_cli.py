@@ -1,6 +1,7 @@
 """Tests for the ACF CLI."""
 
 import json
+from pathlib import Path
 
 from click.testing import CliRunner
 
@@ -104,6 +105,37 @@ class TestQueryCommand:
         assert result.exit_code == 0
         assert "No results" in result.output
 
+    def test_bound_query(self, runner):
+        result = runner.invoke(main, [
+            "query",
+            "SELECT ?label WHERE { ?s a acf:Dimension ; acf:id ?id ; acf:label ?label . }",
+            "--bind", "id=depth", "--json-output",
+        ])
+        assert result.exit_code == 0
+        assert json.loads(result.output) == [{"label": "Depth"}]
+
+    def test_ndjson_stream(self, runner):
+        result = runner.invoke(main, [
+            "query", "SELECT ?id WHERE { ?s a acf:Dimension ; acf:id ?id . }", "-f", "ndjson",
+        ])
+        assert result.exit_code == 0
+        rows = [json.loads(line) for line in result.output.splitlines()]
+        assert len(rows) == 12
+        assert all(set(r) == {"id"} for r in rows)
+
+    def test_csv_stream(self, runner):
+        result = runner.invoke(main, [
+            "query", "SELECT ?id WHERE { ?s a acf:Dimension ; acf:id ?id . }", "--format", "csv",
+        ])
+        assert result.exit_code == 0
+        lines = result.output.splitlines()
+        assert lines[0] == "id"
+        assert len(lines) == 13
+
+    def test_malformed_bind(self, runner):
+        result = runner.invoke(main, ["query", "SELECT ?x WHERE { ?x ?p ?o }", "--bind", "nope"])
+        assert result.exit_code == 1
+
 
 class TestValidateCommand:
     def test_validate_example_data(self, runner):
@@ -119,6 +151,19 @@ class TestValidateCommand:
         assert result.exit_code == 0
         assert "1 valid" in result.output
 
+    def test_validate_json_summary(self, runner, tmp_path):
+        record = json.loads(Path("examples/data/sample-experiment-run.json").read_text())
+        (tmp_path / "good.json").write_text(json.dumps(record))
+        (tmp_path / "bad.jsonl").write_text(json.dumps({"record_type": "experiment-run"}) + "\n")
+        result = runner.invoke(main, ["validate", str(tmp_path), "--json-output", "-w", "2"])
+        assert result.exit_code == 1
+        *files, summary = [json.loads(line) for line in result.output.splitlines()]
+        assert [(Path(f["path"]).name, f["valid"]) for f in files] == [
+            ("bad.jsonl", False), ("good.json", True),
+        ]
+        assert summary["summary"]["valid_files"] == 1
+        assert summary["summary"]["invalid_files"] == 1
+
 
 class TestScoreCommand:
     def test_score_example_data(self, runner):
@@ -146,6 +191,14 @@ class TestScoreCommand:
         data = json.loads(out.read_text())
         assert "aggregate_score" in data
 
+    def test_score_jsonl_shard(self, runner, tmp_path):
+        record = json.loads(Path("examples/data/sample-experiment-run.json").read_text())
+        shard = tmp_path / "records-2026-01-15.jsonl"
+        shard.write_text(json.dumps(record) + "\n")
+        result = runner.invoke(main, ["score", str(tmp_path), "--json-output"])
+        assert result.exit_code == 0
+        assert json.loads(result.output)["system_id"] == record["system_id"]
+
     def test_score_no_data(self, runner, tmp_path):
         empty = tmp_path / "empty"
         empty.mkdir()
@@ -198,3 +251,23 @@ class TestTemplateCommand:
         data = json.loads(result.output)
         assert data["record_type"] == "experiment-run"
         assert "measure_id" in data
+
+
+class TestIngestCommand:
+    def test_ingest_reports_throughput(self, runner):
+        result = runner.invoke(main, ["ingest", "examples/data/", "--json-output"])
+        assert result.exit_code == 0
+        data = json.loads(result.output)
+        assert data["records"] == 3
+        assert data["triples"] > 0
+        assert "records_per_second" in data
+
+
+class TestPackCommand:
+    def test_pack_examples(self, runner, tmp_path):
+        out = tmp_path / "examples.acfq"
+        result = runner.invoke(main, ["pack", "examples/data", str(out), "--json-output"])
+        assert result.exit_code == 0
+        summary = json.loads(result.output)
+        assert summary["rows"] == 1
+        assert out.exists()
@@ -0,0 +1,182 @@
+"""Tests for acf.data.columnar — the array-backed per-query-record store."""
+
+from __future__ import annotations
+
+import json
+import math
+from pathlib import Path
+
+import pytest
+
+from acf.data.columnar import PerQueryColumns
+from acf.data.loader import load_data_files, load_per_query_columns
+from acf.scoring.scorer import score_depth, score_depth_from_columns
+
+SAMPLE = Path(__file__).parent.parent / "examples" / "data" / "sample-per-query-record.json"
+
+
+def _record(i: int, **overrides) -> dict:
+    record = {
+        "schema_version": "1.0.0",
+        "record_type": "per-query-record",
+        "system_id": "sys-a" if i % 2 else "sys-b",
+        "system_version": "1.0.0",
+        "experiment_id": "EXP-1",
+        "query_id": f"Q-{i:05d}",
+        "timestamp": "2026-01-15T10:30:42Z",
+        "query": "long free text " * 10,
+        "correct": i % 3 != 0,
+        "latency_ms": 100.0 + i,
+        "domain": "oncology",
+        "bloom_level": i % 6 + 1,
+        "measures": {"M-005": float(i % 2)},
+    }
+    record.update(overrides)
+    return record
+
+
+class TestPerQueryColumns:
+    """Building, reading, and analytics over the columns."""
+
+    def test_sample_round_trip(self):
+        sample = json.loads(SAMPLE.read_text())
+        store = PerQueryColumns.from_records([sample])
+        (back,) = store.iter_records()
+        for key in ("system_id", "system_version", "experiment_id", "query_id",
+                    "timestamp", "correct", "latency_ms", "domain", "bloom_level",
+                    "measures"):
+            assert back[key] == sample[key], key
+        # Free text and signals are deliberately not stored.
+        assert "query" not in back and "signals" not in back
+
+    def test_missing_fields_use_sentinels(self):
+        store = PerQueryColumns.from_records([{"record_type": "per-query-record"}])
+        assert math.isnan(store.column("latency_ms")[0])
+        assert store.column("correct")[0] == -1
+        assert store.column("bloom_level")[0] == 0
+        assert store.strings("domain") == [""]
+        (back,) = store.iter_records()
+        assert set(back) == {"schema_version", "record_type"}
+
+    def test_rejects_other_record_types(self):
+        with pytest.raises(ValueError, match="per-query-record"):
+            PerQueryColumns().append({"record_type": "experiment-run"})
+        assert PerQueryColumns().extend([{"record_type": "experiment-run"}]) == 0
+
+    def test_malformed_record_leaves_store_aligned(self):
+        store = PerQueryColumns.from_records([_record(1)])
+        with pytest.raises(ValueError, match="measures"):
+            store.append(_record(2, measures=[1.0]))
+        store.append(_record(3))
+        assert len(store) == 2
+        assert [r["query_id"] for r in store.iter_records()] == ["Q-00001", "Q-00003"]
+        assert all(len(store.column(name)) == 2 for name in ("query_id", "latency_ms", "bloom_level"))
+
+    def test_bool_is_not_a_number(self):
+        store = PerQueryColumns.from_records([_record(1, bloom_level=True, latency_ms=True)])
+        assert store.column("bloom_level")[0] == 0
+        assert math.isnan(store.column("latency_ms")[0])
+
+    def test_late_measure_backfilled_with_nan(self):
+        store = PerQueryColumns.from_records([
+            _record(0, measures={}),
+            _record(1, measures={"M-X": 2.0}),
+        ])
+        column = store.measure("M-X")
+        assert math.isnan(column[0]) and column[1] == 2.0
+        assert len(store.measure("M-NOPE")) == 2
+
+    def test_bloom_accuracy_matches_record_scan(self):
+        records = [_record(i) for i in range(120)]
+        store = PerQueryColumns.from_records(records)
+        expected: dict[str, list[int]] = {}
+        for r in records:
+            if r["system_id"] == "sys-a":
+                expected.setdefault(f"L{r['bloom_level']}", []).append(r["correct"])
+        assert store.bloom_accuracy("sys-a") == {
+            lvl: sum(v) / len(v) for lvl, v in sorted(expected.items())
+        }
+        assert store.bloom_accuracy("nobody") == {}
+
+    def test_accuracy_and_latency(self):
+        store = PerQueryColumns.from_records([_record(i) for i in range(3)])
+        assert store.accuracy() == pytest.approx(2 / 3)
+        assert store.mean_latency_ms() == pytest.approx(101.0)
+
+    def test_merge_remaps_strings(self):
+        left = PerQueryColumns.from_records([_record(1)])
+        right = PerQueryColumns.from_records([_record(2, domain="cardiology",
+                                                        measures={"M-Y": 1.0})])
+        left.merge(right)
+        assert left.strings("domain") == ["oncology", "cardiology"]
+        assert left.strings("system_id") == ["sys-a", "sys-b"]
+        assert math.isnan(left.measure("M-005")[1])
+        assert math.isnan(left.measure("M-Y")[0])
+
+
+class TestPersistence:
+    """The .acfq file format."""
+
+    def test_save_load_round_trip(self, tmp_path):
+        records = [_record(i) for i in range(50)]
+        store = PerQueryColumns.from_records(records)
+        path = tmp_path / "runs.acfq"
+        store.save(path)
+        loaded = PerQueryColumns.load(path)
+        assert list(loaded.iter_records()) == list(store.iter_records())
+        assert loaded.measure_ids == ["M-005"]
+
+    def test_much_smaller_than_json(self, tmp_path):
+        records = [_record(i) for i in range(2000)]
+        json_bytes = sum(len(json.dumps(r, indent=2)) for r in records)
+        path = tmp_path / "runs.acfq"
+        PerQueryColumns.from_records(records).save(path)
+        assert path.stat().st_size * 20 < json_bytes
+
+    def test_rejects_foreign_file(self, tmp_path):
+        path = tmp_path / "bogus.acfq"
+        path.write_bytes(b"not a store")
+        with pytest.raises(ValueError, match="columnar"):
+            PerQueryColumns.load(path)
+
+    @pytest.mark.parametrize("keep", [0.5, 0.9, 0.99])
+    def test_truncated_file_raises_value_error(self, tmp_path, keep):
+        path = tmp_path / "runs.acfq"
+        PerQueryColumns.from_records([_record(i) for i in range(200)]).save(path)
+        data = path.read_bytes()
+        path.write_bytes(data[:int(len(data) * keep)])
+        with pytest.raises(ValueError, match="runs.acfq"):
+            PerQueryColumns.load(path)
+        (tmp_path / "loose.json").write_text(json.dumps(_record(9)))
+        assert len(load_data_files(tmp_path)) == 1  # the damaged store is skipped
+        assert len(load_per_query_columns(tmp_path)) == 1
+
+    def test_strings_with_nul_round_trip(self, tmp_path):
+        store = PerQueryColumns.from_records([_record(1, query_id="Q\0one"), _record(2, domain="\0")])
+        path = tmp_path / "runs.acfq"
+        store.save(path)
+        loaded = PerQueryColumns.load(path)
+        assert loaded.strings("query_id") == ["Q\0one", "Q-00002"]
+        assert loaded.strings("domain") == ["oncology", "\0"]
+
+
+class TestLoaderAndScorer:
+    """Loader and scorer read the columnar store directly."""
+
+    def test_loader_combines_acfq_and_json(self, tmp_path):
+        PerQueryColumns.from_records([_record(i) for i in range(4)]).save(
+            tmp_path / "packed.acfq")
+        (tmp_path / "loose.json").write_text(json.dumps(_record(9)))
+        (tmp_path / "run.json").write_text(json.dumps({"record_type": "experiment-run"}))
+
+        store = load_per_query_columns(tmp_path)
+        assert len(store) == 5
+        records = load_data_files(tmp_path)
+        assert sum(r["record_type"] == "per-query-record" for r in records) == 5
+
+    def test_score_depth_from_columns(self):
+        records = [_record(i) for i in range(60)]
+        store = PerQueryColumns.from_records(records)
+        expected = score_depth(store.bloom_accuracy("sys-b"))
+        got = score_depth_from_columns(store, "sys-b")
+        assert got.score == expected.score and got.sub_level == expected.sub_level
@@ -0,0 +1,147 @@
+"""Tests for acf.execution.engine — concurrent BatteryRunner execution."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+
+import pytest
+from click.testing import CliRunner
+
+from acf.cli import main
+from acf.execution.engine import BatteryEngine, RunStats
+
+ITEMS = [{"id": f"item-{i:02d}", "question": f"q{i}"} for i in range(20)]
+
+
+class EchoRunner:
+    """Answers every item; later items finish first, to exercise reordering."""
+
+    def run_item(self, item):
+        time.sleep(0.002 * (20 - int(item["id"][-2:])))
+        return {"id": item["id"], "response_text": item["question"].upper()}
+
+
+class FlakyRunner:
+    """Fails the first attempt at every item."""
+
+    def __init__(self):
+        self.seen: set[str] = set()
+        self.lock = threading.Lock()
+
+    def run_item(self, item):
+        with self.lock:
+            first = item["id"] not in self.seen
+            self.seen.add(item["id"])
+        if first:
+            raise ConnectionError("server busy")
+        return {"id": item["id"], "response_text": "ok"}
+
+
+class HangingRunner:
+    """Never answers item-03 in time."""
+
+    def run_item(self, item):
+        if item["id"] == "item-03":
+            time.sleep(0.5)
+        return {"id": item["id"], "response_text": "ok"}
+
+
+class SteadyRunner:
+    def run_item(self, item):
+        time.sleep(0.15)
+        return {"id": item["id"], "response_text": "ok"}
+
+
+class TestBatteryEngine:
+    def test_results_in_battery_order(self):
+        results = BatteryEngine(EchoRunner(), workers=4).run(ITEMS)
+        assert [r.item_id for r in results] == [item["id"] for item in ITEMS]
+        assert all(r.ok and r.response["response_text"] == f"Q{r.index}" for r in results)
+
+    def test_retries_recover_transient_failures(self):
+        engine = BatteryEngine(FlakyRunner(), workers=3, retries=1)
+        results = engine.run(ITEMS[:6])
+        assert all(r.ok and r.attempts == 2 for r in results)
+        assert engine.stats.retries == 6
+
+    def test_exhausted_retries_record_error(self):
+        results = BatteryEngine(FlakyRunner(), workers=2).run(ITEMS[:3])
+        assert not any(r.ok for r in results)
+        assert results[0].error == "ConnectionError: server busy"
+
+    def test_timeout_abandons_slow_item(self):
+        start = time.perf_counter()
+        results = BatteryEngine(HangingRunner(), workers=2, timeout=0.1).run(ITEMS[:6])
+        assert time.perf_counter() - start < 0.45
+        assert [r.ok for r in results] == [True, True, True, False, True, True]
+        assert results[3].error.startswith("TimeoutError")
+
+    def test_queued_items_get_their_full_timeout(self):
+        # One worker, 0.15s items: each waits in line behind the one before it,
+        # but only its own run counts against the 0.25s timeout.
+        results = BatteryEngine(SteadyRunner(), workers=1, timeout=0.25).run(ITEMS[:4])
+        assert all(r.ok for r in results), [r.error for r in results]
+        assert all(0.14 < r.latency_s < 0.25 for r in results)
+
+    def test_workers_held_by_abandoned_attempts(self):
+        start = time.perf_counter()
+        results = BatteryEngine(HangingRunner(), workers=1, timeout=0.1).run(ITEMS[3:6])
+        assert time.perf_counter() - start < 0.45
+        assert results[0].error == "TimeoutError: no result after 0.1s"
+        assert [r.error for r in results[1:]] == ["TimeoutError: no free worker after 0.1s"] * 2
+
+    def test_process_pool(self):
+        results = BatteryEngine(EchoRunner(), workers=2, pool="process").run(ITEMS[:5])
+        assert [r.response["response_text"] for r in results] == ["Q0", "Q1", "Q2", "Q3", "Q4"]
+
+    def test_progress_and_stats(self):
+        seen: list[int] = []
+
+        def progress(stats: RunStats):
+            seen.append(stats.completed)
+
+        engine = BatteryEngine(EchoRunner(), workers=4, on_progress=progress)
+        engine.run(ITEMS)
+        assert seen == list(range(1, 21))
+        summary = engine.stats.to_dict()
+        assert summary["total"] == summary["completed"] == 20
+        assert summary["items_per_second"] > 0
+        assert summary["latency_ms_p95"] >= summary["latency_ms_p50"] > 0
+
+    def test_named_battery(self):
+        results = BatteryEngine(EchoRunnerAnyId(), workers=4).run("fr36")
+        assert len(results) == 36
+        assert results[0].item_id == "fr-boundary-01"
+
+    def test_rejects_bad_config(self):
+        with pytest.raises(ValueError):
+            BatteryEngine(EchoRunner(), workers=0)
+        with pytest.raises(ValueError):
+            BatteryEngine(EchoRunner(), pool="fiber")
+
+
+class EchoRunnerAnyId:
+    def run_item(self, item):
+        return {"id": item["id"], "response_text": ""}
+
+
+class TestBatteriesRunCommand:
+    def test_run_writes_ordered_jsonl(self, tmp_path):
+        out = tmp_path / "results.jsonl"
+        result = CliRunner().invoke(main, [
+            "batteries", "run", "zorblaxia", "--runner", "tests.test_engine:EchoRunnerAnyId",
+            "-w", "4", "-o", str(out), "--json-output",
+        ])
+        assert result.exit_code == 0, result.output
+        summary = json.loads(result.output)
+        lines = [json.loads(line) for line in out.read_text().splitlines()]
+        assert summary["completed"] == len(lines) > 0
+        assert summary["failed"] == 0
+        assert [r["index"] for r in lines] == list(range(len(lines)))
+
+    def test_bad_runner_spec(self):
+        result = CliRunner().invoke(main, ["batteries", "run", "fr36", "--runner", "nope"])
+        assert result.exit_code != 0
+        assert "MODULE:ATTR" in result.output
@@ -4,7 +4,7 @@ from pathlib import Path
 
 import pytest
 
-from acf.graph import ACFGraph, KNOWLEDGE_DIR
+from acf.graph import KNOWLEDGE_DIR, ACFGraph, _result_rows
 
 
 @pytest.fixture
@@ -203,3 +203,386 @@ class TestDataIngestion:
         g = ACFGraph(data_dir=data_dir)
         # Should still have knowledge triples
         assert g.triple_count() > 0
+
+
+class TestGraphCache:
+    """Test the on-disk snapshot of the parsed knowledge graph."""
+
+    def test_snapshot_written_and_reused(self, tmp_path, monkeypatch):
+        first = ACFGraph(cache_dir=tmp_path)
+        assert list((tmp_path / "graph").glob("*.pickle"))
+
+        # A fresh snapshot must satisfy construction without touching the parser.
+        import yurtle_rdflib
+
+        def _no_parse(*args, **kwargs):
+            raise AssertionError("knowledge was re-parsed despite a fresh snapshot")
+
+        monkeypatch.setattr(yurtle_rdflib, "load_workspace", _no_parse)
+        second = ACFGraph(cache_dir=tmp_path)
+        assert second.triple_count() == first.triple_count()
+        assert len(second.dimensions()) == 12
+
+    def test_edit_invalidates_snapshot(self, tmp_path):
+        import shutil
+
+        kdir = tmp_path / "knowledge"
+        shutil.copytree(KNOWLEDGE_DIR, kdir)
+        cache = tmp_path / "cache"
+        before = ACFGraph(knowledge_dir=kdir, cache_dir=cache).triple_count()
+
+        (kdir / "dimensions" / "depth.md").unlink()
+        after = ACFGraph(knowledge_dir=kdir, cache_dir=cache)
+        assert after.triple_count() < before
+        assert after.dimension("depth") is None
+        assert len(list((cache / "graph").glob("*.pickle"))) == 2
+
+    def test_old_snapshots_pruned(self, tmp_path, monkeypatch):
+        import shutil
+
+        import acf.graph
+
+        monkeypatch.setattr(acf.graph, "_GRAPH_SNAPSHOTS_KEPT", 2)
+        kdir = tmp_path / "knowledge"
+        shutil.copytree(KNOWLEDGE_DIR, kdir)
+        cache = tmp_path / "cache"
+        for i in range(4):
+            (kdir / f"edit-{i}.md").write_text(f"# Edit {i}\n")
+            ACFGraph(knowledge_dir=kdir, cache_dir=cache)
+        snapshots = list((cache / "graph").glob("*.pickle"))
+        assert len(snapshots) == 2
+        current = acf.graph._knowledge_cache_key(kdir)
+        assert cache / "graph" / f"{current}.pickle" in snapshots
+
+    def test_corrupt_snapshot_falls_back_to_parse(self, tmp_path):
+        ACFGraph(cache_dir=tmp_path)
+        for snapshot in (tmp_path / "graph").glob("*.pickle"):
+            snapshot.write_bytes(b"not a pickle")
+        assert len(ACFGraph(cache_dir=tmp_path).dimensions()) == 12
+
+    def test_cache_disabled(self, tmp_path):
+        ACFGraph(use_cache=False, cache_dir=tmp_path)
+        assert not (tmp_path / "graph").exists()
+
+
+class TestMaterializedIndex:
+    """Test that typed accessors are served from a memo invalidated by graph edits."""
+
+    def test_repeated_lookups_skip_sparql(self, graph, monkeypatch):
+        graph.dimensions()
+        graph.measures()
+        graph.sub_levels()
+
+        def _no_sparql(*args, **kwargs):
+            raise AssertionError("accessor re-ran SPARQL on an unchanged graph")
+
+        monkeypatch.setattr(graph, "_select", _no_sparql)
+        assert graph.dimension("depth") is not None
+        assert graph.measure("M-003") is not None
+        assert graph.measures(dimension="depth")
+        assert graph.sub_levels("depth")
+
+    def test_returned_lists_are_copies(self, graph):
+        graph.dimensions().clear()
+        graph.measures(dimension="depth").clear()
+        assert len(graph.dimensions()) == 12
+        assert graph.measures(dimension="depth")
+
+    def test_filtered_measures_match_mappings(self, graph):
+        for m in graph.measures(dimension="depth"):
+            assert "depth" in m.dimensions
+        assert graph.measures(dimension="nonexistent") == []
+
+    def test_added_triples_invalidate(self, graph):
+        from rdflib import Literal
+        from rdflib.namespace import RDF
+
+        from acf.graph import ACF
+
+        assert graph.dimension("new-dim") is None
+        node = ACF["dimension/new-dim"]
+        graph.graph.add((node, ACF.id, Literal("new-dim")))
+        graph.graph.add((node, RDF.type, ACF.Dimension))
+        assert graph.dimension("new-dim") is not None
+        assert len(graph.dimensions()) == 13
+
+    def test_hypothesis_lookup(self, graph):
+        h = graph.hypothesis("H122.1")
+        assert h is not None and h.id == "H122.1"
+        assert graph.hypothesis("H-nope") is None
+
+    def test_measures_built_without_sparql(self, monkeypatch):
+        g = ACFGraph()
+
+        def _no_sparql(*args, **kwargs):
+            raise AssertionError("measures() should traverse triples, not run SPARQL")
+
+        monkeypatch.setattr(g, "_select", _no_sparql)
+        ms = g.measures()
+        assert len(ms) == 75
+        assert [m.id for m in ms] == sorted(m.id for m in ms)
+        assert all(m.dimensions == sorted(m.dimensions) for m in ms)
+
+
+class TestBulkIngestion:
+    """Test the batched (optionally multi-process) ingestion path."""
+
+    @staticmethod
+    def _write_records(data_dir, n):
+        import json
+
+        data_dir.mkdir()
+        for i in range(n):
+            (data_dir / f"run-{i:03d}.json").write_text(json.dumps({
+                "record_type": "experiment-run",
+                "measure_id": "M-003",
+                "system_id": f"sys-{i % 3}",
+                "value": float(i),
+                "pass": i % 2 == 0,
+            }))
+        (data_dir / "broken.json").write_text("{not json")
+
+    def test_parallel_matches_serial(self, tmp_path):
+        data_dir = tmp_path / "data"
+        self._write_records(data_dir, 20)
+
+        serial = ACFGraph()
+        s_stats = serial.ingest(data_dir, workers=1)
+        parallel = ACFGraph()
+        p_stats = parallel.ingest(data_dir, workers=2)
+
+        assert set(serial.graph) == set(parallel.graph)
+        assert s_stats.records == p_stats.records == 20
+        assert s_stats.files == 21
+        assert s_stats.triples == p_stats.triples > 20
+
+    def test_stats_recorded_on_construction(self, tmp_path):
+        data_dir = tmp_path / "data"
+        self._write_records(data_dir, 3)
+        g = ACFGraph(data_dir=data_dir)
+        assert g.last_ingest is not None
+        assert g.last_ingest.records == 3
+        assert g.last_ingest.to_dict()["triples_per_second"] >= 0
+
+    def test_jsonl_shards_ingested(self, tmp_path):
+        import json
+
+        data_dir = tmp_path / "data"
+        data_dir.mkdir()
+        lines = [json.dumps({
+            "record_type": "experiment-run",
+            "measure_id": "M-003",
+            "system_id": "sys",
+            "value": float(i),
+        }) for i in range(4)]
+        (data_dir / "runs-2026-01-15.jsonl").write_text("\n".join(lines) + "\n{torn")
+
+        g = ACFGraph()
+        stats = g.ingest(data_dir)
+        assert (stats.files, stats.records) == (1, 4)
+        assert len(g.data_series("M-003")) == 4
+
+
+class TestIncrementalIngestion:
+    """Test manifest-driven incremental re-ingestion of a data directory."""
+
+    @staticmethod
+    def _write(path, value):
+        import json
+
+        path.write_text(json.dumps({
+            "record_type": "experiment-run",
+            "measure_id": "M-003",
+            "system_id": "sys",
+            "value": value,
+        }))
+
+    def test_reopen_reuses_unchanged_files(self, tmp_path):
+        data_dir = tmp_path / "data"
+        data_dir.mkdir()
+        for i in range(3):
+            self._write(data_dir / f"r{i}.json", float(i))
+        cache = tmp_path / "cache"
+
+        first = ACFGraph(data_dir=data_dir, incremental=True, cache_dir=cache)
+        assert first.last_ingest.records == 3
+        second = ACFGraph(data_dir=data_dir, incremental=True, cache_dir=cache)
+        assert second.last_ingest.records == 0
+        assert second.last_ingest.reused == 3
+        assert set(second.graph) == set(first.graph)
+
+    def test_growing_jsonl_shard(self, tmp_path):
+        import json
+
+        data_dir = tmp_path / "data"
+        data_dir.mkdir()
+        shard = data_dir / "runs.jsonl"
+        record = {"record_type": "experiment-run", "measure_id": "M-003", "system_id": "sys"}
+        shard.write_text(json.dumps({**record, "value": 1.0}) + "\n")
+        cache = tmp_path / "cache"
+        ACFGraph(data_dir=data_dir, incremental=True, cache_dir=cache)
+
+        with shard.open("a") as f:
+            f.write(json.dumps({**record, "value": 2.0}) + "\n")
+        grown = ACFGraph(data_dir=data_dir, incremental=True, cache_dir=cache)
+        assert grown.last_ingest.records == 2
+        assert set(grown.graph) == set(ACFGraph(data_dir=data_dir, use_cache=False).graph)
+        assert len(grown.data_series("M-003")) == 2
+
+    def test_changes_and_deletions_match_full_ingest(self, tmp_path):
+        import os
+
+        data_dir = tmp_path / "data"
+        data_dir.mkdir()
+        for i in range(3):
+            self._write(data_dir / f"r{i}.json", float(i))
+        (data_dir / "series.json").write_text(
+            (Path(__file__).parent.parent / "examples" / "data"
+             / "sample-longitudinal-series.json").read_text()
+        )
+        cache = tmp_path / "cache"
+        ACFGraph(data_dir=data_dir, incremental=True, cache_dir=cache)
+
+        self._write(data_dir / "r0.json", 42.0)
+        st = (data_dir / "r0.json").stat()
+        os.utime(data_dir / "r0.json", ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        (data_dir / "r1.json").unlink()
+        (data_dir / "series.json").unlink()
+        self._write(data_dir / "r9.json", 9.0)
+
+        inc = ACFGraph(data_dir=data_dir, incremental=True, cache_dir=cache)
+        assert inc.last_ingest.records == 2
+        assert inc.last_ingest.deleted == 2
+        full = ACFGraph(data_dir=data_dir, cache_dir=cache)
+        assert set(inc.graph) == set(full.graph)
+
+    def test_touched_but_identical_file_is_not_reparsed(self, tmp_path):
+        import os
+
+        data_dir = tmp_path / "data"
+        data_dir.mkdir()
+        self._write(data_dir / "r0.json", 1.0)
+        cache = tmp_path / "cache"
+        ACFGraph(data_dir=data_dir, incremental=True, cache_dir=cache)
+
+        st = (data_dir / "r0.json").stat()
+        os.utime(data_dir / "r0.json", ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        g = ACFGraph(data_dir=data_dir, incremental=True, cache_dir=cache)
+        assert g.last_ingest.records == 0
+        assert g.last_ingest.reused == 1
+
+
+class TestDataSeries:
+    """Test the indexed data_series() reads and filters."""
+
+    @pytest.fixture
+    def series_graph(self, tmp_path):
+        import json
+
+        data_dir = tmp_path / "data"
+        data_dir.mkdir()
+        rows = [
+            ("a", "1.9.0", "2026-01-03T00:00:00Z", 3.0),
+            ("a", "1.10.0", "2026-01-04T00:00:00Z", 4.0),
+            ("b", "2.0.0", "2026-01-01T00:00:00Z", 1.0),
+            ("a", "1.2.0", "2026-01-02T00:00:00Z", 2.0),
+        ]
+        for i, (sid, ver, ts, value) in enumerate(rows):
+            (data_dir / f"r{i}.json").write_text(json.dumps({
+                "record_type": "experiment-run", "measure_id": "M-003",
+                "system_id": sid, "system_version": ver, "timestamp": ts, "value": value,
+            }))
+        return ACFGraph(data_dir=data_dir)
+
+    def test_series_ordered_by_timestamp(self, series_graph):
+        values = [p.value for p in series_graph.data_series("M-003")]
+        assert values == [1.0, 2.0, 3.0, 4.0]
+
+    def test_filter_by_system(self, series_graph):
+        points = series_graph.data_series("M-003", system_id="a")
+        assert [p.value for p in points] == [2.0, 3.0, 4.0]
+        assert series_graph.data_series("M-003", system_id="zzz") == []
+
+    def test_version_range_compares_numerically(self, series_graph):
+        points = series_graph.data_series("M-003", system_id="a", version_min="1.9")
+        assert [p.system_version for p in points] == ["1.9.0", "1.10.0"]
+        points = series_graph.data_series("M-003", version_max="1.9.0")
+        assert [p.system_version for p in points] == ["1.2.0", "1.9.0"]
+
+    def test_unknown_measure(self, series_graph):
+        assert series_graph.data_series("M-999") == []
+
+    def test_example_data_series(self, graph_with_data):
+        points = graph_with_data.data_series("M-003")
+        assert any(p.value == 2.1 and p.system_id == "my-ai-system" for p in points)
+
+
+class TestPreparedQueries:
+    """Test the prepared-query cache and parameter binding."""
+
+    def test_repeated_query_is_prepared_once(self, graph):
+        from acf.graph import _prepare_query
+
+        sparql = "SELECT ?id WHERE { ?s a acf:Hypothesis ; acf:id ?id . }"
+        graph.query(sparql)
+        hits = _prepare_query.cache_info().hits
+        assert len(graph.query(sparql)) == 16
+        assert _prepare_query.cache_info().hits == hits + 1
+
+    def test_bindings_are_bound_not_formatted(self, graph):
+        sparql = "SELECT ?label WHERE { ?s a acf:Dimension ; acf:id ?id ; acf:label ?label . }"
+        assert graph.query(sparql, bindings={"id": "depth"}) == [{"label": "Depth"}]
+        # A value that would break out of a string literal if spliced is just data.
+        assert graph.query(sparql, bindings={"id": 'x" } UNION { ?s ?p ?o'}) == []
+
+    def test_builtin_accessors_use_prepared_cache(self):
+        from acf.graph import _prepare_query
+
+        ACFGraph().levels()
+        hits = _prepare_query.cache_info().hits
+        ACFGraph().levels()
+        assert _prepare_query.cache_info().hits > hits
+
+
+class TestStreamingQuery:
+    """Test the lazy iter_query() API."""
+
+    def test_stream_matches_query(self, graph):
+        sparql = "SELECT ?id ?w WHERE { ?s a acf:Dimension ; acf:id ?id . OPTIONAL { ?s acf:nope ?w } }"
+        stream = graph.iter_query(sparql)
+        assert stream.variables == ["id", "w"]
+        assert list(stream) == graph.query(sparql)
+
+    def test_stream_is_lazy(self, graph):
+        stream = graph.iter_query("SELECT ?s ?p ?o WHERE { ?s ?p ?o }")
+        first = next(iter(stream))
+        assert set(first) == {"s", "p", "o"}
+
+    def test_select_rows_are_not_buffered(self, graph):
+        # Streaming relies on rdflib's private Result._genbindings. If an rdflib
+        # upgrade removes or renames it, this fails instead of queries quietly
+        # buffering every row again.
+        results = graph._run("SELECT ?s ?p ?o WHERE { ?s ?p ?o }")
+        assert results._genbindings is not None
+        rows = _result_rows(results)
+        for _ in range(5):
+            next(rows)
+        assert results._bindings == []
+
+    def test_rows_without_private_generator(self, graph):
+        # Stands in for a future rdflib Result without _genbindings: only the
+        # public vars, type and iteration. Rows must come out the same.
+        class PublicResult:
+            type = "SELECT"
+
+            def __init__(self, result):
+                self.vars = result.vars
+                self._rows = list(result)
+
+            def __iter__(self):
+                return iter(self._rows)
+
+        sparql = "SELECT ?id WHERE { ?s a acf:Dimension ; acf:id ?id . }"
+        expected = list(_result_rows(graph._run(sparql)))
+        assert len(expected) == 12
+        assert list(_result_rows(PublicResult(graph._run(sparql)))) == expected
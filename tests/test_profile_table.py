@@ -0,0 +1,87 @@
+"""Tests for acf.scoring.table — vectorized aggregate and certification over many profiles."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from acf.scoring.profile import (
+    DIMENSION_WEIGHTS,
+    MODULAR_CAPABILITY_DIMS,
+    ACFDimensionScore,
+    ACFProfile,
+)
+from acf.scoring.table import DIMENSIONS, ProfileTable
+
+np = pytest.importorskip("numpy")
+
+
+def _profile(system_id: str, scores: dict[str, float]) -> ACFProfile:
+    profile = ACFProfile(system_id=system_id, system_type="hybrid", version="1.0")
+    for name, score in scores.items():
+        profile.dimensions[name] = ACFDimensionScore(name, score, "")
+    return profile
+
+
+def _random_profiles(n: int, seed: int = 7) -> list[ACFProfile]:
+    rng = random.Random(seed)
+    profiles = []
+    for i in range(n):
+        scores = {}
+        for dim in DIMENSION_WEIGHTS:
+            # Drop some dimensions, modular ones more often, to exercise N/A gating.
+            if rng.random() < (0.5 if dim in MODULAR_CAPABILITY_DIMS else 0.05):
+                continue
+            scores[dim] = rng.choice([rng.uniform(0, 100), 15, 30, 50, 60, 70, 75, 80, 85, 90, 95])
+        profiles.append(_profile(f"sys-{i}", scores))
+    return profiles
+
+
+class TestProfileTable:
+    def test_matches_profiles(self):
+        profiles = _random_profiles(500)
+        table = ProfileTable.from_profiles(profiles)
+        assert len(table) == 500
+        assert list(table.certification_levels) == [p.certification_level for p in profiles]
+        assert table.aggregate_scores.tolist() == [p.aggregate_score for p in profiles]
+        assert table.certification_labels == [p.certification_label for p in profiles]
+        levels = {str(level) for level in table.certification_levels}
+        assert len(levels) > 2  # the sweep actually spans several levels
+
+    def test_edge_rows(self):
+        profiles = [
+            _profile("empty", {}),
+            _profile("unknown-only", {"made_up": 40.0, "other": 60.0}),
+            _profile("all-95-no-modules", {d: 95.0 for d in DIMENSION_WEIGHTS if d not in MODULAR_CAPABILITY_DIMS}),
+            _profile("weak-containment", {**{d: 95.0 for d in DIMENSION_WEIGHTS}, "safety_containment": 10.0}),
+            _profile("missing-core", {"depth": 99.0}),
+        ]
+        table = ProfileTable.from_profiles(profiles)
+        assert table.aggregate_scores.tolist() == [p.aggregate_score for p in profiles]
+        assert list(table.certification_levels) == [p.certification_level for p in profiles]
+        assert table.aggregate_scores[1] == 50.0
+        assert table.certification_levels[2] == "ACF-6"
+
+    def test_column_masks_na(self):
+        table = ProfileTable.from_profiles([
+            _profile("a", {"depth": 40.0}), _profile("b", {"depth": 60.0, "safety_containment": 80.0}),
+        ])
+        containment = table.column("safety_containment")
+        assert containment.mask.tolist() == [True, False]
+        assert table.column("depth").mean() == 50.0
+
+    def test_to_records_matches_to_dict(self):
+        profiles = _random_profiles(20, seed=3)
+        for record, profile in zip(ProfileTable.from_profiles(profiles).to_records(), profiles):
+            expected = profile.to_dict()
+            assert record == {k: expected[k] for k in record}
+
+    def test_from_arrays(self):
+        n = 3
+        scores = np.full((n, len(DIMENSIONS)), 72.0)
+        present = np.ones((n, len(DIMENSIONS)), dtype=bool)
+        table = ProfileTable(["a", "b", "c"], ["1", "1", "1"], scores, present)
+        assert table.aggregate_scores == pytest.approx([72.0] * 3)
+        with pytest.raises(ValueError):
+            ProfileTable(["a"], ["1", "2"], scores[:1], present[:1])
@@ -0,0 +1,215 @@
+"""Tests for acf.execution.response_cache — content-addressed runner response cache."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from acf.batteries import load_battery
+from acf.cli import main
+from acf.execution.async_engine import AsyncBatteryEngine
+from acf.execution.engine import BatteryEngine
+from acf.execution.response_cache import ResponseCache, item_hash
+from tests.runners import AsyncCountingRunner, CountingRunner
+
+
+class Client:
+    """Stands in for an SDK client: private state that differs on every run."""
+
+    def __init__(self):
+        self.session_id = os.urandom(8).hex()
+
+
+@dataclass
+class RunnerConfig:
+    model: str
+    prompts: Path
+    client: Client = field(default_factory=Client, compare=False)
+    stops: frozenset = frozenset({"\n", "END"})
+
+
+class PlainConfig:
+    def __init__(self, model):
+        self.model = model
+        self.client = Client()
+
+    def cache_key(self):
+        return {"model": self.model}
+
+
+class ConfiguredRunner:
+    def __init__(self):
+        self.config = RunnerConfig("m-7b", Path("prompts/v2"))
+
+    def run_item(self, item):
+        return {"id": item["id"], "response_text": ""}
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    return tmp_path / "responses"
+
+
+def _cache(cache_dir, version="1.0", config=None, **kwargs):
+    return ResponseCache("sys", version, runner_config=config, directory=cache_dir, **kwargs)
+
+
+class TestResponseCache:
+    def test_round_trip(self, cache_dir):
+        cache = _cache(cache_dir)
+        item = load_battery("fr36")[0]
+        assert cache.get(item) is None
+        cache.put(item, {"response_text": "yes"})
+        assert _cache(cache_dir).get(item) == {"response_text": "yes"}
+        assert (cache.hits, cache.misses) == (0, 1)
+
+    def test_item_hash_ignores_key_order(self):
+        assert item_hash({"id": "a", "question": "q"}) == item_hash({"question": "q", "id": "a"})
+        assert item_hash({"id": "a", "question": "q"}) != item_hash({"id": "a", "question": "q2"})
+
+    def test_key_scope(self, cache_dir):
+        item = {"id": "a", "question": "q"}
+        _cache(cache_dir).put(item, {"r": 1})
+        assert _cache(cache_dir, version="2.0").get(item) is None
+        assert _cache(cache_dir, config={"temperature": 0.7}).get(item) is None
+        assert _cache(cache_dir).get({"id": "a", "question": "edited"}) is None
+        assert _cache(cache_dir).get(dict(item)) == {"r": 1}
+
+    def test_non_json_config(self, cache_dir):
+        item = {"id": "a", "question": "q"}
+        _cache(cache_dir, config=RunnerConfig("m-7b", Path("prompts/v2"))).put(item, {"r": 1})
+        # A fresh client object in a fresh config still maps to the same key.
+        assert _cache(cache_dir, config=RunnerConfig("m-7b", Path("prompts/v2"))).get(item) == {"r": 1}
+        assert _cache(cache_dir, config=RunnerConfig("m-7b", Path("prompts/v3"))).get(item) is None
+
+    def test_config_keyed_by_cache_key(self, cache_dir):
+        item = {"id": "a", "question": "q"}
+        _cache(cache_dir, config=PlainConfig("gpt-a")).put(item, {"r": 1})
+        # The client's session id is not part of the key; the model is.
+        assert _cache(cache_dir, config=PlainConfig("gpt-a")).get(item) == {"r": 1}
+        assert _cache(cache_dir, config=PlainConfig("gpt-b")).get(item) is None
+
+    def test_undeclared_config_raises(self, cache_dir):
+        with pytest.raises(TypeError, match="cache_key"):
+            _cache(cache_dir, config={"client": Client()})
+        with pytest.raises(TypeError, match="cache_key"):
+            _cache(cache_dir, config={"lock": threading.Lock()})
+
+    def test_lru_eviction(self, cache_dir):
+        cache = _cache(cache_dir, max_entries=10)
+        items = [{"id": f"i{n}"} for n in range(10)]
+        for n, item in enumerate(items):
+            cache.put(item, {"n": n})
+            os.utime(cache._path(cache.key(item)), (1000 + n, 1000 + n))
+        assert cache.get(items[0]) == {"n": 0}  # now the most recently used
+        cache.put({"id": "new"}, {"n": 10})  # 11 entries: evict down to 9
+        assert len(cache) == 9
+        assert cache.get(items[0]) == {"n": 0}
+        assert cache.get(items[1]) is None and cache.get(items[2]) is None
+        assert cache.get({"id": "new"}) == {"n": 10}
+
+    def test_size_eviction(self, cache_dir):
+        cache = _cache(cache_dir, max_bytes=4096)
+        for n in range(100):
+            cache.put({"id": f"i{n}"}, {"text": "x" * 100})
+        used = sum(p.stat().st_size for p in cache_dir.glob("*/*.json"))
+        assert 0 < used <= 4096
+        assert cache.get({"id": "i99"}) is not None
+
+    def test_disabled_without_cache_root(self, monkeypatch):
+        monkeypatch.setenv("ACF_CACHE_DIR", "")
+        cache = ResponseCache("sys", "1.0")
+        assert not cache.enabled
+        cache.put({"id": "a"}, {"r": 1})
+        assert cache.get({"id": "a"}) is None
+
+    def test_corrupt_entry_is_a_miss(self, cache_dir):
+        cache = _cache(cache_dir)
+        item = {"id": "a"}
+        cache.put(item, {"r": 1})
+        cache._path(cache.key(item)).write_text('{"response": ')
+        assert cache.get(item) is None
+
+
+class TestEngineCache:
+    def test_second_run_hits_the_cache(self, cache_dir):
+        items = load_battery("fr36")
+        first = CountingRunner()
+        BatteryEngine(first, workers=2, cache=_cache(cache_dir)).run(items)
+        assert len(first.calls) == len(items)
+
+        second = CountingRunner()
+        engine = BatteryEngine(second, workers=2, cache=_cache(cache_dir))
+        results = engine.run(items)
+        assert second.calls == []
+        assert engine.stats.cached == len(items)
+        assert all(r.cached and r.ok for r in results)
+        assert [r.item_id for r in results] == [item["id"] for item in items]
+        assert results[3].response == {"id": items[3]["id"], "response_text": items[3]["id"].upper()}
+
+    def test_only_changed_items_run(self, cache_dir):
+        items = load_battery("zorblaxia")
+        BatteryEngine(CountingRunner(), cache=_cache(cache_dir)).run(items)
+        changed = [dict(item) for item in items]
+        changed[4]["question"] = "A reworded question?"
+        runner = CountingRunner()
+        BatteryEngine(runner, cache=_cache(cache_dir)).run(changed)
+        assert runner.calls == [items[4]["id"]]
+
+    def test_failures_are_not_cached(self, cache_dir):
+        class Failing:
+            def run_item(self, item):
+                raise RuntimeError("nope")
+
+        items = load_battery("cg100")[:3]
+        BatteryEngine(Failing(), cache=_cache(cache_dir)).run(items)
+        assert len(_cache(cache_dir)) == 0
+
+    def test_async_engine(self, cache_dir):
+        items = load_battery("cg100")[:20]
+        BatteryEngine(CountingRunner(), cache=_cache(cache_dir)).run(items[:10])
+        runner = AsyncCountingRunner()
+        engine = AsyncBatteryEngine(runner, concurrency=4, cache=_cache(cache_dir))
+        results = asyncio.run(engine.run(items))
+        assert runner.calls == [item["id"] for item in items[10:]]
+        assert engine.stats.cached == 10
+        assert [r.cached for r in results] == [True] * 10 + [False] * 10
+
+
+class TestBatteriesRunCache:
+    def test_cli_cache(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("ACF_CACHE_DIR", str(tmp_path / "cache"))
+        args = [
+            "batteries", "run", "zorblaxia", "--runner", "tests.test_engine:EchoRunnerAnyId",
+            "--cache", "--system", "sys", "--system-version", "1.0", "--json-output",
+        ]
+        runner = CliRunner()
+        first = json.loads(runner.invoke(main, args).output)
+        second = json.loads(runner.invoke(main, args).output)
+        assert (first["cached"], second["cached"]) == (0, 10)
+        assert second["failed"] == 0
+
+    def test_cli_cache_with_non_json_runner_config(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("ACF_CACHE_DIR", str(tmp_path / "cache"))
+        args = [
+            "batteries", "run", "zorblaxia", "--runner", "tests.test_response_cache:ConfiguredRunner",
+            "--cache", "--system", "sys", "--system-version", "1.0", "--json-output",
+        ]
+        first = CliRunner().invoke(main, args)
+        assert first.exit_code == 0, first.output
+        second = CliRunner().invoke(main, args)
+        assert json.loads(second.output)["cached"] == 10
+
+    def test_cli_requires_key(self):
+        result = CliRunner().invoke(main, [
+            "batteries", "run", "fr36", "--runner", "tests.test_engine:EchoRunnerAnyId", "--cache",
+        ])
+        assert result.exit_code != 0
+        assert "--system" in result.output
@@ -338,3 +338,104 @@ class TestRoundtripSerialization:
         d = profile.to_dict()
         restored = ACFProfile.from_dict(d)
         assert abs(restored.dimensions["action_capability"].score - 61.2) < 0.1
+
+
+class TestDerivedValueCache:
+    def _profile(self, score=80.0):
+        profile = ACFProfile(system_id="test", system_type="llm", version="1.0")
+        for dim in V11_WEIGHTS:
+            profile.dimensions[dim] = ACFDimensionScore(dimension=dim, score=score, sub_level="X")
+        return profile
+
+    def test_cached_between_reads(self, monkeypatch):
+        profile = self._profile()
+        level, aggregate = profile.certification_level, profile.aggregate_score
+
+        def fail():
+            raise AssertionError("recomputed without a change")
+
+        monkeypatch.setattr(profile, "_certification_level", fail)
+        monkeypatch.setattr(profile, "_aggregate_score", fail)
+        assert profile.certification_level == level
+        assert profile.certification_label == CERTIFICATION_LABELS[level]
+        assert profile.to_dict()["aggregate_score"] == round(aggregate, 1)
+
+    def test_invalidated_by_mapping_mutation(self):
+        profile = self._profile()
+        assert profile.certification_level == "ACF-5"
+        del profile.dimensions["action_capability"]
+        assert profile.certification_level == "ACF-0"
+        profile.dimensions["action_capability"] = ACFDimensionScore("action_capability", 80.0, "X")
+        assert profile.certification_level == "ACF-5"
+        profile.dimensions.update(breadth=ACFDimensionScore("breadth", 50.0, "X"))
+        assert profile.certification_level == "ACF-2"
+        profile.dimensions.pop("breadth")
+        assert profile.certification_level == "ACF-0"
+        profile.dimensions.clear()
+        assert (profile.aggregate_score, profile.certification_level) == (0.0, "ACF-0")
+
+    def test_invalidated_by_score_edit(self):
+        profile = self._profile()
+        before = profile.aggregate_score
+        profile.dimensions["breadth"].score = 50.0
+        assert profile.certification_level == "ACF-2"
+        assert profile.aggregate_score == pytest.approx(before - 30 * V11_WEIGHTS["breadth"])
+
+    def test_shared_score_invalidates_every_profile(self):
+        first, second = self._profile(), ACFProfile("other", "llm", "1.0")
+        second.dimensions.update(first.dimensions)
+        assert (first.certification_level, second.certification_level) == ("ACF-5", "ACF-5")
+        first.dimensions["depth"].score = 10.0
+        assert (first.certification_level, second.certification_level) == ("ACF-0", "ACF-0")
+
+    def test_replacing_dimensions(self):
+        profile = self._profile()
+        assert profile.certification_level == "ACF-5"
+        profile.dimensions = {"depth": ACFDimensionScore("depth", 99.0, "L6")}
+        assert profile.certification_level == "ACF-0"
+        assert profile.aggregate_score == pytest.approx(99.0 * V11_WEIGHTS["depth"])
+        profile.dimensions["depth"].score = 50.0
+        assert profile.aggregate_score == pytest.approx(50.0 * V11_WEIGHTS["depth"])
+
+    def test_callers_dict_is_kept(self):
+        mine: dict[str, ACFDimensionScore] = {}
+        profile = ACFProfile("test", "llm", "1.0", dimensions=mine)
+        assert profile.aggregate_score == 0.0
+        mine["depth"] = ACFDimensionScore("depth", 99.0, "L6")  # filled after construction
+        assert profile.dimensions is mine
+        assert profile.aggregate_score == pytest.approx(99.0 * V11_WEIGHTS["depth"])
+
+    def test_aggregate_sums_in_insertion_order(self):
+        scores = {"gba": 0.1, "depth": 0.7, "breadth": 0.3}
+        profile = ACFProfile("test", "llm", "1.0", dimensions={
+            name: ACFDimensionScore(name, score, "X") for name, score in scores.items()
+        })
+        expected = 0.0
+        for name, score in scores.items():
+            expected += score * V11_WEIGHTS[name]
+        assert profile.aggregate_score == expected
+
+    def test_copies_stay_independent(self):
+        import copy
+        import pickle
+
+        profile = self._profile()
+        assert profile.certification_level == "ACF-5"
+        for clone in (copy.deepcopy(profile), pickle.loads(pickle.dumps(profile))):
+            assert clone == profile and clone.certification_level == "ACF-5"
+            clone.dimensions["gba"].score = 0.0
+            assert clone.certification_level == "ACF-0"
+            assert profile.certification_level == "ACF-5"
+
+    def test_asdict_round_trip(self):
+        from dataclasses import asdict
+
+        profile = self._profile()
+        as_dict = asdict(profile)
+        assert as_dict["dimensions"]["gba"] == asdict(profile.dimensions["gba"])
+        rebuilt = ACFProfile(
+            as_dict["system_id"], as_dict["system_type"], as_dict["version"],
+            dimensions={k: ACFDimensionScore(**v) for k, v in as_dict["dimensions"].items()},
+        )
+        assert rebuilt == profile
+        assert rebuilt.certification_level == profile.certification_level
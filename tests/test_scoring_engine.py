@@ -0,0 +1,266 @@
+"""Tests for acf.scoring.engine — single-pass streaming scoring."""
+
+from __future__ import annotations
+
+import json
+import random
+import tracemalloc
+from datetime import datetime, timezone
+
+import pytest
+from click.testing import CliRunner
+
+from acf.cli import main
+from acf.data.loader import iter_records
+from acf.graph import ACFGraph, SubLevel
+from acf.scoring.engine import ScoringEngine
+from acf.scoring.sublevels import SubLevelTable
+
+MEASURES = {"M-001": ["depth"], "M-002": ["depth", "breadth"], "M-003": ["breadth"]}
+SUB_LEVELS = SubLevelTable.from_sub_levels([
+    SubLevel("L1", "depth", 1, "", "0-40"), SubLevel("L2", "depth", 2, "", "40–100"),
+    SubLevel("B1", "breadth", 1, "", "10-100"),
+])
+
+
+def _engine(system_id=None):
+    return ScoringEngine(MEASURES, SUB_LEVELS, system_id=system_id)
+
+
+def _run(system, measure, value, passed=True, version="1.0", **extra):
+    return {
+        "record_type": "experiment-run", "system_id": system, "measure_id": measure,
+        "value": value, "pass": passed, "system_version": version, **extra,
+    }
+
+
+class TestScoringEngine:
+    def test_profile(self):
+        engine = _engine()
+        assert engine.consume([
+            _run("a", "M-001", 0.3),
+            _run("a", "M-002", 70.0, passed=False),
+            _run("a", "M-003", 150.0),
+            _run("a", "M-404", 1.0),
+            {"record_type": "per-query-record", "system_id": "a"},
+            "not a record",
+        ]) == 4
+        result = engine.score()
+        assert result is not None and result.n_records == 4
+        dims = result.profile.dimensions
+        assert (dims["depth"].score, dims["depth"].sub_level) == (50.0, "L2")
+        assert dims["depth"].evidence == "1/2 measures passed, avg=50.0"
+        assert (dims["breadth"].score, dims["breadth"].confidence) == (85.0, "estimated")
+        assert result.unmapped == ["M-404"]
+        assert result.profile.version == "1.0"
+
+    def test_undated_tie_keeps_first_record(self):
+        engine = _engine()
+        engine.consume([_run("a", "M-001", 0.2, version="1"), _run("a", "M-001", 0.9, version="2")])
+        result = engine.score()
+        assert result is not None
+        assert result.profile.dimensions["depth"].score == 20.0
+        assert result.profile.version == "1"
+
+    def test_primary_system_and_filter(self):
+        records = [_run("a", "M-001", 0.5), _run("b", "M-001", 0.7), _run("b", "M-003", 0.7),
+                   {**_run("", "M-003", 0.1), "system_id": None, "being": "legacy"}]
+        engine = _engine()
+        engine.consume(records)
+        assert engine.record_counts == {"a": 1, "b": 2, "legacy": 1}
+        assert engine.primary_system() == "b"
+        assert engine.score("a").profile.system_id == "a"
+        assert engine.score("nobody") is None
+
+        only_a = _engine(system_id="a")
+        assert only_a.consume(records) == 1
+        assert only_a.score().profile.system_id == "a"
+
+    def test_state_is_bounded_by_measures(self):
+        def stream(n):
+            for i in range(n):
+                yield _run(f"s{i % 3}", f"M-00{i % 3 + 1}", (i % 100) / 100)
+
+        engine = _engine()
+        tracemalloc.start()
+        engine.consume(stream(200_000))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        assert engine.record_counts == {"s0": 66_667, "s1": 66_667, "s2": 66_666}
+        assert sum(len(s.measures) for s in engine.states.values()) == 3
+        assert peak < 1 << 20  # 200k records never resident at once
+
+    def test_consume_path(self, tmp_path):
+        (tmp_path / "one.json").write_text(json.dumps(_run("a", "M-001", 0.4)))
+        (tmp_path / "shard.jsonl").write_text(
+            json.dumps(_run("a", "M-003", 0.6)) + "\n" + '{"torn'
+        )
+        engine = _engine()
+        assert engine.consume_path(tmp_path) == 2
+        assert set(engine.score().profile.dimensions) == {"depth", "breadth"}
+
+    def test_from_graph(self):
+        graph = ACFGraph()
+        measure = graph.measures()[0]
+        engine = ScoringEngine.from_graph(graph)
+        engine.add(_run("a", measure.id, 0.9))
+        assert set(engine.score().profile.dimensions) == set(measure.dimensions)
+
+
+VERSIONED = (
+    _run("a", "M-001", 0.2, version="1"), _run("b", "M-001", 0.5, version="1"),
+    _run("a", "M-001", 0.8, version="2"), _run("a", "M-003", 0.4, version="1"),
+)
+
+
+class TestByVersion:
+    def test_partitions(self):
+        engine = _engine()
+        engine.by_version = True
+        engine.consume(VERSIONED)
+        results = list(engine.score_all())
+        assert [(r.profile.system_id, r.profile.version, r.n_records) for r in results] == [
+            ("a", "1", 2), ("b", "1", 1), ("a", "2", 1),
+        ]
+        assert results[2].profile.dimensions["depth"].score == 80.0
+        assert engine.record_counts == {"a": 3, "b": 1}
+        assert engine.score("a").profile.version == "1"
+        assert engine.score("a", "2").profile.dimensions["depth"].score == 80.0
+        assert engine.score("a", "9") is None
+
+    def test_default_merges_versions(self):
+        engine = _engine()
+        engine.consume(VERSIONED)
+        assert [r.profile.system_id for r in engine.score_all()] == ["a", "b"]
+
+
+def _at(day, hour=12):
+    return f"2026-03-{day:02d}T{hour:02d}:00:00Z"
+
+
+DATED = (
+    _run("a", "M-001", 0.2, version="1", timestamp=_at(1)),
+    _run("a", "M-001", 0.9, version="2", timestamp=_at(3)),
+    _run("a", "M-001", 0.5, version="1", timestamp="2026-03-02T12:00:00+05:00"),
+    _run("a", "M-001", 0.1, version="0"),  # undated: never beats a dated record
+    _run("a", "M-003", 0.4, version="1", timestamp=_at(2)),
+)
+
+
+def _utc(day):
+    return datetime(2026, 3, day, tzinfo=timezone.utc)
+
+
+class TestLatestWins:
+    def test_latest_timestamp_wins_in_any_order(self):
+        rng = random.Random(5)
+        for _ in range(20):
+            records = list(DATED)
+            rng.shuffle(records)
+            engine = _engine()
+            engine.consume(records)
+            result = engine.score()
+            assert result.profile.dimensions["depth"].score == 90.0
+            assert result.profile.version == "2"
+            assert result.n_records == 5
+
+    def test_window(self):
+        engine = ScoringEngine(MEASURES, SUB_LEVELS, since=_utc(1), until=_utc(3))
+        assert engine.consume(DATED) == 3  # day 3 is excluded, the undated record dropped
+        result = engine.score()
+        assert result.profile.dimensions["depth"].score == 50.0
+        assert result.profile.dimensions["breadth"].score == 40.0
+
+    def test_out_of_window_shards_are_not_read(self, tmp_path, monkeypatch):
+        for day in (1, 2, 3):
+            (tmp_path / f"runs-2026-03-0{day}.jsonl").write_text(
+                json.dumps(_run("a", "M-001", day / 10, timestamp=_at(day))) + "\n"
+            )
+        (tmp_path / "undated.json").write_text(json.dumps(_run("a", "M-003", 0.4, timestamp=_at(2))))
+        opened = []
+        monkeypatch.setattr("acf.scoring.engine.iter_records", lambda p: opened.append(p.name) or iter_records(p))
+        engine = ScoringEngine(MEASURES, SUB_LEVELS, since=_utc(2), until=_utc(3))
+        assert engine.consume_path(tmp_path) == 2
+        assert sorted(opened) == ["runs-2026-03-02.jsonl", "undated.json"]
+        assert engine.score().profile.dimensions["depth"].score == 20.0
+
+
+class TestScoreWindowCommand:
+    def test_since_until(self, tmp_path):
+        measure = ACFGraph().measures()[0].id
+        (tmp_path / "runs.jsonl").write_text("".join(
+            json.dumps(_run("a", measure, value, version=v, timestamp=_at(day))) + "\n"
+            for value, v, day in [(0.9, "3", 3), (0.2, "1", 1), (0.5, "2", 2)]
+        ))
+
+        def version(*args):
+            result = CliRunner().invoke(main, ["score", str(tmp_path), "--json-output", *args])
+            assert result.exit_code == 0, result.output
+            return json.loads(result.output)["version"]
+
+        assert version() == "3"
+        assert version("--until", "2026-03-03") == "2"
+        assert version("--since", "2026-03-01", "--until", "2026-03-02T00:00:00+00:00") == "1"
+        bad = CliRunner().invoke(main, ["score", str(tmp_path), "--since", "yesterday"])
+        assert bad.exit_code != 0
+        empty = CliRunner().invoke(main, ["score", str(tmp_path), "--since", "2026-03-03", "--until", "2026-03-01"])
+        assert empty.exit_code != 0
+
+
+class TestScoreAllSystemsCommand:
+    def _data(self, tmp_path):
+        measure = ACFGraph().measures()[0].id
+        tmp_path.mkdir()
+        shard = tmp_path / "runs.jsonl"
+        shard.write_text("".join(json.dumps(_run(s, measure, 0.5, version=v)) + "\n" for s, v in [
+            ("zeta", "1"), ("alpha", "2"), ("alpha", "1"), ("zeta", "1"),
+        ]))
+        return tmp_path
+
+    def test_json_and_jsonl(self, tmp_path):
+        data = self._data(tmp_path / "data")
+        out = tmp_path / "profiles.jsonl"
+        result = CliRunner().invoke(main, [
+            "score", str(data), "--all-systems", "--json-output", "--jsonl", str(out),
+        ])
+        assert result.exit_code == 0, result.output
+        profiles = json.loads(result.output)
+        assert [(p["system_id"], p["version"]) for p in profiles] == [
+            ("alpha", "1"), ("alpha", "2"), ("zeta", "1"),
+        ]
+        lines = out.read_text().splitlines()
+        assert [json.loads(line) for line in lines] == profiles
+
+    def test_table_and_conflicts(self, tmp_path):
+        data = self._data(tmp_path / "data")
+        result = CliRunner().invoke(main, ["score", str(data), "--all-systems"])
+        assert result.exit_code == 0 and "3 system versions" in result.output
+        conflict = CliRunner().invoke(main, ["score", str(data), "--all-systems", "-s", "zeta"])
+        assert conflict.exit_code != 0
+
+
+class TestIterRecords:
+    def test_shard_is_read_lazily(self, tmp_path):
+        shard = tmp_path / "s.jsonl"
+        shard.write_text("".join(json.dumps({"n": i}) + "\n" for i in range(3)))
+        records = iter_records(shard)
+        assert next(records) == ("s-1", {"n": 0})
+        with shard.open("a") as f:  # appended after iteration began
+            f.write(json.dumps({"n": 3}) + "\n")
+        assert [r for _, r in records] == [{"n": 1}, {"n": 2}, {"n": 3}]
+
+    @pytest.mark.parametrize("content", ["{not json", ""])
+    def test_bad_json_file(self, tmp_path, content):
+        path = tmp_path / "bad.json"
+        path.write_text(content)
+        assert list(iter_records(path)) == []
+
+
+class TestScoreCommandErrors:
+    def test_no_profile_is_a_click_error(self, tmp_path, monkeypatch):
+        measure = ACFGraph().measures()[0].id
+        (tmp_path / "run.json").write_text(json.dumps(_run("a", measure, 0.5)))
+        monkeypatch.setattr(ScoringEngine, "score", lambda self, *a, **k: None)
+        result = CliRunner().invoke(main, ["score", str(tmp_path)])
+        assert result.exit_code == 1
+        assert "no experiment-run records to score" in result.output
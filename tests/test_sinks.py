@@ -0,0 +1,97 @@
+"""Tests for acf.measures.sinks — where collected records are written."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from acf.data.loader import load_data_files, read_records
+from acf.measures.collector import record_experiment_run
+from acf.measures.sinks import JsonFileSink, JsonlSink, RecordSink
+
+
+def _record(i: int, day: int = 15) -> dict:
+    return {
+        "record_type": "experiment-run",
+        "measure_id": "M-001",
+        "system_id": "sys",
+        "experiment_id": "EXP-1",
+        "timestamp": f"2026-01-{day:02d}T23:59:{i % 60:02d}+00:00",
+        "value": float(i),
+    }
+
+
+class TestJsonlSink:
+    """Buffered, date-rotated JSONL shards."""
+
+    def test_satisfies_protocol(self, tmp_path):
+        assert isinstance(JsonlSink(tmp_path), RecordSink)
+        assert isinstance(JsonFileSink(tmp_path), RecordSink)
+
+    def test_buffers_until_threshold(self, tmp_path):
+        sink = JsonlSink(tmp_path, max_records=3, max_age=3600)
+        sink.write(_record(0))
+        sink.write(_record(1))
+        assert list(tmp_path.iterdir()) == []
+        sink.write(_record(2))
+        (shard,) = tmp_path.iterdir()
+        assert shard.name == "records-2026-01-15.jsonl"
+        assert len(shard.read_text().splitlines()) == 3
+
+    def test_byte_and_age_thresholds(self, tmp_path):
+        by_size = JsonlSink(tmp_path / "a", max_bytes=1, max_age=3600)
+        by_size.write(_record(0))
+        assert (tmp_path / "a").exists()
+        by_age = JsonlSink(tmp_path / "b", max_age=0.0)
+        by_age.write(_record(0))
+        assert (tmp_path / "b").exists()
+
+    def test_rotates_by_record_date(self, tmp_path):
+        with JsonlSink(tmp_path, prefix="runs") as sink:
+            sink.write(_record(0, day=15))
+            sink.write(_record(1, day=16))
+            sink.write(_record(2, day=15))
+        shards = sorted(p.name for p in tmp_path.iterdir())
+        assert shards == ["runs-2026-01-15.jsonl", "runs-2026-01-16.jsonl"]
+        assert len(read_records(tmp_path / shards[0])) == 2
+
+    def test_close_flushes_and_rejects_writes(self, tmp_path):
+        sink = JsonlSink(tmp_path)
+        sink.write(_record(0))
+        sink.close()
+        assert len(load_data_files(tmp_path)) == 1
+        with pytest.raises(ValueError, match="closed"):
+            sink.write(_record(1))
+
+    def test_torn_line_is_isolated(self, tmp_path):
+        """A crash mid-append leaves a torn line; later appends and reads survive it."""
+        shard = tmp_path / "records-2026-01-15.jsonl"
+        good = json.dumps(_record(0))
+        shard.write_text(good + "\n" + good[: len(good) // 2])
+
+        with JsonlSink(tmp_path) as sink:
+            sink.write(_record(1))
+
+        records = read_records(shard)
+        assert [r["value"] for _, r in records] == [0.0, 1.0]
+        assert [rid for rid, _ in records] == [
+            "records-2026-01-15-1", "records-2026-01-15-3",
+        ]
+
+
+class TestCollectorSink:
+    """record_experiment_run routes records through a sink."""
+
+    def test_jsonl_sink(self, tmp_path):
+        with JsonlSink(tmp_path) as sink:
+            for i in range(5):
+                record_experiment_run("M-1", "E", "sys", "1.0", float(i), 0.5, sink=sink)
+        records = load_data_files(tmp_path)
+        assert [r["value"] for r in records] == [0.0, 1.0, 2.0, 3.0, 4.0]
+        assert all(p.suffix == ".jsonl" for p in tmp_path.iterdir())
+
+    def test_data_dir_and_sink_are_exclusive(self, tmp_path):
+        with pytest.raises(ValueError, match="not both"):
+            record_experiment_run("M-1", "E", "sys", "1.0", 1.0, 0.5,
+                                  data_dir=tmp_path, sink=JsonlSink(tmp_path))
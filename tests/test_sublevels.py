@@ -0,0 +1,66 @@
+"""Tests for acf.scoring.sublevels — compiled score → sub-level lookup."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from acf.graph import ACFGraph, SubLevel
+from acf.scoring.sublevels import SubLevelRanges, SubLevelTable, range_lower_bound
+
+
+def _linear(sub_levels, score):
+    """The rule acf score used before compilation: scan from the last sub-level back."""
+    for sl in reversed(sub_levels):
+        if sl.score_range:
+            parts = sl.score_range.replace("–", "-").split("-")
+            try:
+                if score >= float(parts[0].strip()):
+                    return sl.id
+            except (ValueError, IndexError):
+                continue
+    return sub_levels[0].id if sub_levels else "?"
+
+
+def _sub(i, score_range, dim="d"):
+    return SubLevel(f"S{i}", dim, i, "", score_range)
+
+
+class TestRangeLowerBound:
+    @pytest.mark.parametrize(("text", "expected"), [
+        ("40-59", 40.0), ("40–59", 40.0), (" 7.5 - 10", 7.5), ("90", 90.0),
+        ("", None), ("-5", None), ("90+", None), ("n/a", None),
+    ])
+    def test_parse(self, text, expected):
+        assert range_lower_bound(text) == expected
+
+
+class TestSubLevelTable:
+    def test_matches_linear_rule_on_knowledge_graph(self):
+        graph = ACFGraph()
+        table = SubLevelTable.from_graph(graph)
+        dims = {sl.dimension_id for sl in graph.sub_levels()}
+        assert dims and set(table.ranges) == dims
+        for dim in dims:
+            subs = graph.sub_levels(dim)
+            for tenth in range(-10, 1011):
+                assert table.lookup(dim, tenth / 10) == _linear(subs, tenth / 10), (dim, tenth)
+
+    def test_matches_linear_rule_on_messy_ranges(self):
+        rng = random.Random(11)
+        pool = ["0-20", "20–40", "40-60", "60-80", "80-100", "50-70", "40-45", "", "junk", "-3", "20-30"]
+        for _ in range(300):
+            subs = [_sub(i, rng.choice(pool)) for i in range(rng.randint(0, 6))]
+            ranges = SubLevelRanges.compile("d", subs)
+            assert list(ranges.bounds) == sorted(set(ranges.bounds))
+            for score in [rng.uniform(-10, 110) for _ in range(30)] + [0, 20, 40, 60, 100]:
+                assert ranges.lookup(score) == _linear(subs, score), (subs, score)
+
+    def test_fallbacks(self):
+        table = SubLevelTable.from_sub_levels([_sub(1, "10-50"), _sub(2, "50-100")])
+        assert table.lookup("d", 5.0) == "S1"
+        assert table.lookup("d", float("nan")) == "S1"
+        assert table.lookup("d", 50.0) == "S2"
+        assert table.lookup("other", 50.0) == "?"
+        assert SubLevelRanges.compile("empty", []).lookup(50.0) == "?"